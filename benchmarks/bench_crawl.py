@@ -0,0 +1,282 @@
+"""End-to-end crawl benchmark against a local fixture web server.
+
+Serves a generated corpus of company sites on localhost, crawls every site
+with `LeadScraper.scrape_website`, then runs the clean/filter/analyze
+pipeline. Each site has its own host name, resolved to the server through
+the scraper's DNS cache, so breakers, robots.txt and politeness apply per
+site as they would on the web. Reports pages/sec, leads/sec, per-page
+latency percentiles, failed and skipped pages, and peak memory. Results are written as JSON tagged with the current commit so
+runs can be compared across commits.
+
+Usage:
+    python benchmarks/bench_crawl.py --output bench.json
+    python benchmarks/bench_crawl.py --compare bench.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from fixture_server import Corpus, FixtureServer  # noqa: E402
+from resolver import DNSCache  # noqa: E402
+from scraper import LeadScraper  # noqa: E402
+
+
+def percentile(values, fraction):
+    """Return the value at the given fraction (0-1) of the sorted values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def git_revision():
+    """Return the current commit hash, or None outside a git checkout."""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def make_scraper(resolve_func=None):
+    """
+    Create a scraper configured for benchmarking (no politeness delay).
+
+    Args:
+        resolve_func (callable): Host resolver for the scraper's DNS cache, such
+            as `FixtureServer.resolve` (the scraper has no DNS cache if None)
+    """
+    resolver = DNSCache(resolve_func=resolve_func) if resolve_func is not None else None
+    scraper = LeadScraper(respect_robots_txt=True, fast_start=True, resolver=resolver)
+    scraper.rate_limit = 0
+    return scraper
+
+
+def instrument(scraper):
+    """
+    Record the time spent on each page (fetch plus processing), and count
+    the pages that failed or were skipped.
+
+    Returns:
+        tuple: (dict of URL to accumulated seconds, dict with 'errors' and
+            'skipped' counts), both filled in as pages are scraped
+    """
+    page_times = {}
+    outcomes = {'errors': 0, 'skipped': 0}
+    fetch = scraper.fetch_policy.fetch
+    process_page = scraper._process_page
+    scrape_page = scraper._scrape_page
+
+    def timed_fetch(url, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return fetch(url, *args, **kwargs)
+        finally:
+            page_times[url] = page_times.get(url, 0.0) + time.perf_counter() - start
+
+    def timed_process_page(html, url, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return process_page(html, url, *args, **kwargs)
+        finally:
+            page_times[url] = page_times.get(url, 0.0) + time.perf_counter() - start
+
+    def counted_scrape_page(url, *args, **kwargs):
+        page = scrape_page(url, *args, **kwargs)
+        if isinstance(page, dict):
+            # Open breakers and rejected responses are reported as "Skipped ..."
+            outcomes['skipped' if page['error'].startswith('Skipped') else 'errors'] += 1
+        return page
+
+    scraper.fetch_policy.fetch = timed_fetch
+    scraper._process_page = timed_process_page
+    scraper._scrape_page = counted_scrape_page
+    return page_times, outcomes
+
+
+def crawl(urls, max_pages, resolve_func):
+    """Crawl every site and return (leads, per-page seconds, error and skip counts, elapsed seconds)."""
+    scraper = make_scraper(resolve_func)
+    page_times, outcomes = instrument(scraper)
+    leads = []
+    start = time.perf_counter()
+    for url in urls:
+        result = scraper.scrape_website(url, max_pages=max_pages)
+        if isinstance(result, list):
+            leads.extend(result)
+    elapsed = time.perf_counter() - start
+    scraper.resolver.close()
+    return leads, page_times, outcomes, elapsed
+
+
+def run_pipeline(leads, target_size):
+    """
+    Time clean, filter and analyze on the crawled leads, replicated to `target_size`.
+
+    Returns:
+        dict: Seconds per stage and the number of input leads
+    """
+    scraper = make_scraper()
+    replicated = []
+    copies = max(1, target_size // max(1, len(leads)))
+    for copy in range(copies):
+        for lead in leads:
+            replicated.append(dict(
+                lead,
+                Website=f"{lead['Website']}?copy={copy}",
+                Email=f"{copy}.{lead['Email']}" if lead.get('Email') else '',
+            ))
+
+    timings = {'input_leads': len(replicated)}
+    start = time.perf_counter()
+    cleaned = scraper.validate_and_clean_data(replicated)
+    timings['clean_seconds'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    filtered = scraper.filter_leads(cleaned, keywords=['software', 'fintech', 'analytics'],
+                                    exclude_keywords=['retail'], min_data_points=4)
+    timings['filter_seconds'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scraper.analyze_leads(filtered)
+    timings['analyze_seconds'] = time.perf_counter() - start
+    return timings
+
+
+def run(args):
+    corpus = Corpus(sites=args.sites, pages_per_site=args.pages, fan_out=args.fan_out,
+                    page_size=args.page_size, seed=args.seed)
+    server = FixtureServer(corpus, latency=args.latency, jitter=args.jitter,
+                           error_rate=args.error_rate, seed=args.seed)
+
+    with server:
+        urls = server.site_urls()
+        leads, page_times, outcomes, elapsed = crawl(urls, args.max_pages, server.resolve)
+        latencies = list(page_times.values())
+
+        # Memory is measured in a separate pass since tracemalloc slows everything down
+        peak_crawl_bytes = None
+        if not args.no_memory:
+            tracemalloc.start()
+            crawl(urls, args.max_pages, server.resolve)
+            peak_crawl_bytes = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    pipeline = run_pipeline(leads, args.pipeline_leads)
+    peak_pipeline_bytes = None
+    if not args.no_memory:
+        tracemalloc.start()
+        run_pipeline(leads, args.pipeline_leads)
+        peak_pipeline_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'config': {key: value for key, value in vars(args).items() if key not in ('output', 'compare', 'no_memory')},
+        'crawl': {
+            'pages': len(latencies),
+            'leads': len(leads),
+            'errors': outcomes['errors'],
+            'skipped': outcomes['skipped'],
+            'elapsed_seconds': elapsed,
+            'pages_per_second': len(latencies) / elapsed if elapsed else 0.0,
+            'leads_per_second': len(leads) / elapsed if elapsed else 0.0,
+            'p50_page_seconds': percentile(latencies, 0.50),
+            'p99_page_seconds': percentile(latencies, 0.99),
+            'peak_memory_bytes': peak_crawl_bytes,
+        },
+        'pipeline': dict(pipeline, peak_memory_bytes=peak_pipeline_bytes),
+    }
+
+
+# Metrics compared across runs, and whether higher values are better
+COMPARED = [
+    ('crawl', 'pages_per_second', True),
+    ('crawl', 'leads_per_second', True),
+    ('crawl', 'p50_page_seconds', False),
+    ('crawl', 'p99_page_seconds', False),
+    ('crawl', 'peak_memory_bytes', False),
+    ('pipeline', 'clean_seconds', False),
+    ('pipeline', 'filter_seconds', False),
+    ('pipeline', 'analyze_seconds', False),
+    ('pipeline', 'peak_memory_bytes', False),
+]
+
+
+def compare(baseline, current):
+    """Print the change of each metric relative to a baseline run."""
+    print(f"\nComparison with {baseline.get('revision') or 'baseline'}:")
+    if baseline.get('config') != current.get('config'):
+        print("  warning: benchmark configuration differs from the baseline")
+    for section, metric, higher_is_better in COMPARED:
+        old = baseline.get(section, {}).get(metric)
+        new = current.get(section, {}).get(metric)
+        if not old or new is None:
+            continue
+        change = (new - old) / old * 100
+        better = change > 0 if higher_is_better else change < 0
+        verdict = 'better' if better else 'worse' if change else 'same'
+        print(f"  {section}.{metric:<20} {old:>14.6g} -> {new:<14.6g} {change:+7.1f}% ({verdict})")
+
+
+def report(results):
+    crawl_results, pipeline = results['crawl'], results['pipeline']
+    print(f"Revision {results['revision']}")
+    print(f"Crawl: {crawl_results['pages']} pages, {crawl_results['leads']} leads "
+          f"in {crawl_results['elapsed_seconds']:.2f}s "
+          f"({crawl_results['errors']} failed, {crawl_results['skipped']} skipped)")
+    print(f"  {crawl_results['pages_per_second']:.1f} pages/s, {crawl_results['leads_per_second']:.1f} leads/s")
+    print(f"  page latency p50 {crawl_results['p50_page_seconds'] * 1000:.1f} ms, "
+          f"p99 {crawl_results['p99_page_seconds'] * 1000:.1f} ms")
+    if crawl_results['peak_memory_bytes'] is not None:
+        print(f"  peak memory {crawl_results['peak_memory_bytes'] / 1e6:.1f} MB")
+    print(f"Pipeline ({pipeline['input_leads']} leads): clean {pipeline['clean_seconds'] * 1000:.1f} ms, "
+          f"filter {pipeline['filter_seconds'] * 1000:.1f} ms, analyze {pipeline['analyze_seconds'] * 1000:.1f} ms")
+    if pipeline['peak_memory_bytes'] is not None:
+        print(f"  peak memory {pipeline['peak_memory_bytes'] / 1e6:.1f} MB")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sites', type=int, default=20, help='number of generated sites')
+    parser.add_argument('--pages', type=int, default=8, help='pages per site')
+    parser.add_argument('--fan-out', type=int, default=6, help='internal links per page')
+    parser.add_argument('--page-size', type=int, default=20000, help='approximate page size in bytes')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to each response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='maximum extra random latency')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of HTTP 500 responses')
+    parser.add_argument('--max-pages', type=int, default=3, help='max_pages passed to scrape_website')
+    parser.add_argument('--pipeline-leads', type=int, default=10000, help='leads fed to clean/filter/analyze')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--no-memory', action='store_true', help='skip the peak memory passes')
+    parser.add_argument('--output', help='write results as JSON to this file')
+    parser.add_argument('--compare', help='compare against a previous JSON result')
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    results = run(args)
+    report(results)
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), results)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,202 @@
+"""Micro-benchmarks for the extraction, cleaning and filtering hot paths.
+
+Times individual `LeadScraper` methods over synthetic inputs: lead lists of
+1k, 100k or 1M leads and small, medium and huge HTML pages. Each benchmark is
+run several times and the fastest run is reported (as asv and timeit do).
+Results can be saved and later checked against a regression threshold.
+
+Usage:
+    python benchmarks/bench_micro.py --output baseline.json
+    python benchmarks/bench_micro.py --baseline baseline.json --threshold 0.15
+    python benchmarks/bench_micro.py --sizes 1k,100k,1m --filter filter_leads
+"""
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from fixture_server import Corpus, INDUSTRIES, CITIES, FIRST_NAMES, LAST_NAMES, TITLES, WORDS  # noqa: E402
+from scraper import LeadScraper, _parse_html  # noqa: E402
+
+LEAD_SIZES = {'1k': 1_000, '100k': 100_000, '1m': 1_000_000}
+PAGE_SIZES = {'small': 2_000, 'medium': 50_000, 'huge': 2_000_000}
+
+
+def make_leads(count, seed=42):
+    """Generate synthetic leads with realistic field contents and some duplicates."""
+    rng = random.Random(seed)
+    leads = []
+    for i in range(count):
+        # Roughly 5% of leads repeat an earlier company so deduplication has work to do
+        n = rng.randrange(i) if i and rng.random() < 0.05 else i
+        domain = f"company{n}.example"
+        leads.append({
+            'Company Name': f"{rng.choice(WORDS).title()} {rng.choice(['Inc', 'Ltd', 'GmbH'])} {n}",
+            'Website': f"https://{domain}/",
+            'Domain': domain,
+            'Description': '  '.join(rng.choices(WORDS, k=rng.randint(5, 40))),
+            'Industry/Keywords': ', '.join(rng.sample(INDUSTRIES, 3)),
+            'Contact Name': f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}" if rng.random() < 0.6 else '',
+            'Job Title': rng.choice(TITLES) if rng.random() < 0.4 else '',
+            'Email': f"info@{domain}" if rng.random() < 0.7 else rng.choice(['', 'not-an-email']),
+            'Phone': f"({rng.randint(200, 999)}) 555-{rng.randint(1000, 9999)}" if rng.random() < 0.5 else '',
+            'Location': rng.choice(CITIES) if rng.random() < 0.5 else '',
+        })
+    return leads
+
+
+def make_page(size):
+    """Generate an HTML page of roughly `size` bytes."""
+    corpus = Corpus(sites=1, pages_per_site=1, fan_out=1, page_size=size)
+    return next(iter(corpus.pages.values())).decode('utf-8')
+
+
+def benchmarks(sizes, scraper):
+    """
+    Yield (benchmark id, setup function, function under test) triples.
+
+    The setup function returns the argument tuple for the function under test.
+    """
+    def extract_contact_info(soup, lead):
+        # The method fills `lead` in place and skips fields that are already
+        # set, so each call starts from a fresh copy of the company lead
+        return scraper._extract_contact_info(soup, dict(lead))
+
+    for page_name, page_size in PAGE_SIZES.items():
+        def setup_html(page_size=page_size):
+            return (make_page(page_size),)
+
+        def setup_soup(page_size=page_size):
+            return (_parse_html(make_page(page_size)), "https://company.example/")
+
+        def setup_contact(page_size=page_size):
+            soup = _parse_html(make_page(page_size))
+            lead = scraper._extract_company_info(soup, "https://company.example/")[0]
+            return (soup, lead)
+
+        def setup_links(page_size=page_size):
+            soup = _parse_html(make_page(page_size))
+            # Add many links so link discovery has something to chew on
+            for i in range(page_size // 200):
+                tag = soup.new_tag('a', href=f"/page-{i}")
+                soup.body.append(tag)
+            return (soup, "https://company.example/")
+
+        yield f"parse_html[{page_name}]", setup_html, _parse_html
+        yield f"_extract_company_info[{page_name}]", setup_soup, scraper._extract_company_info
+        yield f"_extract_contact_info[{page_name}]", setup_contact, extract_contact_info
+        yield f"_find_internal_links[{page_name}]", setup_links, scraper._find_internal_links
+
+    for size_name in sizes:
+        count = LEAD_SIZES[size_name]
+
+        def setup_leads(count=count):
+            return (make_leads(count),)
+
+        def setup_filter(count=count, keyword_count=10):
+            keywords = [f"{word}{i}" for i, word in enumerate(WORDS * (keyword_count // len(WORDS) + 1))][:keyword_count]
+            keywords[-1] = 'software'
+            return (make_leads(count), keywords, ['retail'], 4)
+
+        yield f"validate_and_clean_data[{size_name}]", setup_leads, scraper.validate_and_clean_data
+        yield f"filter_leads[{size_name},10kw]", setup_filter, scraper.filter_leads
+        yield (f"filter_leads[{size_name},1000kw]",
+               lambda count=count: setup_filter(count, 1000), scraper.filter_leads)
+        yield f"analyze_leads[{size_name}]", setup_leads, scraper.analyze_leads
+
+
+def time_benchmark(setup, func, repeat, min_time):
+    """
+    Time a function, returning the fastest per-call time over `repeat` runs.
+
+    Each run calls the function enough times to take at least `min_time`
+    seconds, so fast functions are not dominated by timer resolution.
+    """
+    args = setup()
+
+    # Calibrate the number of calls per run
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func(*args)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func(*args)
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def check_regressions(baseline, results, threshold):
+    """
+    Compare results with a baseline.
+
+    Returns:
+        list: (benchmark id, baseline seconds, current seconds) for regressions
+    """
+    regressions = []
+    for name, seconds in results.items():
+        old = baseline.get(name)
+        if old and seconds > old * (1 + threshold):
+            regressions.append((name, old, seconds))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='1k,100k', help='lead list sizes: any of 1k,100k,1m')
+    parser.add_argument('--filter', help='only run benchmarks whose id matches this regex')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per benchmark')
+    parser.add_argument('--min-time', type=float, default=0.2, help='minimum seconds per timed run')
+    parser.add_argument('--output', help='write results as JSON to this file')
+    parser.add_argument('--baseline', help='JSON results to check for regressions against')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='allowed slowdown relative to the baseline (0.2 = 20%%)')
+    args = parser.parse_args()
+
+    sizes = [size.strip().lower() for size in args.sizes.split(',') if size.strip()]
+    unknown = [size for size in sizes if size not in LEAD_SIZES]
+    if unknown:
+        parser.error(f"unknown sizes: {', '.join(unknown)}")
+
+    scraper = LeadScraper(fast_start=True)
+    pattern = re.compile(args.filter) if args.filter else None
+
+    results = {}
+    for name, setup, func in benchmarks(sizes, scraper):
+        if pattern and not pattern.search(name):
+            continue
+        seconds = time_benchmark(setup, func, args.repeat, args.min_time)
+        results[name] = seconds
+        print(f"{name:<45} {seconds * 1000:12.3f} ms")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = check_regressions(baseline, results, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}:")
+            for name, old, new in regressions:
+                print(f"  {name}: {old * 1000:.3f} ms -> {new * 1000:.3f} ms ({(new / old - 1):+.0%})")
+            sys.exit(1)
+        print(f"\nNo regressions above {args.threshold:.0%}.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""Startup-time benchmark for the scraper.
+
+Measures, in fresh interpreter processes, how long it takes to import
+`scraper` and construct a `LeadScraper`, with and without fast-start mode.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 10] [--output results.json]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Each snippet prints the elapsed seconds measured inside the child process
+SNIPPET = """
+import time
+start = time.perf_counter()
+import scraper
+scraper.LeadScraper(fast_start={fast_start})
+print(time.perf_counter() - start)
+"""
+
+
+def measure(fast_start, runs):
+    """
+    Time import plus construction over several fresh processes.
+
+    Args:
+        fast_start (bool): Whether to construct the scraper in fast-start mode
+        runs (int): Number of processes to launch
+
+    Returns:
+        dict: Timing summary in milliseconds
+    """
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', SNIPPET.format(fast_start=fast_start)],
+            env=env, check=True, capture_output=True, text=True
+        ).stdout
+        samples.append(float(output.strip().splitlines()[-1]) * 1000)
+
+    return {
+        'fast_start': fast_start,
+        'runs': runs,
+        'median_ms': round(statistics.median(samples), 2),
+        'min_ms': round(min(samples), 2),
+        'max_ms': round(max(samples), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10, help='processes to launch per mode')
+    parser.add_argument('--output', help='write results as JSON to this file')
+    args = parser.parse_args()
+
+    results = [measure(False, args.runs), measure(True, args.runs)]
+    for result in results:
+        mode = 'fast start' if result['fast_start'] else 'default'
+        print(f"{mode:>10}: median {result['median_ms']:.1f} ms "
+              f"(min {result['min_ms']:.1f}, max {result['max_ms']:.1f}, {result['runs']} runs)")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
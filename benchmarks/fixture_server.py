@@ -0,0 +1,266 @@
+"""Local HTTP server that serves a generated corpus of company websites.
+
+Each site has its own host name (``site-<n>.bench.test``) and a home page
+plus about, contact, team and product pages that link to each other. The
+server answers for every site on 127.0.0.1 and routes on the Host header,
+so clients resolve the site hosts with `FixtureServer.resolve` (for example
+through ``DNSCache(resolve_func=server.resolve)``). Per-host state in the
+scraper, such as circuit breakers and the robots.txt cache, then sees each
+site separately.
+Latency, page size, link fan-out and error rate are configurable, and the
+corpus is generated from a seed so benchmark runs are reproducible.
+
+Run standalone to browse the corpus:
+    python benchmarks/fixture_server.py --sites 5 --port 8000
+    curl -H 'Host: site-0.bench.test' http://127.0.0.1:8000/
+"""
+import argparse
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+INDUSTRIES = ['software', 'logistics', 'healthcare', 'fintech', 'manufacturing', 'retail',
+              'marketing', 'energy', 'education', 'security', 'analytics', 'consulting']
+FIRST_NAMES = ['Alice', 'Bob', 'Carla', 'Deepak', 'Elena', 'Farid', 'Grace', 'Hiro', 'Ines', 'Jonas']
+LAST_NAMES = ['Smith', 'Garcia', 'Chen', 'Okafor', 'Novak', 'Rossi', 'Kim', 'Haddad', 'Berg', 'Silva']
+TITLES = ['CEO', 'CTO', 'Head of Sales', 'VP Marketing', 'Operations Manager', 'Founder']
+CITIES = ['Berlin', 'Austin', 'Toronto', 'Lisbon', 'Singapore', 'Denver', 'Dublin', 'Seoul']
+WORDS = ('lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor '
+         'incididunt ut labore et dolore magna aliqua platform solution customer growth').split()
+PAGE_NAMES = ['about', 'contact', 'team', 'careers', 'blog', 'pricing']
+HOST_SUFFIX = 'bench.test'
+
+
+class Corpus:
+    """Deterministically generated company sites."""
+
+    def __init__(self, sites=20, pages_per_site=8, fan_out=6, page_size=20000, seed=42):
+        """
+        Generate the corpus.
+
+        Args:
+            sites (int): Number of company sites
+            pages_per_site (int): Pages per site, including the home page
+            fan_out (int): Internal links per page
+            page_size (int): Approximate page size in bytes (padded with body text)
+            seed (int): Random seed
+        """
+        self.sites = sites
+        self.pages_per_site = pages_per_site
+        self.fan_out = fan_out
+        self.page_size = page_size
+        self.pages = {}  # (host, path) -> page body
+
+        rng = random.Random(seed)
+        for site in range(sites):
+            company = self._company(rng, site)
+            host = self.site_host(site)
+            paths = self._page_paths()
+            for path in paths:
+                links = rng.sample(paths, min(fan_out, len(paths)))
+                self.pages[(host, path)] = self._render(rng, company, path, links).encode('utf-8')
+
+    def _company(self, rng, site):
+        """Generate the details shared by all pages of one site."""
+        name = f"{rng.choice(WORDS).title()}{rng.choice(WORDS).title()} {rng.choice(['Inc', 'GmbH', 'Ltd', 'Labs'])}"
+        slug = name.split()[0].lower()
+        return {
+            'name': name,
+            'description': f"{name} builds {' '.join(rng.choices(WORDS, k=12))}.",
+            'keywords': rng.sample(INDUSTRIES, 3),
+            'email': f"{rng.choice(['info', 'sales', 'hello'])}@{slug}-{site}.example",
+            'phone': f"({rng.randint(200, 999)}) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}",
+            'city': rng.choice(CITIES),
+            'people': [
+                (f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}", rng.choice(TITLES))
+                for _ in range(rng.randint(1, 4))
+            ],
+        }
+
+    @staticmethod
+    def site_host(site):
+        """Return the host name of a site."""
+        return f"site-{site}.{HOST_SUFFIX}"
+
+    def _page_paths(self):
+        """Return the paths of every page on a site, home page first."""
+        names = [PAGE_NAMES[i % len(PAGE_NAMES)] + (f"-{i // len(PAGE_NAMES)}" if i >= len(PAGE_NAMES) else '')
+                 for i in range(self.pages_per_site - 1)]
+        return ["/"] + [f"/{name}" for name in names]
+
+    def _render(self, rng, company, path, links):
+        """Render one page."""
+        team = "\n".join(
+            f'<div class="team-member"><h3 class="name">{person}</h3><p class="job-title">{title}</p></div>'
+            for person, title in company['people']
+        )
+        nav = "\n".join(f'<a href="{link}">{link.rsplit("/", 1)[-1] or "home"}</a>' for link in links)
+        html = f"""<!DOCTYPE html>
+<html>
+<head>
+<title>{company['name']}</title>
+<meta name="description" content="{company['description']}">
+<meta name="keywords" content="{', '.join(company['keywords'])}">
+</head>
+<body>
+<nav>{nav}</nav>
+<h1>{company['name']}</h1>
+<h2>{path}</h2>
+<section class="about-us">{company['description']}</section>
+<section class="team">{team}</section>
+<div class="contact-info">
+<p class="address">{rng.randint(1, 999)} Main Street, {company['city']}</p>
+<p>Email us at {company['email']} or call {company['phone']}.</p>
+</div>
+<a href="/brochure.pdf">Brochure</a>
+"""
+        padding = []
+        size = len(html)
+        while size < self.page_size:
+            paragraph = f"<p>{' '.join(rng.choices(WORDS, k=40))}</p>\n"
+            padding.append(paragraph)
+            size += len(paragraph)
+        return html + "".join(padding) + "</body>\n</html>\n"
+
+    def site_hosts(self):
+        """Return the host name of every site."""
+        return [self.site_host(site) for site in range(self.sites)]
+
+
+class FixtureServer:
+    """Serves a Corpus over HTTP on localhost in a background thread."""
+
+    def __init__(self, corpus, latency=0.0, jitter=0.0, error_rate=0.0, seed=42, port=0):
+        """
+        Initialize the server.
+
+        Args:
+            corpus (Corpus): Pages to serve
+            latency (float): Seconds of delay added to every response
+            jitter (float): Maximum extra random delay in seconds
+            error_rate (float): Fraction of page requests answered with HTTP 500
+            seed (int): Random seed for jitter and errors
+            port (int): Port to listen on (0 picks a free port)
+        """
+        self.corpus = corpus
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.port = port
+        self.requests_served = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._hosts = set(corpus.site_hosts())
+        self._httpd = None
+        self._thread = None
+
+    def site_urls(self):
+        """Return the home page URL of every site."""
+        return [f"http://{host}:{self.port}/" for host in self.corpus.site_hosts()]
+
+    def resolve(self, host):
+        """
+        Resolve a site host to the server's address.
+
+        Usable as the `resolve_func` of a `DNSCache`.
+
+        Args:
+            host (str): Host name
+
+        Returns:
+            list: The loopback address
+
+        Raises:
+            OSError: If the host isn't one of the corpus sites
+        """
+        if host not in self._hosts:
+            raise OSError(f"Unknown fixture host: {host}")
+        return ['127.0.0.1']
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Headers and body are written separately; don't let Nagle hold back the body on kept-alive connections
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_HEAD(self):
+                self.do_GET(head=True)
+
+            def do_GET(self, head=False):
+                with server._lock:
+                    server.requests_served += 1
+                    delay = server.latency + server._rng.random() * server.jitter
+                    fail = server._rng.random() < server.error_rate
+                if delay:
+                    time.sleep(delay)
+
+                page = server.corpus.pages.get((self.headers.get('Host', '').rsplit(':', 1)[0].lower(), self.path))
+                if self.path == '/robots.txt':
+                    status, content_type, body = 200, 'text/plain', b"User-agent: *\nAllow: /\n"
+                elif self.path.endswith('.pdf'):
+                    status, content_type, body = 200, 'application/pdf', b"%PDF-1.4\n" + b"0" * 100000
+                elif page is None:
+                    status, content_type, body = 404, 'text/html', b"<h1>Not found</h1>"
+                elif fail:
+                    status, content_type, body = 500, 'text/html', b"<h1>Server error</h1>"
+                else:
+                    status, content_type, body = 200, 'text/html; charset=utf-8', page
+
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                if not head:
+                    self.wfile.write(body)
+
+        return Handler
+
+    def start(self):
+        """Start serving in a background thread."""
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', self.port), self._handler())
+        self._httpd.daemon_threads = True
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="fixture-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the server."""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._thread.join()
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sites', type=int, default=5)
+    parser.add_argument('--pages', type=int, default=8, help='pages per site')
+    parser.add_argument('--port', type=int, default=8000)
+    args = parser.parse_args()
+
+    server = FixtureServer(Corpus(sites=args.sites, pages_per_site=args.pages), port=args.port).start()
+    print(f"Serving {args.sites} sites on 127.0.0.1:{server.port} as {Corpus.site_host(0)} ... "
+          f"(Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
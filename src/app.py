@@ -3,7 +3,13 @@ import pandas as pd
 import os
 import time
 import json
+import uuid
 from scraper import LeadScraper
+from lead_store import LeadStore
+from jobs import JobRunner, QUEUED, RUNNING, DONE, FAILED
+from scheduler import CrawlScheduler
+from export_index import ExportIndex
+from result_index import ResultIndex
 import traceback
 
 # Page configuration
@@ -76,16 +82,56 @@ def load_configuration(file):
         st.error(f"Error loading configuration: {str(e)}")
         return None
 
+@st.cache_resource
+def get_lead_store():
+    """Open the local lead store shared by all sessions."""
+    return LeadStore("data/leads.db")
+
+@st.cache_resource
+def get_export_index():
+    """Open the index of previously exported leads used for delta exports."""
+    return ExportIndex("data/exports.db", target="csv")
+
+@st.cache_resource
+def get_crawl_scheduler():
+    """Create the crawl scheduler shared by every scrape in this process."""
+    return CrawlScheduler()
+
+@st.cache_resource
+def get_job_runner():
+    """Create the background job runner shared by all sessions."""
+    return JobRunner(lead_store=get_lead_store(), scheduler=get_crawl_scheduler())
+
+@st.cache_resource(max_entries=8)
+def get_result_index(result_set_id, _leads):
+    """Build the search index for a result set, cached by its ID.
+
+    Held as a shared resource rather than with `st.cache_data`, which would
+    unpickle a fresh copy of the whole index on every cache hit.
+    """
+    return ResultIndex(_leads)
+
+@st.cache_data(max_entries=64)
+def query_results(result_set_id, _leads, search_term, sort_by, descending):
+    """Return the matching row numbers for a search and sort, cached per result set."""
+    return get_result_index(result_set_id, _leads).query(search_term, sort_by, descending)
+
 def main():
     # Initialize session state variables if they don't exist
     if 'leads' not in st.session_state:
         st.session_state.leads = []
     if 'filtered_leads' not in st.session_state:
         st.session_state.filtered_leads = []
+    if 'result_set_id' not in st.session_state:
+        st.session_state.result_set_id = None
     if 'lead_analysis' not in st.session_state:
         st.session_state.lead_analysis = {}
+    if 'session_id' not in st.session_state:
+        st.session_state.session_id = uuid.uuid4().hex
+    if 'selected_job' not in st.session_state:
+        st.session_state.selected_job = None
     if 'scraper' not in st.session_state:
-        st.session_state.scraper = LeadScraper()
+        st.session_state.scraper = LeadScraper(fast_start=True)
     if 'config_files' not in st.session_state:
         # Scan for existing config files
         st.session_state.config_files = []
@@ -165,6 +211,15 @@ def main():
                 help="Checking this box ensures ethical scraping by following website crawling rules"
             )
             st.session_state['respect_robots'] = respect_robots
+            
+            verify_email_domains = st.checkbox(
+                "Drop leads whose email domain can't receive mail",
+                value=st.session_state.get('verify_email_domains', False),
+                help=("Looks up every email domain's mail servers (MX records, or address records "
+                      "when dnspython isn't installed) and drops leads whose domain doesn't exist or "
+                      "accepts no mail. Leads whose domain can't be checked are kept")
+            )
+            st.session_state['verify_email_domains'] = verify_email_domains
         
         # Input for filtering options
         st.markdown("### Filtering Options")
@@ -236,65 +291,74 @@ def main():
         generate_button = st.button("Generate Leads", type="primary")
     
     # Main content area
+    runner = get_job_runner()
     if generate_button and url:
         try:
-            with st.spinner("Scraping website for lead data..."):
-                # Update scraper settings
-                st.session_state.scraper = LeadScraper(respect_robots_txt=respect_robots)
-                
-                # Add progress tracking
-                progress_bar = st.progress(0)
-                progress_text = st.empty()
-                progress_text.text("Starting scraper...")
-                
-                # Scrape the website
-                progress_text.text("Scraping primary website...")
-                scraped_leads = st.session_state.scraper.scrape_website(url, max_pages=max_pages)
-                progress_bar.progress(50)
-                
-                # Check for errors
-                if isinstance(scraped_leads, dict) and 'error' in scraped_leads:
-                    st.error(f"Error: {scraped_leads['error']}")
-                else:
-                    st.session_state.leads = scraped_leads
-                    progress_text.text("Cleaning and validating data...")
-                    progress_bar.progress(70)
-                    
-                    # Clean and validate the data
-                    cleaned_leads = st.session_state.scraper.validate_and_clean_data(scraped_leads)
-                    
-                    progress_text.text("Filtering leads...")
-                    progress_bar.progress(85)
-                    
-                    # Filter the leads
-                    st.session_state.filtered_leads = st.session_state.scraper.filter_leads(
-                        cleaned_leads, 
-                        keywords=keywords if keywords_input else None,
-                        exclude_keywords=exclude_keywords if exclude_input else None,
-                        min_data_points=min_data_points,
-                        advanced_filters=advanced_filters if advanced_filters else None
-                    )
-                    
-                    progress_text.text("Analyzing leads...")
-                    progress_bar.progress(95)
-                    
-                    # Analyze the leads
-                    st.session_state.lead_analysis = st.session_state.scraper.analyze_leads(
-                        st.session_state.filtered_leads
-                    )
-                    
-                    progress_bar.progress(100)
-                    progress_text.text("Process complete!")
-                    
-                    # Display success message
-                    if st.session_state.filtered_leads:
-                        st.success(f"Successfully found {len(st.session_state.filtered_leads)} leads!")
-                    else:
-                        st.warning("No leads found matching your criteria.")
+            # Update scraper settings
+            st.session_state.scraper = LeadScraper(respect_robots_txt=respect_robots, fast_start=True)
+            
+            # Run the scrape in the background so the UI stays responsive
+            st.session_state.selected_job = runner.submit(
+                url,
+                max_pages=max_pages,
+                respect_robots_txt=respect_robots,
+                filter_options={
+                    'keywords': keywords if keywords_input else None,
+                    'exclude_keywords': exclude_keywords if exclude_input else None,
+                    'min_data_points': min_data_points,
+                    'advanced_filters': advanced_filters if advanced_filters else None,
+                },
+                session_id=st.session_state.session_id,
+                verify_email_domains=verify_email_domains
+            )
         except Exception as e:
             st.error(f"An unexpected error occurred: {str(e)}")
             st.code(traceback.format_exc())
     
+    # Display this session's scrape jobs with live progress
+    snapshots = [job.snapshot() for job in runner.jobs_for(st.session_state.session_id)]
+    if snapshots:
+        st.markdown('<div class="sub-header">Scrape Jobs</div>', unsafe_allow_html=True)
+        
+        for snapshot in reversed(snapshots):
+            col1, col2 = st.columns([4, 1])
+            with col1:
+                st.text(
+                    f"{snapshot['url']} ({snapshot['status']}): "
+                    f"{snapshot['pages_fetched']} pages fetched, {snapshot['leads_found']} leads found"
+                )
+                if snapshot['status'] in (QUEUED, RUNNING):
+                    st.progress(min(snapshot['pages_fetched'] / snapshot['max_pages'], 1.0))
+                elif snapshot['status'] == FAILED:
+                    st.error(f"Error: {snapshot['error']}")
+            with col2:
+                if st.button("Show results", key=f"show_{snapshot['id']}"):
+                    st.session_state.selected_job = snapshot['id']
+                if snapshot['status'] in (DONE, FAILED) and st.button("Dismiss", key=f"dismiss_{snapshot['id']}"):
+                    # Results already loaded into this session stay on screen
+                    runner.discard(snapshot['id'])
+                    st.experimental_rerun()
+        
+        # Load the selected job's results into the views below
+        selected = next((s for s in snapshots if s['id'] == st.session_state.selected_job), None)
+        if selected and selected['status'] == DONE:
+            st.session_state.leads = selected['leads']
+            st.session_state.filtered_leads = selected['filtered_leads']
+            st.session_state.result_set_id = f"{selected['id']}:done"
+            st.session_state.lead_analysis = selected['analysis']
+            
+            # Display success message
+            if st.session_state.filtered_leads:
+                st.success(f"Successfully found {len(st.session_state.filtered_leads)} leads!")
+            else:
+                st.warning("No leads found matching your criteria.")
+        elif selected and selected['status'] in (QUEUED, RUNNING):
+            # Show partial results as they stream in; filters apply once the job finishes
+            st.session_state.leads = selected['leads']
+            st.session_state.filtered_leads = selected['leads']
+            st.session_state.result_set_id = f"{selected['id']}:{len(selected['leads'])}"
+            st.session_state.lead_analysis = st.session_state.scraper.analyze_leads(selected['leads'])
+    
     # Display lead analysis if available
     if st.session_state.lead_analysis and st.session_state.lead_analysis.get('total', 0) > 0:
         st.markdown('<div class="sub-header">Lead Analysis</div>', unsafe_allow_html=True)
@@ -332,26 +396,48 @@ def main():
         # Search and filter within results
         search_term = st.text_input("Search within results:", placeholder="Enter search term")
         
-        # Apply search filter if provided
-        displayed_leads = st.session_state.filtered_leads
+        leads = st.session_state.filtered_leads
+        col1, col2, col3 = st.columns([2, 1, 1])
+        with col1:
+            sort_by = st.selectbox("Sort by:", ["(none)"] + list(leads[0].keys()))
+        with col2:
+            descending = st.checkbox("Descending")
+        with col3:
+            page_size = st.selectbox("Rows per page:", [25, 50, 100, 250], index=1)
+        
+        # Search and sort run against the cached index of this result set
+        rows = query_results(
+            st.session_state.result_set_id,
+            leads,
+            search_term,
+            None if sort_by == "(none)" else sort_by,
+            descending
+        )
         if search_term:
-            displayed_leads = [
-                lead for lead in st.session_state.filtered_leads
-                if any(search_term.lower() in str(value).lower() for value in lead.values())
-            ]
-            st.info(f"Found {len(displayed_leads)} leads matching '{search_term}'")
+            st.info(f"Found {len(rows)} leads matching '{search_term}'")
         
-        # Convert to DataFrame for display
-        df = pd.DataFrame(displayed_leads)
+        # Only the current page is converted to a DataFrame and rendered
+        page_count = max(1, -(-len(rows) // page_size))
+        page = st.number_input("Page:", min_value=1, max_value=page_count, value=1, step=1,
+                               key=f"results_page_{page_count}")
+        start = (page - 1) * page_size
+        df = pd.DataFrame([leads[row] for row in rows[start:start + page_size]])
         
         # Show the DataFrame
         st.dataframe(df)
+        st.caption(f"Showing {min(start + 1, len(rows))}-{min(start + page_size, len(rows))} of {len(rows)} leads "
+                   f"(page {page} of {page_count})")
+        
+        displayed_leads = [leads[row] for row in rows]
         
         # Export options
         st.markdown("#### Export Options")
         
         col1, col2 = st.columns(2)
         with col1:
+            # Delta exports skip leads that were already exported unchanged
+            delta_only = st.checkbox("Only new or changed leads since the last export")
+            
             # Export to CSV
             if st.button("Download as CSV"):
                 try:
@@ -365,10 +451,13 @@ def main():
                     # Export to CSV
                     result = st.session_state.scraper.export_to_csv(
                         displayed_leads, 
-                        filename
+                        filename,
+                        delta_index=get_export_index() if delta_only else None
                     )
                     
-                    if isinstance(result, str) and result.startswith("Error"):
+                    if result is None:
+                        st.info("No new or changed leads since the last export.")
+                    elif isinstance(result, str) and result.startswith("Error"):
                         st.error(result)
                     else:
                         # Create download link
@@ -384,6 +473,11 @@ def main():
                 except Exception as e:
                     st.error(f"Error exporting to CSV: {str(e)}")
                     st.code(traceback.format_exc())
+    
+    # Poll running jobs so progress and partial results keep updating
+    if any(snapshot['status'] in (QUEUED, RUNNING) for snapshot in snapshots):
+        time.sleep(1)
+        st.experimental_rerun()
 
 if __name__ == "__main__":
     main()
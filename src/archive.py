@@ -0,0 +1,287 @@
+import gzip
+import os
+import sqlite3
+import threading
+import uuid
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from http.client import responses as HTTP_REASONS
+
+from requests.utils import get_encoding_from_headers
+
+ArchivedResponse = namedtuple('ArchivedResponse', ['url', 'status_code', 'headers', 'content', 'fetched_at'])
+
+# Headers describing the transfer rather than the stored (already decoded) body
+_TRANSFER_HEADERS = {'content-encoding', 'transfer-encoding', 'content-length'}
+
+
+def _build_record(url, status_code, headers, content, fetched_at):
+    """Serialize a response as a WARC/1.0 response record."""
+    reason = HTTP_REASONS.get(status_code, '')
+    http_lines = [f"HTTP/1.1 {status_code} {reason}".rstrip()]
+    for name, value in headers.items():
+        if name.lower() not in _TRANSFER_HEADERS:
+            http_lines.append(f"{name}: {value}")
+    http_lines.append(f"Content-Length: {len(content)}")
+    block = ("\r\n".join(http_lines) + "\r\n\r\n").encode('utf-8') + content
+
+    warc_headers = [
+        "WARC/1.0",
+        "WARC-Type: response",
+        f"WARC-Record-ID: <urn:uuid:{uuid.uuid4()}>",
+        f"WARC-Date: {fetched_at}",
+        f"WARC-Target-URI: {url}",
+        "Content-Type: application/http; msgtype=response",
+        f"Content-Length: {len(block)}",
+    ]
+    return ("\r\n".join(warc_headers) + "\r\n\r\n").encode('utf-8') + block + b"\r\n\r\n"
+
+
+def _parse_record(data):
+    """Parse a WARC response record back into an ArchivedResponse."""
+    warc_head, _, rest = data.partition(b"\r\n\r\n")
+    warc_headers = {}
+    for line in warc_head.decode('utf-8').split("\r\n")[1:]:
+        name, _, value = line.partition(": ")
+        warc_headers[name] = value
+    block = rest[:int(warc_headers['Content-Length'])]
+
+    http_head, _, content = block.partition(b"\r\n\r\n")
+    lines = http_head.decode('utf-8').split("\r\n")
+    status_code = int(lines[0].split(" ")[1])
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(": ")
+        headers[name] = value
+    return ArchivedResponse(warc_headers['WARC-Target-URI'], status_code, headers, content, warc_headers['WARC-Date'])
+
+
+class ResponseArchive:
+    """Records fetched responses to compressed WARC segments with a SQLite index.
+
+    Each response is written as its own gzip member (the usual ``.warc.gz``
+    layout), so any record can be read back from its offset without
+    decompressing the rest of the segment. Segments roll over once they
+    reach `segment_size` bytes.
+    """
+
+    def __init__(self, directory, segment_size=64 * 1024 * 1024, compresslevel=6):
+        """
+        Open (or create) an archive.
+
+        Args:
+            directory (str): Directory holding segments and the index
+            segment_size (int): Compressed size at which a new segment is started
+            compresslevel (int): gzip compression level
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.segment_size = segment_size
+        self.compresslevel = compresslevel
+        self._lock = threading.Lock()
+        self._index = sqlite3.connect(os.path.join(directory, 'index.db'), check_same_thread=False)
+        with self._index:
+            self._index.execute("""
+                CREATE TABLE IF NOT EXISTS records (
+                    id INTEGER PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    segment TEXT NOT NULL,
+                    offset INTEGER NOT NULL,
+                    length INTEGER NOT NULL,
+                    status_code INTEGER NOT NULL,
+                    fetched_at TEXT NOT NULL
+                )
+            """)
+            self._index.execute("CREATE INDEX IF NOT EXISTS idx_records_url ON records (url)")
+
+        # Continue appending to the newest segment
+        row = self._index.execute("SELECT segment FROM records ORDER BY id DESC LIMIT 1").fetchone()
+        self._segment_number = int(row[0].split('-')[1].split('.')[0]) if row else 0
+        self._segment = None
+
+    def _open_segment(self):
+        """Open the current segment for appending, rolling over when it is full."""
+        path = os.path.join(self.directory, self._segment_name())
+        if os.path.exists(path) and os.path.getsize(path) >= self.segment_size:
+            self._segment_number += 1
+            path = os.path.join(self.directory, self._segment_name())
+        self._segment = open(path, 'ab')
+
+    def _segment_name(self):
+        return f"segment-{self._segment_number:05d}.warc.gz"
+
+    def write_response(self, url, status_code, headers, content):
+        """
+        Append a response to the archive.
+
+        Args:
+            url (str): URL that was requested
+            status_code (int): HTTP status code
+            headers (Mapping): Response headers
+            content (bytes): Decoded response body
+        """
+        fetched_at = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        record = gzip.compress(_build_record(url, status_code, headers, content, fetched_at), self.compresslevel)
+
+        with self._lock:
+            if self._segment is None or self._segment.tell() >= self.segment_size:
+                if self._segment is not None:
+                    self._segment.close()
+                    self._segment_number += 1
+                self._open_segment()
+            offset = self._segment.tell()
+            self._segment.write(record)
+            self._segment.flush()
+            with self._index:
+                self._index.execute(
+                    "INSERT INTO records (url, segment, offset, length, status_code, fetched_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    (url, self._segment_name(), offset, len(record), status_code, fetched_at)
+                )
+
+    def close(self):
+        """Close the current segment and the index."""
+        with self._lock:
+            if self._segment is not None:
+                self._segment.close()
+                self._segment = None
+            self._index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class ArchiveReader:
+    """Reads responses back from a ResponseArchive directory."""
+
+    def __init__(self, directory):
+        """
+        Open an archive for reading.
+
+        Args:
+            directory (str): Archive directory
+        """
+        self.directory = directory
+        self._index = sqlite3.connect(os.path.join(directory, 'index.db'))
+
+    def __len__(self):
+        return self._index.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def close(self):
+        self._index.close()
+
+    def locations(self):
+        """Return (segment, offset, length) for every record, in segment order."""
+        return self._index.execute(
+            "SELECT segment, offset, length FROM records ORDER BY segment, offset"
+        ).fetchall()
+
+    def read(self, segment, offset, length):
+        """
+        Read a single record.
+
+        Returns:
+            ArchivedResponse: The archived response
+        """
+        with open(os.path.join(self.directory, segment), 'rb') as f:
+            f.seek(offset)
+            return _parse_record(gzip.decompress(f.read(length)))
+
+    def get(self, url):
+        """
+        Return the most recent archived response for a URL.
+
+        Returns:
+            ArchivedResponse: The response, or None if the URL was never archived
+        """
+        row = self._index.execute(
+            "SELECT segment, offset, length FROM records WHERE url = ? ORDER BY id DESC LIMIT 1", (url,)
+        ).fetchone()
+        return self.read(*row) if row else None
+
+    def __iter__(self):
+        for location in self.locations():
+            yield self.read(*location)
+
+
+def decode_body(response):
+    """Decode an archived response body the same way the fetcher does."""
+    encoding = get_encoding_from_headers(response.headers) or 'utf-8'
+    try:
+        return response.content.decode(encoding, errors='replace')
+    except LookupError:
+        return response.content.decode('utf-8', errors='replace')
+
+
+def _replay_chunk(directory, locations):
+    """Extract leads from a chunk of archived records (runs in a worker process)."""
+    from scraper import LeadScraper
+
+    scraper = LeadScraper(fast_start=True)
+    reader = ArchiveReader(directory)
+    leads = []
+    try:
+        for segment, offset, length in locations:
+            response = reader.read(segment, offset, length)
+            if response.status_code != 200:
+                continue
+            page_leads, _ = scraper._process_page(decode_body(response), response.url)
+            leads.extend(page_leads)
+    finally:
+        reader.close()
+    return leads
+
+
+def replay(directory, workers=None, chunk_size=500, keywords=None, exclude_keywords=None,
+           min_data_points=3, advanced_filters=None):
+    """
+    Re-run extraction, cleaning and filtering over an archive without refetching.
+
+    Records are split into chunks that are processed in parallel across
+    worker processes; cleaning and filtering then run on the combined leads.
+
+    Args:
+        directory (str): Archive directory
+        workers (int): Number of worker processes (defaults to the CPU count;
+            1 runs everything in the current process)
+        chunk_size (int): Records per unit of work
+        keywords (list): Keywords to include
+        exclude_keywords (list): Keywords to exclude
+        min_data_points (int): Minimum number of non-empty fields required
+        advanced_filters (dict): Advanced filtering options
+
+    Returns:
+        list: Cleaned and filtered leads
+    """
+    from scraper import LeadScraper
+
+    reader = ArchiveReader(directory)
+    try:
+        locations = reader.locations()
+    finally:
+        reader.close()
+
+    chunks = [locations[i:i + chunk_size] for i in range(0, len(locations), chunk_size)]
+    workers = workers or os.cpu_count() or 1
+
+    leads = []
+    if workers == 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            leads.extend(_replay_chunk(directory, chunk))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk_leads in executor.map(_replay_chunk, [directory] * len(chunks), chunks):
+                leads.extend(chunk_leads)
+
+    scraper = LeadScraper(fast_start=True)
+    cleaned = scraper.validate_and_clean_data(leads)
+    return scraper.filter_leads(
+        cleaned,
+        keywords=keywords,
+        exclude_keywords=exclude_keywords,
+        min_data_points=min_data_points,
+        advanced_filters=advanced_filters
+    )
@@ -0,0 +1,156 @@
+import threading
+import time
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+
+class CircuitBreaker:
+    """A circuit breaker guarding requests to a single host.
+
+    The breaker starts closed. After `failure_threshold` consecutive failures
+    it opens and rejects requests for `cooldown` seconds, then moves to
+    half-open and lets a single trial request through. A successful trial
+    closes the breaker again; a failed one re-opens it.
+    """
+
+    def __init__(self, failure_threshold=3, cooldown=60, clock=time.monotonic):
+        """
+        Initialize the breaker.
+
+        Args:
+            failure_threshold (int): Consecutive failures before the breaker opens
+            cooldown (float): Seconds to stay open before allowing a trial request
+            clock (callable): Monotonic time source (injectable for tests)
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.clock = clock
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self):
+        """Current breaker state (closed, open or half-open)."""
+        if self.opened_at is None:
+            return CLOSED
+        if self.clock() - self.opened_at >= self.cooldown:
+            return HALF_OPEN
+        return OPEN
+
+    def allow_request(self):
+        """
+        Check whether a request may be sent now.
+
+        Returns:
+            bool: True if the request may proceed
+        """
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self):
+        """Record a successful request, closing the breaker."""
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        """Record a failed request, opening the breaker if the threshold is reached."""
+        self.failures += 1
+        if self._trial_in_flight or self.failures >= self.failure_threshold:
+            self.opened_at = self.clock()
+        self._trial_in_flight = False
+
+
+class HostCircuitBreakers:
+    """A registry of circuit breakers, one per host."""
+
+    def __init__(self, failure_threshold=3, cooldown=60, clock=time.monotonic):
+        """
+        Initialize the registry.
+
+        Args:
+            failure_threshold (int): Consecutive failures before a host's breaker opens
+            cooldown (float): Seconds a host is short-circuited before a trial request
+            clock (callable): Monotonic time source (injectable for tests)
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.clock = clock
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def _breaker(self, host):
+        """Return the breaker for a host, creating it on first use."""
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(self.failure_threshold, self.cooldown, self.clock)
+            self._breakers[host] = breaker
+        return breaker
+
+    def allow(self, host):
+        """Return True if a request to the host may be sent now."""
+        with self._lock:
+            return self._breaker(host).allow_request()
+
+    def record_success(self, host):
+        """Record a successful request to the host."""
+        with self._lock:
+            self._breaker(host).record_success()
+
+    def record_failure(self, host):
+        """Record a failed request to the host."""
+        with self._lock:
+            self._breaker(host).record_failure()
+
+    def state(self, host):
+        """Return the breaker state for the host."""
+        with self._lock:
+            return self._breaker(host).state
+
+
+class RetryBudget:
+    """Caps retries to a fraction of all requests made.
+
+    A small fixed allowance (`min_retries`) lets retries happen before enough
+    requests have been made for the ratio to be meaningful.
+    """
+
+    def __init__(self, ratio=0.2, min_retries=10):
+        """
+        Initialize the budget.
+
+        Args:
+            ratio (float): Maximum retries as a fraction of total requests
+            min_retries (int): Retries always allowed regardless of the ratio
+        """
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.requests = 0
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def record_request(self):
+        """Record that a request (first attempt or retry) was sent."""
+        with self._lock:
+            self.requests += 1
+
+    def try_acquire(self):
+        """
+        Reserve a retry if the budget allows one.
+
+        Returns:
+            bool: True if the retry may be attempted
+        """
+        with self._lock:
+            if self.retries < self.min_retries + self.ratio * self.requests:
+                self.retries += 1
+                return True
+            return False
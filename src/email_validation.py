@@ -0,0 +1,167 @@
+import socket
+
+from resolver import DNSCache, TransientLookupError
+
+DELIVERABLE = 'deliverable'
+UNDELIVERABLE = 'undeliverable'
+UNKNOWN = 'unknown'
+
+# dnspython is optional; without it only address records can be checked
+try:
+    import dns.exception
+    import dns.resolver
+except ImportError:
+    dns = None
+
+
+def _address_records(domain):
+    """
+    Return a domain's addresses from the system resolver.
+
+    The system resolver can't tell a missing domain from one that only has
+    MX records, or from a resolver failure, so no answer is inconclusive.
+    """
+    try:
+        infos = socket.getaddrinfo(domain, None, proto=socket.IPPROTO_TCP)
+    except (OSError, UnicodeError) as e:
+        raise TransientLookupError(str(e))
+    return sorted({info[4][0] for info in infos})
+
+
+def make_mail_resolver(nameservers=None, port=53, timeout=3.0):
+    """
+    Build a function that finds the mail hosts of a domain.
+
+    With dnspython installed, MX records are queried (optionally against
+    specific name servers, such as a local stub resolver). A domain without
+    MX records falls back to its address records, as mail delivery does.
+    Only a domain that doesn't exist (NXDOMAIN) or publishes a "null MX"
+    counts as unable to receive mail; timeouts, server failures and other
+    answers are inconclusive. Without dnspython, only address records can
+    be checked, and a domain without them is inconclusive too.
+
+    Args:
+        nameservers (list): Name server IPs to query instead of the system ones
+        port (int): Name server port
+        timeout (float): Seconds to wait for an answer
+
+    Returns:
+        callable: Maps a domain to a list of mail hosts, raising OSError if it
+            can't receive mail and TransientLookupError if that is unclear
+    """
+    if dns is None:
+        return _address_records
+
+    resolver = dns.resolver.Resolver(configure=nameservers is None)
+    if nameservers is not None:
+        resolver.nameservers = list(nameservers)
+    resolver.port = port
+    resolver.lifetime = timeout
+
+    def resolve(domain):
+        try:
+            answer = resolver.resolve(domain, 'MX')
+        except dns.resolver.NXDOMAIN:
+            raise OSError(f"{domain} does not exist")
+        except dns.resolver.NoAnswer:
+            # No MX records: mail goes to the domain's own address, if it has one
+            try:
+                return [str(record) for record in resolver.resolve(domain, 'A')]
+            except dns.exception.DNSException as e:
+                raise TransientLookupError(str(e))
+        except dns.exception.DNSException as e:
+            # Timeouts, SERVFAIL, unreachable name servers and the like
+            raise TransientLookupError(str(e))
+        # A "null MX" (RFC 7505) means the domain explicitly accepts no mail
+        hosts = [str(record.exchange).rstrip('.') for record in answer]
+        hosts = [host for host in hosts if host]
+        if not hosts:
+            raise OSError(f"{domain} does not accept mail")
+        return hosts
+
+    return resolve
+
+
+def email_domain(email):
+    """Return the lowercased domain part of an email address, or ''."""
+    _, at, domain = str(email or '').rpartition('@')
+    if not at:
+        return ''
+    return domain.strip().lower().rstrip('.')
+
+
+class EmailDomainValidator:
+    """Checks in bulk that email domains have somewhere to deliver mail.
+
+    Leads are grouped by email domain, every distinct domain is looked up
+    concurrently, and results are kept in a TTL cache shared by every batch
+    validated through the same instance, so each domain is resolved once
+    however many leads use it.
+    """
+
+    def __init__(self, resolve_func=None, ttl=3600, negative_ttl=600, max_workers=32, transient_ttl=30):
+        """
+        Initialize the validator.
+
+        Args:
+            resolve_func (callable): Maps a domain to its mail hosts, raising OSError
+                if it can't receive mail and TransientLookupError if the lookup was
+                inconclusive (defaults to `make_mail_resolver()`)
+            ttl (float): Seconds a domain with mail hosts is cached
+            negative_ttl (float): Seconds a domain that can't receive mail is cached
+            max_workers (int): Number of concurrent lookups
+            transient_ttl (float): Seconds an inconclusive lookup is cached
+        """
+        self.cache = DNSCache(ttl=ttl, negative_ttl=negative_ttl, max_workers=max_workers,
+                              resolve_func=resolve_func or make_mail_resolver(), transient_ttl=transient_ttl)
+
+    def check_domains(self, domains):
+        """
+        Look up many domains concurrently.
+
+        Args:
+            domains (iterable): Email domains
+
+        Returns:
+            dict: Mapping of domain to DELIVERABLE, UNDELIVERABLE or UNKNOWN
+        """
+        domains = {domain for domain in domains if domain}
+        self.cache.prefetch(domains)
+        results = {}
+        for domain in domains:
+            hosts = self.cache.resolve(domain)
+            results[domain] = UNKNOWN if hosts is None else DELIVERABLE if hosts else UNDELIVERABLE
+        return results
+
+    def validate(self, leads, drop=False):
+        """
+        Mark each lead's email as deliverable, undeliverable or unknown, or drop the undeliverable ones.
+
+        Leads without an email are kept unchanged, and so are leads whose
+        domain couldn't be checked when dropping.
+
+        Args:
+            leads (list): List of lead dictionaries
+            drop (bool): Remove leads whose email domain can't receive mail
+                instead of marking them
+
+        Returns:
+            list: Leads with an "Email Status" field, or the leads that weren't dropped
+        """
+        results = self.check_domains(email_domain(lead.get('Email')) for lead in leads)
+
+        validated = []
+        for lead in leads:
+            domain = email_domain(lead.get('Email'))
+            if not domain:
+                validated.append(lead)
+            elif drop:
+                if results[domain] != UNDELIVERABLE:
+                    validated.append(lead)
+            else:
+                validated.append(dict(lead, **{'Email Status': results[domain]}))
+        return validated
+
+    def close(self):
+        """Shut down the lookup thread pool."""
+        self.cache.close()
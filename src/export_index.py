@@ -0,0 +1,184 @@
+import hashlib
+import os
+import sqlite3
+import threading
+from collections import namedtuple
+
+from lead_store import LEAD_FIELDS
+
+INSERT = 'insert'
+UPDATE = 'update'
+DELETE = 'delete'
+
+# Result of comparing leads against the index: changed leads, tombstones, and
+# the (key, fingerprint) of each change so `record` doesn't hash them again
+Delta = namedtuple('Delta', ['changes', 'tombstones', 'hashes'])
+
+
+def _digest(text):
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest()
+
+
+# Lead fields stored with each exported key, so tombstones can name the lead
+IDENTITY_FIELDS = ('Company Name', 'Website', 'Domain', 'Email')
+
+
+def lead_key(lead):
+    """
+    Return the 8-byte identity of a lead.
+
+    A lead with an email is identified by its domain and email. Leads
+    without one (often one per crawled page of the same domain) are told
+    apart by their website and company name as well.
+    """
+    domain, email = (str(lead.get(field) or '').lower() for field in ('Domain', 'Email'))
+    if email:
+        return _digest(f"{domain}|{email}")
+    website, company = (str(lead.get(field) or '').lower() for field in ('Website', 'Company Name'))
+    return _digest(f"{domain}||{website}|{company}")
+
+
+def lead_fingerprint(lead):
+    """Return an 8-byte hash of every exported field of a lead."""
+    return _digest("\x1f".join([str(lead.get(field) or '') for field in LEAD_FIELDS]))
+
+
+class ExportIndex:
+    """Remembers what was exported so later exports only carry the changes.
+
+    Each exported lead is stored as an 8-byte key (see `lead_key`) and an
+    8-byte hash of its fields, per export target. Comparing a new
+    run against the index yields inserts (unknown keys), updates (known
+    keys with a different hash) and, optionally, tombstones for previously
+    exported leads that are no longer present. Lookups go through the
+    primary key in batches, so checking against millions of prior leads
+    stays fast.
+    """
+
+    def __init__(self, path="data/exports.db", target="default"):
+        """
+        Open (or create) the export index.
+
+        Args:
+            path (str): Path to the SQLite database file, or ":memory:"
+            target (str): Name of the export destination; each target keeps its own history
+        """
+        if path != ":memory:":
+            directory = os.path.dirname(path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory, exist_ok=True)
+
+        self.target = target
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS exported (
+                    target TEXT NOT NULL,
+                    key BLOB NOT NULL,
+                    fingerprint BLOB NOT NULL,
+                    domain TEXT NOT NULL,
+                    email TEXT NOT NULL,
+                    website TEXT NOT NULL,
+                    company_name TEXT NOT NULL,
+                    PRIMARY KEY (target, key)
+                ) WITHOUT ROWID
+            """)
+
+    def close(self):
+        """Close the underlying database connection."""
+        self.conn.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._count()
+
+    def _count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM exported WHERE target = ?", (self.target,)).fetchone()[0]
+
+    def _lookup(self, keys, batch_size=500):
+        """Return the stored fingerprint for each of `keys` that was exported before."""
+        stored = {}
+        keys = list(keys)
+        for i in range(0, len(keys), batch_size):
+            batch = keys[i:i + batch_size]
+            rows = self.conn.execute(
+                f"SELECT key, fingerprint FROM exported WHERE target = ? AND key IN ({', '.join('?' for _ in batch)})",
+                [self.target] + batch
+            )
+            stored.update(rows)
+        return stored
+
+    def diff(self, leads, tombstones=False):
+        """
+        Compare leads with what was previously exported.
+
+        Small batches are looked up by key; large batches (or tombstone
+        detection) use a single scan of the target's index instead.
+
+        Args:
+            leads (list): List of lead dictionaries
+            tombstones (bool): Also report previously exported leads that are missing
+
+        Returns:
+            Delta: `changes` is a list of (INSERT or UPDATE, lead); `tombstones`
+                is a list of dictionaries of the `IDENTITY_FIELDS` of missing leads
+        """
+        # Later duplicates of the same lead identity win
+        current = {}
+        for lead in leads:
+            if isinstance(lead, dict) and 'error' not in lead:
+                current[lead_key(lead)] = lead
+
+        removed = []
+        with self._lock:
+            if tombstones:
+                stored = {}
+                for key, fingerprint, *identity in self.conn.execute(
+                        "SELECT key, fingerprint, company_name, website, domain, email FROM exported WHERE target = ?",
+                        (self.target,)):
+                    if key in current:
+                        stored[key] = fingerprint
+                    else:
+                        removed.append(dict(zip(IDENTITY_FIELDS, identity)))
+            elif len(current) * 4 >= self._count():
+                stored = {key: fingerprint for key, fingerprint in self.conn.execute(
+                    "SELECT key, fingerprint FROM exported WHERE target = ?", (self.target,)) if key in current}
+            else:
+                stored = self._lookup(current)
+
+        changes = []
+        hashes = []
+        for key, lead in current.items():
+            fingerprint = lead_fingerprint(lead)
+            previous = stored.get(key)
+            if previous == fingerprint:
+                continue
+            changes.append((INSERT if previous is None else UPDATE, lead))
+            hashes.append((key, fingerprint))
+        return Delta(changes, removed, hashes)
+
+    def record(self, delta):
+        """
+        Mark a delta as exported; call once the export has been written.
+
+        Args:
+            delta (Delta): Result of `diff`
+        """
+        rows = [
+            (self.target, key, fingerprint) + tuple(str(lead.get(field) or '') for field in IDENTITY_FIELDS)
+            for (key, fingerprint), (_, lead) in zip(delta.hashes, delta.changes)
+        ]
+        # Writing in key order keeps B-tree inserts local
+        rows.sort(key=lambda row: row[1])
+        with self._lock:
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO exported (target, key, fingerprint, company_name, website, domain, email) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                self.conn.executemany(
+                    "DELETE FROM exported WHERE target = ? AND key = ?",
+                    [(self.target, lead_key(tombstone)) for tombstone in delta.tombstones]
+                )
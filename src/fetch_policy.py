@@ -0,0 +1,145 @@
+import os
+from collections import namedtuple
+from urllib.parse import urlparse
+
+import requests
+
+# File extensions that never contain lead data and should not enter the crawl
+BINARY_EXTENSIONS = frozenset({
+    '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx', '.odt',
+    '.zip', '.gz', '.tgz', '.bz2', '.xz', '.7z', '.rar', '.tar',
+    '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.svg', '.ico', '.tif', '.tiff',
+    '.mp3', '.mp4', '.m4a', '.wav', '.ogg', '.avi', '.mov', '.wmv', '.webm', '.mkv',
+    '.exe', '.msi', '.dmg', '.iso', '.apk', '.bin',
+    '.css', '.js', '.json', '.xml', '.rss', '.woff', '.woff2', '.ttf', '.eot',
+})
+
+# Content types that are parsed for leads
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+
+FetchResult = namedtuple('FetchResult', ['url', 'status_code', 'headers', 'content', 'text'])
+
+
+class ResponseRejected(Exception):
+    """Raised when a response is skipped by the fetch policy (not retried)."""
+
+
+class FetchPolicy:
+    """Decides which URLs are fetched and how much of each response is read."""
+
+    def __init__(self, max_bytes=2 * 1024 * 1024, allowed_content_types=HTML_CONTENT_TYPES,
+                 probe_with_head=False, chunk_size=64 * 1024):
+        """
+        Initialize the fetch policy.
+
+        Args:
+            max_bytes (int): Abort responses larger than this many bytes
+            allowed_content_types (tuple): Content types that are downloaded
+            probe_with_head (bool): Send a HEAD request before each GET to reject
+                unwanted responses without opening a body stream
+            chunk_size (int): Size of the chunks read from the response stream
+        """
+        self.max_bytes = max_bytes
+        self.allowed_content_types = tuple(allowed_content_types)
+        self.probe_with_head = probe_with_head
+        self.chunk_size = chunk_size
+
+    def is_crawlable_url(self, url):
+        """
+        Check whether a URL could point at an HTML page, based on its extension.
+
+        Args:
+            url (str): URL to check
+
+        Returns:
+            bool: False for URLs with an obviously binary file extension
+        """
+        extension = os.path.splitext(urlparse(url).path)[1].lower()
+        return extension not in BINARY_EXTENSIONS
+
+    def check_headers(self, headers):
+        """
+        Reject responses whose headers show they are not wanted.
+
+        Args:
+            headers (Mapping): Response headers
+
+        Raises:
+            ResponseRejected: If the content type or declared length is not allowed
+        """
+        content_type = headers.get('Content-Type', '')
+        media_type = content_type.split(';')[0].strip().lower()
+        # Servers that omit the content type are given the benefit of the doubt
+        if media_type and media_type not in self.allowed_content_types:
+            raise ResponseRejected(f"unsupported content type '{media_type}'")
+
+        content_length = headers.get('Content-Length')
+        if content_length and content_length.isdigit() and int(content_length) > self.max_bytes:
+            raise ResponseRejected(f"response of {content_length} bytes exceeds limit of {self.max_bytes}")
+
+    def probe(self, url, headers, timeout=10, session=None):
+        """
+        Check a URL with a HEAD request before downloading it.
+
+        Servers that don't support HEAD are not penalized; the streamed GET
+        applies the same checks once headers arrive.
+
+        Args:
+            url (str): URL to probe
+            headers (dict): Request headers
+            timeout (int): Request timeout in seconds
+            session (requests.Session): Session to send the request with
+                (defaults to a one-off request)
+
+        Raises:
+            ResponseRejected: If the probe shows the response is not wanted
+        """
+        response = (session or requests).head(url, headers=headers, timeout=timeout, allow_redirects=True)
+        if response.ok:
+            self.check_headers(response.headers)
+
+    def fetch(self, url, headers, timeout=10, session=None):
+        """
+        Fetch a URL, streaming the body and stopping at the size limit.
+
+        Args:
+            url (str): URL to fetch
+            headers (dict): Request headers
+            timeout (int): Request timeout in seconds
+            session (requests.Session): Session to send the request with
+                (defaults to a one-off request)
+
+        Returns:
+            FetchResult: The decoded response
+
+        Raises:
+            requests.exceptions.RequestException: On network or HTTP errors
+            ResponseRejected: If the response is skipped by the policy
+        """
+        if self.probe_with_head:
+            self.probe(url, headers, timeout, session)
+
+        response = (session or requests).get(url, headers=headers, timeout=timeout, stream=True)
+        try:
+            response.raise_for_status()  # Raise exception for 4XX/5XX responses
+            self.check_headers(response.headers)
+
+            chunks = []
+            size = 0
+            for chunk in response.iter_content(chunk_size=self.chunk_size):
+                size += len(chunk)
+                if size > self.max_bytes:
+                    raise ResponseRejected(f"response exceeds limit of {self.max_bytes} bytes")
+                chunks.append(chunk)
+            content = b''.join(chunks)
+
+            encoding = response.encoding or 'utf-8'
+            try:
+                text = content.decode(encoding, errors='replace')
+            except LookupError:
+                # Unknown charset in the Content-Type header
+                text = content.decode('utf-8', errors='replace')
+
+            return FetchResult(response.url or url, response.status_code, dict(response.headers), content, text)
+        finally:
+            response.close()
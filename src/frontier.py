@@ -0,0 +1,221 @@
+import hashlib
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+from collections import OrderedDict, deque
+from urllib.parse import urlparse
+
+
+# URL paths of pages that usually carry company or contact details
+LEAD_PAGE_PATTERN = re.compile(
+    r'about|contact|team|people|staff|leadership|management|company|imprint|impressum|careers|locations?',
+    re.IGNORECASE
+)
+
+
+def _url_key(url):
+    """Return a compact fixed-size key for a URL in the seen set."""
+    return hashlib.blake2b(url.encode('utf-8'), digest_size=12).digest()
+
+
+class CrawlFrontier:
+    """A crawl frontier with a fixed in-memory budget that spills to SQLite.
+
+    Up to `memory_budget` pending URLs are held in memory, grouped by host
+    and handed out round-robin across hosts so no single site monopolizes
+    the crawl. Further URLs are appended to an on-disk queue indexed by
+    host, and are read back in batches once the in-memory queue drains
+    below half its budget. The set of URLs already seen, and the number
+    admitted per host, are kept on disk as well, so memory use stays
+    constant however large the crawl grows.
+    """
+
+    def __init__(self, memory_budget=10000, path=None, max_per_host=None, spill_batch=500,
+                 lead_page_pattern=LEAD_PAGE_PATTERN):
+        """
+        Open a frontier.
+
+        Args:
+            memory_budget (int): Maximum number of pending URLs held in memory
+            path (str): SQLite file for spilled URLs and the seen set (defaults to
+                a temporary file that is removed on close)
+            max_per_host (int): Maximum number of URLs admitted per host
+            spill_batch (int): Number of spilled URLs written to disk at a time
+            lead_page_pattern (re.Pattern): URL paths matching this are fully parsed for leads
+        """
+        self.memory_budget = memory_budget
+        self.max_per_host = max_per_host
+        self.spill_batch = spill_batch
+        self.lead_page_pattern = lead_page_pattern
+        self._temporary = path is None
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix='frontier-', suffix='.db')
+            os.close(fd)
+        self.path = path
+
+        self._hosts = OrderedDict()  # host -> deque of (url, depth), in round-robin order
+        self._in_memory = 0
+        self._spill_buffer = []
+        self._on_disk = 0
+        self._lock = threading.Lock()
+
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        # The frontier is scratch state; durability isn't worth the fsyncs
+        self.conn.execute("PRAGMA journal_mode = OFF")
+        self.conn.execute("PRAGMA synchronous = OFF")
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS queue (
+                    id INTEGER PRIMARY KEY,
+                    host TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    depth INTEGER NOT NULL
+                )
+            """)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_queue_host ON queue (host)")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS seen (key BLOB PRIMARY KEY) WITHOUT ROWID")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS hosts (host TEXT PRIMARY KEY, admitted INTEGER NOT NULL)")
+        self._on_disk = self.conn.execute("SELECT COUNT(*) FROM queue").fetchone()[0]
+
+    def __len__(self):
+        return self._in_memory + len(self._spill_buffer) + self._on_disk
+
+    @property
+    def memory_size(self):
+        """Number of pending URLs held in memory (at most `memory_budget` + `spill_batch`)."""
+        return self._in_memory + len(self._spill_buffer)
+
+    def _admit(self, url, host):
+        """Record a URL as seen and count it against its host; False if rejected."""
+        cursor = self.conn.execute("INSERT OR IGNORE INTO seen (key) VALUES (?)", (_url_key(url),))
+        if cursor.rowcount == 0:
+            return False
+        if self.max_per_host is not None:
+            self.conn.execute("INSERT OR IGNORE INTO hosts (host, admitted) VALUES (?, 0)", (host,))
+            cursor = self.conn.execute(
+                "UPDATE hosts SET admitted = admitted + 1 WHERE host = ? AND admitted < ?",
+                (host, self.max_per_host)
+            )
+            if cursor.rowcount == 0:
+                return False
+        return True
+
+    def is_lead_page(self, url, depth):
+        """
+        Decide whether a page is worth a full parse for leads.
+
+        Seed pages and pages whose path looks like an about, contact or team
+        page are; other pages are only scanned for links.
+
+        Args:
+            url (str): Page URL
+            depth (int): Link depth from the seed URL
+
+        Returns:
+            bool: True if the page should be fully parsed
+        """
+        return depth == 0 or bool(self.lead_page_pattern.search(urlparse(url).path))
+
+    def push(self, url, depth=0):
+        """
+        Add a URL to the frontier unless it was seen before or its host is full.
+
+        Args:
+            url (str): URL to crawl
+            depth (int): Link depth from the seed URL
+
+        Returns:
+            bool: True if the URL was queued
+        """
+        host = urlparse(url).netloc
+        with self._lock:
+            if not self._admit(url, host):
+                return False
+
+            if self._in_memory < self.memory_budget and not self._on_disk and not self._spill_buffer:
+                self._hosts.setdefault(host, deque()).append((url, depth))
+                self._in_memory += 1
+            else:
+                # Once anything has spilled, later URLs queue behind it on disk
+                self._spill_buffer.append((host, url, depth))
+                if len(self._spill_buffer) >= self.spill_batch:
+                    self._flush()
+            return True
+
+    def _flush(self):
+        """Write buffered overflow URLs to the on-disk queue."""
+        if self._spill_buffer:
+            with self.conn:
+                self.conn.executemany("INSERT INTO queue (host, url, depth) VALUES (?, ?, ?)", self._spill_buffer)
+            self._on_disk += len(self._spill_buffer)
+            self._spill_buffer = []
+
+    def _refill(self):
+        """Move the oldest spilled URLs back into memory, up to the budget."""
+        self._flush()
+        room = self.memory_budget - self._in_memory
+        if room <= 0 or not self._on_disk:
+            return
+        rows = self.conn.execute("SELECT id, host, url, depth FROM queue ORDER BY id LIMIT ?", (room,)).fetchall()
+        if not rows:
+            return
+        with self.conn:
+            self.conn.execute("DELETE FROM queue WHERE id <= ?", (rows[-1][0],))
+        for _, host, url, depth in rows:
+            self._hosts.setdefault(host, deque()).append((url, depth))
+        self._in_memory += len(rows)
+        self._on_disk -= len(rows)
+
+    def pop(self):
+        """
+        Take the next URL, rotating across hosts.
+
+        Returns:
+            tuple: (url, depth), or None if the frontier is empty
+        """
+        with self._lock:
+            if self._in_memory <= self.memory_budget // 2 and (self._on_disk or self._spill_buffer):
+                self._refill()
+            if not self._hosts:
+                return None
+
+            host, queue = self._hosts.popitem(last=False)
+            item = queue.popleft()
+            if queue:
+                self._hosts[host] = queue
+            self._in_memory -= 1
+            return item
+
+    def drop_host(self, host):
+        """
+        Discard every pending URL for a host, e.g. once its circuit breaker opens.
+
+        Returns:
+            int: Number of URLs discarded
+        """
+        with self._lock:
+            self._flush()
+            dropped = len(self._hosts.pop(host, ()))
+            self._in_memory -= dropped
+            with self.conn:
+                cursor = self.conn.execute("DELETE FROM queue WHERE host = ?", (host,))
+            self._on_disk -= cursor.rowcount
+            return dropped + cursor.rowcount
+
+    def close(self):
+        """Close the frontier, removing its file if it was temporary."""
+        with self._lock:
+            if not self._temporary:
+                self._flush()
+                self.conn.commit()
+            self.conn.close()
+            if self._temporary and os.path.exists(self.path):
+                os.remove(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
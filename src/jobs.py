@@ -0,0 +1,214 @@
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from scraper import LeadScraper
+from email_validation import EmailDomainValidator
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class ScrapeJob:
+    """A scrape running in the background, with progress and partial results."""
+
+    def __init__(self, url, max_pages=1, respect_robots_txt=True, filter_options=None, session_id=None,
+                 verify_email_domains=False, clock=time.time):
+        """
+        Initialize the job.
+
+        Args:
+            url (str): URL to scrape
+            max_pages (int): Maximum number of pages to scrape
+            respect_robots_txt (bool): Whether to check and respect robots.txt rules
+            filter_options (dict): Keyword arguments passed to `LeadScraper.filter_leads`
+            session_id (str): Identifier of the session that owns the job
+            verify_email_domains (bool): Drop leads whose email domain can't receive mail
+            clock (callable): Wall-clock time source for `created_at`
+        """
+        self.id = uuid.uuid4().hex[:12]
+        self.url = url
+        self.max_pages = max_pages
+        self.respect_robots_txt = respect_robots_txt
+        self.filter_options = filter_options or {}
+        self.session_id = session_id
+        self.verify_email_domains = verify_email_domains
+        self.status = QUEUED
+        self.pages_fetched = 0
+        self.leads = []
+        self.filtered_leads = []
+        self.analysis = {}
+        self.error = None
+        self.created_at = clock()
+        self.started_at = None
+        self.finished_at = None
+        self._lock = threading.Lock()
+
+    def record_page(self, url, page_leads):
+        """Page callback: record a fetched page and its leads as they stream in."""
+        with self._lock:
+            self.pages_fetched += 1
+            self.leads.extend(page_leads)
+
+    def snapshot(self):
+        """
+        Return a consistent copy of the job's state for display.
+
+        Returns:
+            dict: Job status, progress counters and results
+        """
+        with self._lock:
+            return {
+                'id': self.id,
+                'url': self.url,
+                'max_pages': self.max_pages,
+                'status': self.status,
+                'pages_fetched': self.pages_fetched,
+                'leads_found': len(self.leads),
+                'leads': list(self.leads),
+                'filtered_leads': list(self.filtered_leads),
+                'analysis': dict(self.analysis),
+                'error': self.error,
+                'created_at': self.created_at,
+                'started_at': self.started_at,
+                'finished_at': self.finished_at,
+            }
+
+
+class JobRunner:
+    """Runs scrape jobs on a thread pool so the UI never blocks on a crawl.
+
+    A single runner is shared by all Streamlit sessions (via
+    ``st.cache_resource``); jobs are tagged with the session that started
+    them so each session can list and poll its own jobs. Finished jobs hold
+    their full results, so they are forgotten after `finished_ttl` seconds,
+    and each session keeps at most `max_finished_per_session` of them.
+    """
+
+    def __init__(self, max_workers=4, lead_store=None, scraper_factory=None, scheduler=None,
+                 email_validator=None, finished_ttl=3600, max_finished_per_session=10, clock=time.time):
+        """
+        Initialize the runner.
+
+        Args:
+            max_workers (int): Number of jobs that run concurrently
+            lead_store (LeadStore): Store that cleaned leads are saved to when a job finishes
+            scraper_factory (callable): Creates a LeadScraper for a job, given its
+                `respect_robots_txt` setting
+            scheduler (CrawlScheduler): Shared scheduler the jobs' requests go through;
+                jobs are registered as interactive so they run ahead of batch crawls
+            email_validator (EmailDomainValidator): Domain lookups shared by all jobs
+                (created on demand)
+            finished_ttl (float): Seconds a finished job is kept
+            max_finished_per_session (int): Finished jobs kept per session; older ones are dropped
+            clock (callable): Wall-clock time source (injectable for tests)
+        """
+        self.lead_store = lead_store
+        self.scheduler = scheduler
+        self.email_validator = email_validator
+        self.finished_ttl = finished_ttl
+        self.max_finished_per_session = max_finished_per_session
+        self.clock = clock
+        self.scraper_factory = scraper_factory or (
+            lambda respect_robots_txt: LeadScraper(respect_robots_txt=respect_robots_txt, fast_start=True)
+        )
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scrape-job")
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, url, max_pages=1, respect_robots_txt=True, filter_options=None, session_id=None,
+               verify_email_domains=False):
+        """
+        Start a scrape in the background.
+
+        Returns:
+            str: Job identifier
+        """
+        job = ScrapeJob(url, max_pages, respect_robots_txt, filter_options, session_id, verify_email_domains,
+                        clock=self.clock)
+        with self._lock:
+            self._evict_finished()
+            self._jobs[job.id] = job
+        self._executor.submit(self._run, job)
+        return job.id
+
+    def get(self, job_id):
+        """Return a job by identifier, or None."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs_for(self, session_id):
+        """Return a session's jobs, oldest first."""
+        with self._lock:
+            self._evict_finished()
+            jobs = [job for job in self._jobs.values() if job.session_id == session_id]
+        return sorted(jobs, key=lambda job: job.created_at)
+
+    def discard(self, job_id):
+        """Forget a finished job."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and job.status in (DONE, FAILED):
+                del self._jobs[job_id]
+
+    def _evict_finished(self):
+        """Forget expired finished jobs, and each session's oldest beyond the cap (lock held)."""
+        now = self.clock()
+        kept = {}
+        # Newest first, so the per-session cap drops the oldest jobs
+        for job in reversed(list(self._jobs.values())):
+            if job.finished_at is None:
+                continue
+            kept[job.session_id] = kept.get(job.session_id, 0) + 1
+            if now - job.finished_at > self.finished_ttl or kept[job.session_id] > self.max_finished_per_session:
+                del self._jobs[job.id]
+
+    def _run(self, job):
+        """Run a job to completion on a worker thread."""
+        with job._lock:
+            job.status = RUNNING
+            job.started_at = self.clock()
+
+        try:
+            scraper = self.scraper_factory(job.respect_robots_txt)
+            scraper.page_callback = job.record_page
+            if self.scheduler is not None:
+                self.scheduler.register(job.id, interactive=True)
+                scraper.scheduler = self.scheduler
+                scraper.job_id = job.id
+            result = scraper.scrape_website(job.url, max_pages=job.max_pages)
+
+            if isinstance(result, dict) and 'error' in result:
+                with job._lock:
+                    job.status = FAILED
+                    job.error = result['error']
+                return
+
+            cleaned = scraper.validate_and_clean_data(result)
+            if job.verify_email_domains:
+                if self.email_validator is None:
+                    self.email_validator = EmailDomainValidator()
+                scraper.email_validator = self.email_validator
+                cleaned = scraper.validate_email_domains(cleaned, drop=True)
+            if self.lead_store is not None:
+                self.lead_store.upsert_leads(cleaned)
+            filtered = scraper.filter_leads(cleaned, **job.filter_options)
+            analysis = scraper.analyze_leads(filtered)
+
+            with job._lock:
+                job.leads = list(result)
+                job.filtered_leads = filtered
+                job.analysis = analysis
+                job.status = DONE
+        except Exception as e:
+            with job._lock:
+                job.status = FAILED
+                job.error = f"An unexpected error occurred: {str(e)}"
+        finally:
+            if self.scheduler is not None:
+                self.scheduler.unregister(job.id)
+            with job._lock:
+                job.finished_at = self.clock()
@@ -0,0 +1,359 @@
+import os
+import re
+import sqlite3
+import threading
+
+# Lead dictionary keys and the SQLite columns they are stored in
+LEAD_FIELDS = {
+    'Company Name': 'company_name',
+    'Website': 'website',
+    'Domain': 'domain',
+    'Description': 'description',
+    'Industry/Keywords': 'industry_keywords',
+    'Contact Name': 'contact_name',
+    'Job Title': 'job_title',
+    'Email': 'email',
+    'Phone': 'phone',
+    'Location': 'location',
+}
+
+# Columns that make up the identity of a lead for cross-run deduplication.
+# An empty email is treated as "not found yet" rather than as a distinct
+# identity; see `LeadStore._match_identity`.
+KEY_COLUMNS = ('domain', 'email', 'company_name')
+
+_COLUMNS = list(LEAD_FIELDS.values())
+_DOMAIN, _EMAIL, _COMPANY = (_COLUMNS.index(column) for column in ('domain', 'email', 'company_name'))
+
+
+def _escape_like(term):
+    """Escape LIKE wildcards so user terms are matched literally."""
+    return term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def _regexp(pattern, value):
+    """SQLite REGEXP implementation matching `filter_leads` semantics."""
+    if value is None:
+        return False
+    return re.search(pattern, value, re.IGNORECASE) is not None
+
+
+class LeadStore:
+    """A local SQLite store for leads that persists across scraping runs.
+
+    One connection is shared by every thread using the store (app sessions
+    and background scrape jobs), so each statement and transaction runs
+    under a lock.
+    """
+
+    def __init__(self, path="data/leads.db"):
+        """
+        Open (or create) the lead store.
+
+        Args:
+            path (str): Path to the SQLite database file, or ":memory:"
+        """
+        if path != ":memory:":
+            directory = os.path.dirname(path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.create_function("REGEXP", 2, _regexp, deterministic=True)
+        self._create_schema()
+
+    def _create_schema(self):
+        """Create the leads table and its lookup indexes if missing."""
+        columns = ",\n".join(f"{column} TEXT NOT NULL DEFAULT ''" for column in LEAD_FIELDS.values())
+        with self._lock, self.conn:
+            self.conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS leads (
+                    id INTEGER PRIMARY KEY,
+                    {columns},
+                    first_seen REAL NOT NULL DEFAULT (julianday('now')),
+                    last_seen REAL NOT NULL DEFAULT (julianday('now'))
+                )
+            """)
+            self.conn.execute(
+                f"CREATE UNIQUE INDEX IF NOT EXISTS idx_leads_identity ON leads ({', '.join(KEY_COLUMNS)})"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_leads_domain ON leads (domain)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_leads_email ON leads (email) WHERE email != ''")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_leads_company ON leads (company_name COLLATE NOCASE)")
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self):
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM leads").fetchone()[0]
+
+    def _row_to_lead(self, row):
+        """Convert a database row back into a lead dictionary."""
+        return {field: row[column] for field, column in LEAD_FIELDS.items()}
+
+    def _select_leads(self, sql, params=()):
+        """Run a query under the lock and return its rows as lead dictionaries."""
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [self._row_to_lead(row) for row in rows]
+
+    def upsert_leads(self, leads, batch_size=500):
+        """
+        Insert leads, merging field values into existing rows with the same identity.
+
+        Non-empty incoming values overwrite stored values; empty incoming values
+        never erase data collected in an earlier run. A lead whose email was
+        missing in an earlier run is updated in place once the email appears.
+        Leads are written in batched transactions.
+
+        Args:
+            leads (list): List of lead dictionaries
+            batch_size (int): Number of leads written per transaction
+
+        Returns:
+            int: Number of leads written
+        """
+        if not leads:
+            return 0
+
+        columns = _COLUMNS
+        updates = ",\n".join(
+            f"{column} = CASE WHEN excluded.{column} != '' THEN excluded.{column} ELSE leads.{column} END"
+            for column in columns if column not in KEY_COLUMNS
+        )
+        sql = f"""
+            INSERT INTO leads ({', '.join(columns)})
+            VALUES ({', '.join('?' for _ in columns)})
+            ON CONFLICT ({', '.join(KEY_COLUMNS)}) DO UPDATE SET
+            {updates},
+            last_seen = julianday('now')
+        """
+
+        written = 0
+        batch = []
+        for lead in leads:
+            # Skip leads with error messages
+            if not isinstance(lead, dict) or 'error' in lead:
+                continue
+            batch.append(tuple(str(lead.get(field) or '') for field in LEAD_FIELDS))
+            if len(batch) >= batch_size:
+                self._write_batch(sql, batch)
+                written += len(batch)
+                batch = []
+
+        if batch:
+            self._write_batch(sql, batch)
+            written += len(batch)
+
+        return written
+
+    def _write_batch(self, sql, batch):
+        """Upsert a batch of lead rows in one transaction."""
+        with self._lock, self.conn:
+            for row in batch:
+                self.conn.execute(sql, self._match_identity(row))
+
+    def _match_identity(self, row):
+        """
+        Line up a lead row's email with the stored lead it should merge into.
+
+        A lead with an email adopts the company's stored email-less row, so the
+        first run's lead gains the email instead of a duplicate appearing. A
+        lead without an email merges into the company's email-less row if there
+        is one, otherwise into its oldest row with an email.
+
+        Args:
+            row (tuple): Column values in `LEAD_FIELDS` order
+
+        Returns:
+            tuple: The row, with the email of its merge target
+        """
+        domain, email, company = row[_DOMAIN], row[_EMAIL], row[_COMPANY]
+        if email:
+            self.conn.execute("""
+                UPDATE leads SET email = ?
+                WHERE domain = ? AND email = '' AND company_name = ?
+                  AND NOT EXISTS (SELECT 1 FROM leads WHERE domain = ? AND email = ? AND company_name = ?)
+            """, (email, domain, company, domain, email, company))
+            return row
+
+        existing = self.conn.execute(
+            "SELECT email FROM leads WHERE domain = ? AND company_name = ? ORDER BY email != '', id LIMIT 1",
+            (domain, company)
+        ).fetchone()
+        if existing is None or not existing['email']:
+            return row
+        row = list(row)
+        row[_EMAIL] = existing['email']
+        return tuple(row)
+
+    def find_by_domain(self, domain):
+        """
+        Look up all stored leads for a domain.
+
+        Args:
+            domain (str): Domain (netloc) to look up
+
+        Returns:
+            list: Lead dictionaries for the domain
+        """
+        return self._select_leads("SELECT * FROM leads WHERE domain = ? ORDER BY id", (domain,))
+
+    def find_by_email(self, email):
+        """
+        Look up all stored leads with the given email address.
+
+        Args:
+            email (str): Email address to look up
+
+        Returns:
+            list: Lead dictionaries with that email
+        """
+        return self._select_leads("SELECT * FROM leads WHERE email = ? AND email != '' ORDER BY id", (email,))
+
+    def find_by_company(self, company_name):
+        """
+        Look up stored leads by company name (case-insensitive).
+
+        Args:
+            company_name (str): Company name to look up
+
+        Returns:
+            list: Lead dictionaries for the company
+        """
+        return self._select_leads(
+            "SELECT * FROM leads WHERE company_name = ? COLLATE NOCASE ORDER BY id", (company_name,)
+        )
+
+    def contains_domain(self, domain):
+        """Return True if any lead for the domain has been stored."""
+        with self._lock:
+            row = self.conn.execute("SELECT 1 FROM leads WHERE domain = ? LIMIT 1", (domain,)).fetchone()
+        return row is not None
+
+    def all_leads(self):
+        """Return every stored lead in insertion order."""
+        return self._select_leads("SELECT * FROM leads ORDER BY id")
+
+    def filter_leads(self, keywords=None, exclude_keywords=None, min_data_points=3, advanced_filters=None):
+        """
+        Filter stored leads in SQL using the same criteria as `LeadScraper.filter_leads`.
+
+        Args:
+            keywords (list): Keywords to include
+            exclude_keywords (list): Keywords to exclude
+            min_data_points (int): Minimum number of non-empty fields required
+            advanced_filters (dict): Advanced filtering options (field-specific criteria)
+
+        Returns:
+            list: Filtered leads
+        """
+        clauses = []
+        params = []
+
+        # Minimum data points: count non-empty lead columns
+        non_empty = " + ".join(f"({column} != '')" for column in LEAD_FIELDS.values())
+        clauses.append(f"({non_empty}) >= ?")
+        params.append(min_data_points)
+
+        # Keyword search runs over all lead fields joined together
+        all_text = " || ' ' || ".join(LEAD_FIELDS.values())
+        if keywords:
+            clauses.append("(" + " OR ".join(f"({all_text}) LIKE ? ESCAPE '\\'" for _ in keywords) + ")")
+            params.extend(f"%{_escape_like(k)}%" for k in keywords)
+        if exclude_keywords:
+            for k in exclude_keywords:
+                clauses.append(f"({all_text}) NOT LIKE ? ESCAPE '\\'")
+                params.append(f"%{_escape_like(k)}%")
+
+        if advanced_filters:
+            for field, criteria in advanced_filters.items():
+                column = LEAD_FIELDS.get(field)
+                if column is None:
+                    continue
+                if 'contains' in criteria:
+                    clauses.append("(" + " OR ".join(f"{column} LIKE ? ESCAPE '\\'" for _ in criteria['contains']) + ")")
+                    params.extend(f"%{_escape_like(c)}%" for c in criteria['contains'])
+                if 'not_contains' in criteria:
+                    for c in criteria['not_contains']:
+                        clauses.append(f"{column} NOT LIKE ? ESCAPE '\\'")
+                        params.append(f"%{_escape_like(c)}%")
+                if 'regex' in criteria:
+                    clauses.append(f"{column} REGEXP ?")
+                    params.append(criteria['regex'])
+
+        sql = f"SELECT * FROM leads WHERE {' AND '.join(clauses)} ORDER BY id"
+        return self._select_leads(sql, params)
+
+    def analyze_leads(self):
+        """
+        Compute the same statistics as `LeadScraper.analyze_leads` using SQL aggregates.
+
+        Returns:
+            dict: Analysis results
+        """
+        with self._lock:
+            totals = self.conn.execute("""
+                SELECT COUNT(*),
+                       COALESCE(SUM(email != ''), 0),
+                       COALESCE(SUM(phone != ''), 0),
+                       COALESCE(SUM(contact_name != ''), 0),
+                       COALESCE(SUM(job_title != ''), 0)
+                FROM leads
+            """).fetchone()
+            keyword_rows = self.conn.execute(
+                "SELECT industry_keywords FROM leads WHERE industry_keywords != ''"
+            ).fetchall()
+            domain_rows = self.conn.execute(
+                "SELECT domain, COUNT(*) FROM leads WHERE domain != '' GROUP BY domain ORDER BY MIN(id)"
+            ).fetchall()
+        total, with_email, with_phone, with_contact_name, with_job_title = totals
+
+        if not total:
+            return {"total": 0}
+
+        analysis = {
+            "total": total,
+            "with_email": with_email,
+            "with_phone": with_phone,
+            "with_contact_name": with_contact_name,
+            "with_job_title": with_job_title,
+            "industries": {},
+            "domains": {},
+        }
+
+        # Industries are stored comma-separated, so they are split in Python
+        for (keywords,) in keyword_rows:
+            for industry in keywords.split(','):
+                industry = industry.strip()
+                if industry:
+                    analysis["industries"][industry] = analysis["industries"].get(industry, 0) + 1
+
+        for domain, count in domain_rows:
+            analysis["domains"][domain] = count
+
+        analysis["top_industries"] = sorted(
+            analysis["industries"].items(),
+            key=lambda x: x[1],
+            reverse=True
+        )[:5]
+
+        analysis["top_domains"] = sorted(
+            analysis["domains"].items(),
+            key=lambda x: x[1],
+            reverse=True
+        )[:5]
+
+        return analysis
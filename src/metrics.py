@@ -0,0 +1,231 @@
+import functools
+import json
+import threading
+import time
+
+# Histogram bucket upper bounds, in seconds
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+class Histogram:
+    """A cumulative histogram of observed durations."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        """Record a single observation."""
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def cumulative_counts(self):
+        """Return (upper bound, cumulative count) pairs, ending with +Inf."""
+        pairs = []
+        running = 0
+        for bound, count in zip(self.buckets, self.counts):
+            running += count
+            pairs.append((bound, running))
+        pairs.append((float('inf'), self.count))
+        return pairs
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'buckets': {str(bound): count for bound, count in self.cumulative_counts()},
+        }
+
+
+class _Timer:
+    """Context manager that records its elapsed time into a Metrics instance."""
+
+    __slots__ = ('metrics', 'stage', 'host', 'start')
+
+    def __init__(self, metrics, stage, host):
+        self.metrics = metrics
+        self.stage = stage
+        self.host = host
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.metrics.observe(self.stage, time.perf_counter() - self.start, self.host)
+        return False
+
+
+class Metrics:
+    """Collects per-stage timings and counters for a scraper.
+
+    Timings are kept as histograms keyed by stage and, where known, host.
+    Results can be exported as JSON or in the Prometheus text format.
+    """
+
+    enabled = True
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, prefix="leadscraper"):
+        """
+        Initialize an empty metrics collection.
+
+        Args:
+            buckets (tuple): Histogram bucket upper bounds in seconds
+            prefix (str): Prefix for exported Prometheus metric names
+        """
+        self.buckets = buckets
+        self.prefix = prefix
+        self.histograms = {}  # (stage, host) -> Histogram
+        self.counters = {}  # (name, host) -> int
+        self._lock = threading.Lock()
+
+    def timer(self, stage, host=None):
+        """
+        Time a block of code.
+
+        Args:
+            stage (str): Stage name, e.g. "fetch" or "parse"
+            host (str): Optional host the stage ran against
+
+        Returns:
+            Context manager recording the elapsed time
+        """
+        return _Timer(self, stage, host or '')
+
+    def observe(self, stage, seconds, host=None):
+        """Record a duration for a stage."""
+        key = (stage, host or '')
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    def increment(self, name, amount=1, host=None):
+        """Increase a counter."""
+        key = (name, host or '')
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def to_dict(self):
+        """
+        Return all metrics as plain data.
+
+        Returns:
+            dict: Stage histograms and counters, grouped by host
+        """
+        with self._lock:
+            return {
+                'stages': [
+                    dict(stage=stage, host=host, **histogram.to_dict())
+                    for (stage, host), histogram in sorted(self.histograms.items())
+                ],
+                'counters': [
+                    {'name': name, 'host': host, 'value': value}
+                    for (name, host), value in sorted(self.counters.items())
+                ],
+            }
+
+    def to_json(self):
+        """Return all metrics as a JSON string."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_prometheus(self):
+        """Return all metrics in the Prometheus text exposition format."""
+        def labels(**values):
+            pairs = [f'{key}="{value}"' for key, value in values.items() if value != '']
+            return "{" + ",".join(pairs) + "}" if pairs else ""
+
+        name = f"{self.prefix}_stage_duration_seconds"
+        lines = [f"# TYPE {name} histogram"]
+        with self._lock:
+            for (stage, host), histogram in sorted(self.histograms.items()):
+                for bound, count in histogram.cumulative_counts():
+                    le = "+Inf" if bound == float('inf') else repr(float(bound))
+                    lines.append(f"{name}_bucket{labels(stage=stage, host=host, le=le)} {count}")
+                lines.append(f"{name}_sum{labels(stage=stage, host=host)} {histogram.sum}")
+                lines.append(f"{name}_count{labels(stage=stage, host=host)} {histogram.count}")
+
+            for counter in sorted({counter for counter, _ in self.counters}):
+                lines.append(f"# TYPE {self.prefix}_{counter}_total counter")
+                for (other, host), value in sorted(self.counters.items()):
+                    if other == counter:
+                        lines.append(f"{self.prefix}_{counter}_total{labels(host=host)} {value}")
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        """
+        Write metrics to a file: JSON for ".json" paths, Prometheus text otherwise.
+
+        Args:
+            path (str): Output file path
+
+        Returns:
+            str: The path written
+        """
+        content = self.to_json() if path.endswith('.json') else self.to_prometheus()
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+
+class _NullTimer:
+    """A no-op timer shared by all disabled metrics calls."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class NullMetrics:
+    """A metrics sink that records nothing, used when instrumentation is disabled."""
+
+    enabled = False
+
+    def timer(self, stage, host=None):
+        return _NULL_TIMER
+
+    def observe(self, stage, seconds, host=None):
+        pass
+
+    def increment(self, name, amount=1, host=None):
+        pass
+
+
+NULL_METRICS = NullMetrics()
+
+
+def timed(stage):
+    """
+    Decorate a method so its run time is recorded in `self.metrics` under `stage`.
+
+    Args:
+        stage (str): Stage name
+
+    Returns:
+        Decorator for instance methods
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            metrics = self.metrics
+            if not metrics.enabled:
+                return func(self, *args, **kwargs)
+            with metrics.timer(stage):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
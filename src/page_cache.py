@@ -0,0 +1,135 @@
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def content_hash(body, namespace=""):
+    """
+    Hash a response body after normalizing insignificant whitespace.
+
+    Args:
+        body (str or bytes): Response body
+        namespace (str): Extra key material, e.g. the domain the page was served from
+
+    Returns:
+        str: Hex digest identifying the content
+    """
+    if isinstance(body, bytes):
+        body = body.decode('utf-8', errors='replace')
+    normalized = _WHITESPACE.sub(' ', body).strip()
+    digest = hashlib.sha256()
+    digest.update(namespace.encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(normalized.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class PageCache:
+    """A content-addressed cache for page extraction results.
+
+    Entries live in an in-memory LRU and, if a cache directory is given,
+    are also written to disk so they survive across runs.
+    """
+
+    def __init__(self, max_entries=1024, cache_dir=None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int): Maximum number of entries kept in memory
+            cache_dir (str): Optional directory for the on-disk layer
+        """
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        with self._lock:
+            if key in self._entries:
+                return True
+        return self.cache_dir is not None and os.path.exists(self._disk_path(key))
+
+    def _disk_path(self, key):
+        """Return the on-disk location of an entry, sharded by key prefix."""
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def _remember(self, key, value):
+        """Insert an entry into the in-memory LRU, evicting the oldest if full."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key):
+        """
+        Look up a cached entry.
+
+        Args:
+            key (str): Content hash
+
+        Returns:
+            The cached value, or None if not cached
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+        if self.cache_dir:
+            try:
+                with open(self._disk_path(key), 'r', encoding='utf-8') as f:
+                    value = json.load(f)
+            except (OSError, ValueError):
+                value = None
+            if value is not None:
+                with self._lock:
+                    self._remember(key, value)
+                    self.hits += 1
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, value):
+        """
+        Store an entry. Values must be JSON-serializable when a cache directory is used.
+
+        Args:
+            key (str): Content hash
+            value: Value to cache
+        """
+        with self._lock:
+            self._remember(key, value)
+
+        if self.cache_dir:
+            path = self._disk_path(key)
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(value, f)
+                os.replace(tmp_path, path)
+            except OSError:
+                # The disk layer is best-effort; the in-memory entry is still valid
+                pass
+
+    def clear(self):
+        """Drop all in-memory entries."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,254 @@
+import cProfile
+import json
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+from collections import Counter
+
+# Functions that mark pipeline stages, mapped to the stage they represent
+STAGE_FUNCTIONS = {
+    'scrape_website': 'crawl',
+    '_check_robots_txt': 'robots',
+    'fetch': 'fetch',
+    '_parse_html': 'parse',
+    '_extract_company_info': 'extract_company',
+    '_extract_contact_info': 'extract_contact',
+    '_extract_structured_data': 'extract_structured',
+    '_filter_internal_links': 'links',
+    'validate_and_clean_data': 'clean',
+    'validate_email_domains': 'validate_email',
+    'filter_leads': 'filter',
+    'analyze_leads': 'analyze',
+    'export_to_csv': 'export',
+}
+
+# Selector and regex calls reported by `top_calls`
+HOT_CALL_PATTERN = re.compile(r'^(select|select_one|find|find_all|findall|finditer|search|match|sub)$')
+
+
+def _frame_label(code):
+    """Format a code object as a flame-graph frame label."""
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class ProfileSession:
+    """Profiles a block of scraper work and writes per-stage reports.
+
+    Two modes are supported:
+
+    - ``cprofile``: deterministic profiling with cProfile. Writes a ``.prof``
+      file that snakeviz, flameprof or gprof2dot can render as a flame graph.
+    - ``sampling``: samples the profiled thread's stack every ``interval``
+      seconds with much lower overhead. Writes a ``.folded`` file of collapsed
+      stacks for flamegraph.pl or speedscope.
+
+    Both modes write a summary with time per stage and the top selector and
+    regex calls made from ``_extract_contact_info``.
+    """
+
+    def __init__(self, mode='cprofile', output_dir=None, name='scrape', interval=0.005, top_n=15):
+        """
+        Initialize the session.
+
+        Args:
+            mode (str): "cprofile" or "sampling"
+            output_dir (str): Directory reports are written to when the session ends
+                (nothing is written if None)
+            name (str): Prefix for report file names
+            interval (float): Seconds between samples in sampling mode
+            top_n (int): Number of hot calls included in the summary
+        """
+        if mode not in ('cprofile', 'sampling'):
+            raise ValueError(f"Unknown profiling mode: {mode}")
+        self.mode = mode
+        self.output_dir = output_dir
+        self.name = name
+        self.interval = interval
+        self.top_n = top_n
+        self.elapsed = 0.0
+        self.paths = {}
+        self._profiler = None
+        self._stats = None
+        self._samples = Counter()  # tuple of frame labels (root first) -> count
+        self._hot_samples = Counter()
+        self._sampler = None
+        self._stop_event = threading.Event()
+        self._started_at = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        if self.output_dir:
+            self.write()
+        return False
+
+    def start(self):
+        """Start profiling the current thread."""
+        self._started_at = time.perf_counter()
+        if self.mode == 'cprofile':
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        else:
+            self._stop_event.clear()
+            self._sampler = threading.Thread(
+                target=self._sample_loop, args=(threading.get_ident(),), name="profile-sampler", daemon=True
+            )
+            self._sampler.start()
+
+    def stop(self):
+        """Stop profiling."""
+        if self.mode == 'cprofile':
+            if self._profiler is not None:
+                self._profiler.disable()
+                self._stats = pstats.Stats(self._profiler)
+                self._profiler = None
+        elif self._sampler is not None:
+            self._stop_event.set()
+            self._sampler.join()
+            self._sampler = None
+        if self._started_at is not None:
+            self.elapsed = time.perf_counter() - self._started_at
+            self._started_at = None
+
+    def _sample_loop(self, thread_id):
+        """Periodically record the stack of the profiled thread."""
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(thread_id)
+            if frame is None:
+                continue
+            codes = []
+            while frame is not None:
+                codes.append(frame.f_code)
+                frame = frame.f_back
+            codes.reverse()
+            self._record_sample(codes)
+
+    def _record_sample(self, codes):
+        """Record one sampled stack (root first) and any hot call on it."""
+        self._samples[tuple(_frame_label(code) for code in codes)] += 1
+
+        # Selector/regex calls made directly by the contact extractor
+        for caller, callee in zip(codes, codes[1:]):
+            if caller.co_name == '_extract_contact_info' and HOT_CALL_PATTERN.match(callee.co_name):
+                self._hot_samples[_frame_label(callee)] += 1
+
+    def stage_times(self):
+        """
+        Return the time spent in each pipeline stage.
+
+        Stage times are inclusive, so nested stages (e.g. parse within
+        crawl) are also counted in their parent.
+
+        Returns:
+            dict: Stage name to seconds
+        """
+        times = {}
+        if self.mode == 'cprofile':
+            if self._stats is None:
+                return times
+            for (filename, line, function), (cc, nc, tt, ct, callers) in self._stats.stats.items():
+                stage = STAGE_FUNCTIONS.get(function)
+                if stage:
+                    times[stage] = times.get(stage, 0.0) + ct
+        else:
+            # A sample counts once towards every stage on its stack, so times are inclusive
+            for stack, count in self._samples.items():
+                seen = set()
+                for label in stack:
+                    stage = STAGE_FUNCTIONS.get(label.split(' ', 1)[0])
+                    if stage and stage not in seen:
+                        seen.add(stage)
+                        times[stage] = times.get(stage, 0.0) + count * self.interval
+        return times
+
+    def top_calls(self, n=None, caller='_extract_contact_info', pattern=HOT_CALL_PATTERN):
+        """
+        Return the most expensive selector and regex calls made by a function.
+
+        Args:
+            n (int): Number of calls to return (defaults to `top_n`)
+            caller (str): Name of the calling function
+            pattern (re.Pattern): Pattern matched against callee names
+
+        Returns:
+            list: (call label, number of calls or samples, seconds) tuples, slowest first
+        """
+        n = n or self.top_n
+        calls = []
+        if self.mode == 'cprofile':
+            if self._stats is None:
+                return calls
+            for (filename, line, function), (cc, nc, tt, ct, callers) in self._stats.stats.items():
+                if not pattern.match(function):
+                    continue
+                for (caller_file, caller_line, caller_name), edge in callers.items():
+                    if caller_name == caller:
+                        label = f"{function} ({os.path.basename(filename)}:{line})"
+                        calls.append((label, edge[1], edge[3]))
+        elif caller == '_extract_contact_info' and pattern is HOT_CALL_PATTERN:
+            calls = [(label, count, count * self.interval) for label, count in self._hot_samples.items()]
+        calls.sort(key=lambda call: call[2], reverse=True)
+        return calls[:n]
+
+    def summary(self):
+        """
+        Return a human-readable report of stage times and hot calls.
+
+        Returns:
+            str: Report text
+        """
+        lines = [f"Profile '{self.name}' ({self.mode}, {self.elapsed:.3f}s wall)", "", "Time per stage (inclusive):"]
+        for stage, seconds in sorted(self.stage_times().items(), key=lambda item: item[1], reverse=True):
+            lines.append(f"  {stage:<16} {seconds:9.4f}s")
+        lines.append("")
+        lines.append("Top selector/regex calls in _extract_contact_info:")
+        for label, count, seconds in self.top_calls():
+            lines.append(f"  {seconds:9.4f}s  {count:>7}  {label}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, output_dir=None):
+        """
+        Write the profile and its summary to disk.
+
+        Args:
+            output_dir (str): Directory to write to (defaults to `output_dir`)
+
+        Returns:
+            dict: Paths of the written files, keyed by kind
+        """
+        output_dir = output_dir or self.output_dir or '.'
+        os.makedirs(output_dir, exist_ok=True)
+        base = os.path.join(output_dir, f"{self.name}-{int(time.time())}")
+
+        paths = {}
+        if self.mode == 'cprofile' and self._stats is not None:
+            paths['pstats'] = f"{base}.prof"
+            self._stats.dump_stats(paths['pstats'])
+        if self.mode == 'sampling':
+            paths['folded'] = f"{base}.folded"
+            with open(paths['folded'], 'w') as f:
+                for stack, count in sorted(self._samples.items()):
+                    f.write(f"{';'.join(stack)} {count}\n")
+
+        paths['summary'] = f"{base}.txt"
+        with open(paths['summary'], 'w') as f:
+            f.write(self.summary())
+
+        paths['stages'] = f"{base}.json"
+        with open(paths['stages'], 'w') as f:
+            json.dump({
+                'name': self.name,
+                'mode': self.mode,
+                'elapsed': self.elapsed,
+                'stages': self.stage_times(),
+                'top_calls': self.top_calls(),
+            }, f, indent=2)
+
+        self.paths = paths
+        return paths
@@ -0,0 +1,189 @@
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import urlparse
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+
+class RecrawlScheduler:
+    """Tracks per-page change history and decides which pages are due for a refetch.
+
+    Each fetch records the page's content hash. Pages that changed since the
+    previous fetch have their revisit interval halved; unchanged pages have it
+    grown by `backoff`, bounded by `min_interval` and `max_interval`. State is
+    kept in SQLite, by default in the same database file as the lead store.
+    """
+
+    def __init__(self, path="data/leads.db", initial_interval=DAY, min_interval=6 * HOUR,
+                 max_interval=60 * DAY, backoff=1.5, clock=time.time):
+        """
+        Open (or create) the scheduler state.
+
+        Args:
+            path (str): Path to the SQLite database file, or ":memory:"
+            initial_interval (float): Revisit interval in seconds for newly seen pages
+            min_interval (float): Shortest revisit interval in seconds
+            max_interval (float): Longest revisit interval in seconds
+            backoff (float): Factor the interval grows by when a page is unchanged
+            clock (callable): Wall-clock time source (injectable for tests)
+        """
+        if path != ":memory:":
+            directory = os.path.dirname(path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory, exist_ok=True)
+
+        self.initial_interval = initial_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.clock = clock
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS page_state (
+                    url TEXT PRIMARY KEY,
+                    host TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    last_fetch REAL NOT NULL,
+                    fetch_count INTEGER NOT NULL,
+                    change_count INTEGER NOT NULL,
+                    interval REAL NOT NULL,
+                    next_due REAL NOT NULL
+                )
+            """)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_page_state_due ON page_state (next_due)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_page_state_host ON page_state (host, next_due)")
+
+    def close(self):
+        """Close the underlying database connection."""
+        self.conn.close()
+
+    def record_fetch(self, url, content_hash, fetched_at=None):
+        """
+        Record a fetch of a page and schedule its next visit.
+
+        Args:
+            url (str): Page URL
+            content_hash (str): Hash of the fetched content
+            fetched_at (float): Fetch time (defaults to now)
+
+        Returns:
+            bool: True if the content changed since the previous fetch (or is new)
+        """
+        now = self.clock() if fetched_at is None else fetched_at
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT content_hash, fetch_count, change_count, interval FROM page_state WHERE url = ?", (url,)
+            ).fetchone()
+
+            if row is None:
+                changed, fetch_count, change_count, interval = True, 1, 0, self.initial_interval
+            else:
+                previous_hash, fetch_count, change_count, interval = row
+                fetch_count += 1
+                changed = previous_hash != content_hash
+                if changed:
+                    change_count += 1
+                    interval = max(self.min_interval, interval / 2)
+                else:
+                    interval = min(self.max_interval, interval * self.backoff)
+
+            with self.conn:
+                self.conn.execute("""
+                    INSERT OR REPLACE INTO page_state
+                        (url, host, content_hash, last_fetch, fetch_count, change_count, interval, next_due)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, (url, urlparse(url).netloc, content_hash, now, fetch_count, change_count,
+                      interval, now + interval))
+        return changed
+
+    def is_due(self, url, now=None):
+        """
+        Check whether a page should be fetched.
+
+        Args:
+            url (str): Page URL
+            now (float): Current time (defaults to now)
+
+        Returns:
+            bool: True if the page was never fetched or its next visit is due
+        """
+        now = self.clock() if now is None else now
+        with self._lock:
+            row = self.conn.execute("SELECT next_due FROM page_state WHERE url = ?", (url,)).fetchone()
+        return row is None or row[0] <= now
+
+    def is_site_due(self, url, now=None):
+        """
+        Check whether a site should be crawled because any of its pages is due.
+
+        Args:
+            url (str): Seed URL of the site
+            now (float): Current time (defaults to now)
+
+        Returns:
+            bool: True if the seed page or any known page on its host is due
+        """
+        now = self.clock() if now is None else now
+        if self.is_due(url, now):
+            return True
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM page_state WHERE host = ? AND next_due <= ? LIMIT 1", (urlparse(url).netloc, now)
+            ).fetchone()
+        return row is not None
+
+    def plan_batch(self, urls, now=None):
+        """
+        Keep only the sites with a page that is due, preserving their order.
+
+        Args:
+            urls (list): Candidate seed URLs
+            now (float): Current time (defaults to now)
+
+        Returns:
+            list: URLs whose sites should be crawled in this batch
+        """
+        now = self.clock() if now is None else now
+        return [url for url in urls if self.is_site_due(url, now)]
+
+    def due_urls(self, limit=None, now=None):
+        """
+        Return known URLs whose next visit is due, most overdue first.
+
+        Args:
+            limit (int): Maximum number of URLs to return
+            now (float): Current time (defaults to now)
+
+        Returns:
+            list: Due URLs
+        """
+        now = self.clock() if now is None else now
+        sql = "SELECT url FROM page_state WHERE next_due <= ? ORDER BY next_due"
+        params = [now]
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            return [row[0] for row in self.conn.execute(sql, params)]
+
+    def page_state(self, url):
+        """
+        Return the recorded state of a page.
+
+        Returns:
+            dict: Fetch history and schedule, or None for unknown pages
+        """
+        with self._lock:
+            row = self.conn.execute("""
+                SELECT content_hash, last_fetch, fetch_count, change_count, interval, next_due
+                FROM page_state WHERE url = ?
+            """, (url,)).fetchone()
+        if row is None:
+            return None
+        keys = ('content_hash', 'last_fetch', 'fetch_count', 'change_count', 'interval', 'next_due')
+        return dict(zip(keys, row))
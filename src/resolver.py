@@ -0,0 +1,202 @@
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+
+
+class TransientLookupError(Exception):
+    """Raised by a resolve function when a lookup failed without a definite answer.
+
+    For example a timeout or a SERVFAIL. Such lookups are cached only
+    briefly, and are reported as inconclusive rather than unresolvable.
+    """
+
+
+def _system_resolve(host):
+    """Resolve a host name with the system resolver, returning its addresses in preference order."""
+    infos = socket.getaddrinfo(host, None, proto=socket.IPPROTO_TCP)
+    # getaddrinfo sorts by RFC 6724 preference; keep that order while dropping duplicates
+    return list(dict.fromkeys(info[4][0] for info in infos))
+
+
+class DNSCache:
+    """An in-process DNS cache with negative caching and concurrent prefetching.
+
+    Lookups run on a thread pool so that the upcoming domains of a batch can
+    be resolved while earlier ones are being crawled. Hosts that fail to
+    resolve are cached as unresolvable for `negative_ttl` seconds.
+    """
+
+    def __init__(self, ttl=300, negative_ttl=60, max_workers=16, resolve_func=None, clock=time.monotonic,
+                 transient_ttl=5):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl (float): Seconds a successful lookup is cached
+            negative_ttl (float): Seconds a failed lookup is cached
+            max_workers (int): Number of concurrent lookups during prefetching
+            resolve_func (callable): Function mapping a host to a list of addresses,
+                raising OSError on failure, or TransientLookupError if the lookup
+                was inconclusive (defaults to the system resolver)
+            clock (callable): Monotonic time source (injectable for tests)
+            transient_ttl (float): Seconds an inconclusive lookup is cached
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_workers = max_workers
+        self.resolve_func = resolve_func or _system_resolve
+        self.clock = clock
+        self.transient_ttl = transient_ttl
+        self._entries = {}  # host -> (addresses, expires_at)
+        self._pending = {}  # host -> Future for in-flight lookups
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def _lookup(self, host):
+        """Run a lookup and cache the result (empty list on failure, None if inconclusive)."""
+        try:
+            addresses = list(self.resolve_func(host))
+            ttl = self.ttl if addresses else self.negative_ttl
+        except TransientLookupError:
+            addresses, ttl = None, self.transient_ttl
+        except (OSError, UnicodeError):
+            addresses, ttl = [], self.negative_ttl
+        with self._lock:
+            self._entries[host] = (addresses, self.clock() + ttl)
+            self._pending.pop(host, None)
+        return addresses
+
+    def _cached(self, host):
+        """Return the cache entry (addresses, expires_at) for a host, or None if missing or expired."""
+        entry = self._entries.get(host)
+        if entry is not None and entry[1] > self.clock():
+            return entry
+        return None
+
+    def resolve(self, host):
+        """
+        Resolve a host, using the cache and waiting on any in-flight prefetch.
+
+        Args:
+            host (str): Host name
+
+        Returns:
+            list: Resolved addresses (empty if the host doesn't resolve), or
+                None if the lookup was inconclusive
+        """
+        with self._lock:
+            entry = self._cached(host)
+            if entry is not None:
+                return entry[0]
+            future = self._pending.get(host)
+
+        if future is not None:
+            return future.result()
+        return self._lookup(host)
+
+    def is_resolvable(self, host):
+        """Return True if the host resolves to at least one address."""
+        return bool(self.resolve(host))
+
+    def prefetch(self, hosts):
+        """
+        Start resolving hosts in the background.
+
+        Hosts that are already cached or being resolved are skipped.
+
+        Args:
+            hosts (iterable): Host names to resolve
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="dns")
+            for host in hosts:
+                if not host or host in self._pending or self._cached(host) is not None:
+                    continue
+                self._pending[host] = self._executor.submit(self._lookup, host)
+
+    def close(self):
+        """Shut down the prefetch thread pool."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._pending.clear()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _resolving_connection_class(base, dns_cache):
+    """Subclass a urllib3 connection class to connect to addresses from `dns_cache`."""
+
+    class ResolvingConnection(base):
+        def _new_conn(self):
+            host = self._dns_host
+            addresses = dns_cache.resolve(host)
+            if not addresses:
+                # Let urllib3 raise its usual name resolution error
+                return super()._new_conn()
+            # TLS server name and certificate checks still use `self.host`
+            error = None
+            try:
+                for address in addresses:
+                    self._dns_host = address
+                    try:
+                        return super()._new_conn()
+                    except (NewConnectionError, ConnectTimeoutError) as e:
+                        error = e
+                raise error
+            finally:
+                self._dns_host = host
+
+    return ResolvingConnection
+
+
+class ResolvingAdapter(HTTPAdapter):
+    """A requests transport adapter whose connections use a DNSCache.
+
+    Without it, urllib3 resolves the host with a blocking system lookup on
+    every new connection. Here the cached (or prefetched) addresses are used
+    instead, tried in order until one accepts the connection.
+    """
+
+    def __init__(self, dns_cache, **kwargs):
+        """
+        Initialize the adapter.
+
+        Args:
+            dns_cache (DNSCache): Cache that supplies host addresses
+            **kwargs: Passed on to `HTTPAdapter`
+        """
+        self.dns_cache = dns_cache
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: type(pool.__name__, (pool,), {
+                'ConnectionCls': _resolving_connection_class(pool.ConnectionCls, self.dns_cache)
+            })
+            for scheme, pool in (('http', HTTPConnectionPool), ('https', HTTPSConnectionPool))
+        }
+
+
+def resolving_session(dns_cache):
+    """
+    Create a requests session whose connections resolve hosts through a DNSCache.
+
+    Args:
+        dns_cache (DNSCache): Cache that supplies host addresses
+
+    Returns:
+        requests.Session: Session with `ResolvingAdapter` mounted for http and https
+    """
+    session = requests.Session()
+    adapter = ResolvingAdapter(dns_cache)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
@@ -0,0 +1,118 @@
+import re
+from bisect import bisect_left
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text):
+    """Split text into lowercase alphanumeric tokens."""
+    return _TOKEN_PATTERN.findall(str(text).lower())
+
+
+class ResultIndex:
+    """An inverted index over a result set for fast search and sorting.
+
+    Every field value is split into tokens, and each token maps to the
+    positions of the leads containing it. A query matches leads that contain,
+    for every query token, some token starting with it; so "acme sal" finds
+    a lead whose email is sales@acme.com. Rows are identified by their
+    position in the original list, so callers can keep the leads themselves
+    and only pass row numbers around (e.g. to slice out one page).
+    """
+
+    def __init__(self, leads):
+        """
+        Build the index.
+
+        Args:
+            leads (list): List of lead dictionaries
+        """
+        self.leads = leads
+        postings = {}
+        for row, lead in enumerate(leads):
+            for value in lead.values():
+                for token in tokenize(value):
+                    rows = postings.setdefault(token, [])
+                    if not rows or rows[-1] != row:
+                        rows.append(row)
+        self._postings = postings
+        self._terms = sorted(postings)
+        self._sort_ranks = {}
+
+    def __len__(self):
+        return len(self.leads)
+
+    def _prefix_rows(self, prefix):
+        """Return the rows containing a token that starts with `prefix`."""
+        start = bisect_left(self._terms, prefix)
+        rows = set()
+        for term in self._terms[start:]:
+            if not term.startswith(prefix):
+                break
+            rows.update(self._postings[term])
+        return rows
+
+    def search(self, query):
+        """
+        Find the rows matching a search query.
+
+        Args:
+            query (str): Search terms; every term must match
+
+        Returns:
+            list: Matching row numbers in their original order
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            if not str(query).strip():
+                return list(range(len(self.leads)))
+            # Queries made only of punctuation fall back to a substring scan
+            needle = str(query).lower()
+            return [row for row, lead in enumerate(self.leads)
+                    if any(needle in str(value).lower() for value in lead.values())]
+
+        # Intersect the rarest terms first to keep the candidate set small
+        matches = None
+        for rows in sorted((self._prefix_rows(token) for token in set(tokens)), key=len):
+            matches = rows if matches is None else matches & rows
+            if not matches:
+                return []
+        return sorted(matches)
+
+    def sort(self, rows, column, descending=False):
+        """
+        Order rows by a column; empty values always sort last.
+
+        Args:
+            rows (list): Row numbers to order
+            column (str): Lead field to sort by
+            descending (bool): Whether to sort in descending order
+
+        Returns:
+            list: The ordered row numbers
+        """
+        ranks = self._sort_ranks.get(column)
+        if ranks is None:
+            # Rank every row once per column so later sorts are integer compares
+            order = sorted(range(len(self.leads)),
+                           key=lambda row: str(self.leads[row].get(column) or '').lower())
+            ranks = [0] * len(self.leads)
+            for rank, row in enumerate(order):
+                ranks[row] = rank
+            self._sort_ranks[column] = ranks
+
+        filled = [row for row in rows if self.leads[row].get(column)]
+        empty = [row for row in rows if not self.leads[row].get(column)]
+        return sorted(filled, key=ranks.__getitem__, reverse=descending) + empty
+
+    def query(self, query="", sort_by=None, descending=False):
+        """
+        Search and optionally sort in one step.
+
+        Returns:
+            list: Matching row numbers
+        """
+        rows = self.search(query)
+        if sort_by:
+            rows = self.sort(rows, sort_by, descending)
+        return rows
@@ -0,0 +1,184 @@
+import heapq
+import itertools
+import threading
+import time
+from collections import namedtuple
+
+INTERACTIVE = 0
+BATCH = 1
+
+Lease = namedtuple('Lease', ['job_id', 'host', 'granted_at'])
+
+
+class _Job:
+    """Per-job scheduling state."""
+
+    def __init__(self, weight, priority):
+        self.weight = weight
+        self.priority = priority
+        self.last_finish = 0.0
+        self.granted = 0
+
+
+class CrawlScheduler:
+    """Shares fetch capacity fairly between concurrent crawl jobs.
+
+    Every scraper that is given the scheduler asks it for a slot before each
+    request. Slots are granted in weighted fair queuing order: each request
+    is stamped with a virtual finish time that advances by ``1 / weight``
+    per request of its job, so a job with thousands of queued fetches can't
+    crowd out a job with one. Interactive jobs are always served before
+    batch jobs. Politeness is enforced across all jobs: a host has at most
+    one request in flight, and at least `politeness` seconds between the
+    end of one request and the start of the next.
+    """
+
+    def __init__(self, max_concurrent=8, politeness=2.0, clock=time.monotonic):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_concurrent (int): Maximum number of requests in flight across all jobs
+            politeness (float): Minimum seconds between requests to the same host
+            clock (callable): Monotonic time source (injectable for tests)
+        """
+        self.max_concurrent = max_concurrent
+        self.politeness = politeness
+        self.clock = clock
+        self._jobs = {}
+        self._waiting = []  # heap of (priority, finish tag, sequence, job_id, host)
+        self._granted = set()  # sequence numbers granted but not yet collected by their waiter
+        self._busy_hosts = set()
+        self._host_ready_at = {}
+        self._in_flight = 0
+        self._virtual_time = 0.0
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+
+    def register(self, job_id, weight=1.0, interactive=False):
+        """
+        Register a job, or update its weight and priority.
+
+        Args:
+            job_id (str): Job identifier
+            weight (float): Share of fetch capacity relative to other jobs of the same priority
+            interactive (bool): Serve this job ahead of all batch jobs
+        """
+        with self._condition:
+            job = self._jobs.get(job_id)
+            priority = INTERACTIVE if interactive else BATCH
+            if job is None:
+                self._jobs[job_id] = _Job(weight, priority)
+            else:
+                job.weight, job.priority = weight, priority
+
+    def unregister(self, job_id):
+        """Forget a finished job."""
+        with self._condition:
+            self._jobs.pop(job_id, None)
+
+    def stats(self):
+        """
+        Return scheduler state for monitoring.
+
+        Returns:
+            dict: Requests in flight, waiting requests and grants per job
+        """
+        with self._condition:
+            return {
+                'in_flight': self._in_flight,
+                'waiting': len(self._waiting),
+                'granted': {job_id: job.granted for job_id, job in self._jobs.items()},
+            }
+
+    def _next_grantable(self, now):
+        """
+        Find the first waiting request, in fair order, whose host can be fetched now.
+
+        Returns:
+            tuple: (heap entry or None, seconds until a host becomes ready or None)
+        """
+        retry_in = None
+        for entry in sorted(self._waiting):
+            host = entry[4]
+            if host in self._busy_hosts:
+                continue
+            ready_at = self._host_ready_at.get(host, 0.0)
+            if ready_at > now:
+                retry_in = ready_at - now if retry_in is None else min(retry_in, ready_at - now)
+                continue
+            return entry, retry_in
+        return None, retry_in
+
+    def _dispatch(self):
+        """Grant slots to waiting requests while capacity allows."""
+        retry_in = None
+        while self._in_flight < self.max_concurrent and self._waiting:
+            entry, retry_in = self._next_grantable(self.clock())
+            if entry is None:
+                break
+            self._waiting.remove(entry)
+            heapq.heapify(self._waiting)
+            _, finish, sequence, job_id, host = entry
+            self._virtual_time = max(self._virtual_time, finish)
+            self._busy_hosts.add(host)
+            self._in_flight += 1
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job.granted += 1
+            self._granted.add(sequence)
+            self._condition.notify_all()
+        return retry_in
+
+    def acquire(self, job_id, host):
+        """
+        Wait for a slot to fetch from `host` on behalf of a job.
+
+        Unknown jobs are registered as batch jobs with weight 1.
+
+        Args:
+            job_id (str): Job identifier
+            host (str): Host about to be fetched
+
+        Returns:
+            Lease: Slot to hand back to `release` once the request completes
+        """
+        with self._condition:
+            job = self._jobs.get(job_id)
+            if job is None:
+                job = self._jobs[job_id] = _Job(1.0, BATCH)
+
+            # Weighted fair queuing: a job's requests are spaced 1/weight apart in virtual time
+            start = max(self._virtual_time, job.last_finish)
+            job.last_finish = start + 1.0 / job.weight
+            sequence = next(self._sequence)
+            heapq.heappush(self._waiting, (job.priority, job.last_finish, sequence, job_id, host))
+
+            while sequence not in self._granted:
+                retry_in = self._dispatch()
+                if sequence in self._granted:
+                    break
+                self._condition.wait(retry_in)
+            self._granted.discard(sequence)
+            return Lease(job_id, host, self.clock())
+
+    def release(self, lease):
+        """
+        Return a slot after its request completes.
+
+        Args:
+            lease (Lease): Slot returned by `acquire`
+        """
+        with self._condition:
+            self._busy_hosts.discard(lease.host)
+            self._host_ready_at[lease.host] = self.clock() + self.politeness
+            self._in_flight -= 1
+
+            # Forget hosts whose politeness window has passed
+            if len(self._host_ready_at) > 4096:
+                now = self.clock()
+                self._host_ready_at = {host: ready_at for host, ready_at in self._host_ready_at.items()
+                                       if ready_at > now}
+
+            self._dispatch()
+            self._condition.notify_all()
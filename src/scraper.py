@@ -1,31 +1,129 @@
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
 import re
 import time
 import random
-from fake_useragent import UserAgent
 import validators
 from urllib.parse import urlparse, urljoin
 import os
 from urllib.robotparser import RobotFileParser
+from page_cache import PageCache, content_hash
+from fetch_policy import FetchPolicy, ResponseRejected
+from circuit_breaker import HostCircuitBreakers, RetryBudget, OPEN
+from resolver import DNSCache, resolving_session
+from user_agents import UserAgentPool
+from metrics import NULL_METRICS, timed
+from profiling import ProfileSession
+from structured_data import extract_structured_data
+from frontier import CrawlFrontier
+from export_index import DELETE
+from link_scanner import scan_hrefs
+from email_validation import EmailDomainValidator
+
+# pandas, bs4 and fake_useragent are imported on first use so that creating a
+# scraper (in short-lived workers and on every Streamlit rerun) stays cheap.
+
+def _parse_html(html):
+    """Parse HTML with BeautifulSoup, importing bs4 on first use."""
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(html, 'html.parser')
 
 class LeadScraper:
     """A class for scraping and processing lead data from websites."""
     
-    def __init__(self, respect_robots_txt=True):
+    def __init__(self, respect_robots_txt=True, page_cache=None, fetch_policy=None,
+                 circuit_breakers=None, retry_budget=None, resolver=None, fast_start=False,
+                 metrics=None, archive=None, recrawl_scheduler=None, lead_store=None,
+                 scheduler=None, job_id=None, email_validator=None):
         """
         Initialize the lead scraper with default settings.
         
         Args:
             respect_robots_txt (bool): Whether to check and respect robots.txt rules
+            page_cache (PageCache): Cache for extraction results keyed by page content
+                (defaults to an in-memory cache)
+            fetch_policy (FetchPolicy): Size limits and content-type gating for downloads
+            circuit_breakers (HostCircuitBreakers): Per-host breakers that short-circuit dead hosts
+            retry_budget (RetryBudget): Cap on retries as a fraction of all requests
+            resolver (DNSCache): DNS cache used to drop unresolvable hosts before fetching,
+                and to supply the addresses requests connect to (created on demand
+                by `scrape_batch`)
+            fast_start (bool): Use the bundled user agent pool instead of fake_useragent,
+                avoiding its data loading and any network access at startup
+            metrics (Metrics): Collects per-stage timings and counters (disabled by default)
+            archive (ResponseArchive): Records every fetched response for later replay
+            recrawl_scheduler (RecrawlScheduler): Tracks page changes so only pages that
+                are due get refetched
+            lead_store (LeadStore): Store that `scrape_batch` saves leads to, and serves
+                leads from for sites that aren't due for a recrawl
+            scheduler (CrawlScheduler): Shared scheduler that grants fetch slots fairly
+                across jobs and enforces per-host politeness (replaces `rate_limit`)
+            job_id (str): Job the scraper's requests are scheduled under
+            email_validator (EmailDomainValidator): Shared cache of email domain lookups used
+                by `validate_email_domains` (created on demand)
         """
-        self.user_agent = UserAgent()
+        if fast_start:
+            self.user_agent = UserAgentPool()
+        else:
+            from fake_useragent import UserAgent
+            self.user_agent = UserAgent()
         self.headers = {'User-Agent': self.user_agent.random}
+        self.host_user_agents = {}  # Cache of the user agent assigned to each host
         self.rate_limit = 2  # seconds between requests
         self.respect_robots_txt = respect_robots_txt
         self.robot_parsers = {}  # Cache for robot parsers
+        self.page_cache = page_cache if page_cache is not None else PageCache()
+        self.fetch_policy = fetch_policy if fetch_policy is not None else FetchPolicy()
+        self.circuit_breakers = circuit_breakers if circuit_breakers is not None else HostCircuitBreakers()
+        self.retry_budget = retry_budget if retry_budget is not None else RetryBudget()
+        self.resolver = resolver
+        self._session = None  # requests session bound to `self.resolver`
+        self.metrics = metrics if metrics is not None else NULL_METRICS
+        self.archive = archive
+        self.recrawl_scheduler = recrawl_scheduler
+        self.lead_store = lead_store
+        self.scheduler = scheduler
+        self.job_id = job_id
+        self.email_validator = email_validator
+        self.page_callback = None  # Called as page_callback(url, leads) after each page is scraped
+        self.pages_not_due = 0  # Linked pages skipped by the recrawl scheduler so far
+        self.not_due_urls = []  # URLs of those pages, for the site being scraped by `scrape_batch`
     
+    def _http_session(self):
+        """
+        Return a requests session that connects through the DNS cache.
+
+        Returns:
+            requests.Session: Session bound to `self.resolver`, or None without a resolver
+        """
+        if self.resolver is None:
+            return None
+        if self._session is None or self._session.get_adapter('https://').dns_cache is not self.resolver:
+            self._session = resolving_session(self.resolver)
+        return self._session
+
+    def _headers_for(self, host):
+        """
+        Return the request headers for a host, rotating user agents across hosts.
+
+        Each host keeps the user agent it was first given, so its robots.txt
+        rules are checked for the same agent that fetches its pages.
+
+        Args:
+            host (str): Host (netloc) being requested
+
+        Returns:
+            dict: Request headers
+        """
+        user_agent = self.host_user_agents.get(host)
+        if user_agent is None:
+            if isinstance(self.user_agent, UserAgentPool):
+                user_agent = self.user_agent.rotate()
+            else:
+                # fake_useragent has no round-robin rotation; it picks at random
+                user_agent = self.user_agent.random
+            self.host_user_agents[host] = user_agent
+        return dict(self.headers, **{'User-Agent': user_agent})
+
     def validate_url(self, url):
         """
         Validate if the provided URL is properly formatted.
@@ -63,14 +161,25 @@ class LeadScraper:
             rp = RobotFileParser()
             rp.set_url(robots_url)
             try:
-                rp.read()
+                session = self._http_session()
+                if session is None:
+                    rp.read()
+                else:
+                    # Fetched through the DNS cache, handling statuses as `RobotFileParser.read` does
+                    response = session.get(robots_url, headers=self._headers_for(parsed_url.netloc), timeout=10)
+                    if response.status_code in (401, 403):
+                        rp.disallow_all = True
+                    elif 400 <= response.status_code < 500:
+                        rp.allow_all = True
+                    elif response.status_code < 400:
+                        rp.parse(response.text.splitlines())
                 self.robot_parsers[base_url] = rp
             except Exception:
                 # If we can't read robots.txt, assume scraping is allowed
                 return True
         
         # Check if user agent is allowed to fetch the URL
-        user_agent = self.headers['User-Agent']
+        user_agent = self._headers_for(parsed_url.netloc)['User-Agent']
         return rp.can_fetch(user_agent, url)
     
     def scrape_website(self, url, max_pages=1, depth=0):
@@ -85,63 +194,327 @@ class LeadScraper:
         Returns:
             list: List of scraped lead data
         """
+        page = self._scrape_page(url, depth)
+        if isinstance(page, dict):
+            return page
+        page_leads, hrefs = page
+        leads = list(page_leads)
+        
+        try:
+            # Crawl additional pages if needed
+            if max_pages > 1 and depth < max_pages - 1:
+                # Find internal links
+                internal_links = self._filter_internal_links(hrefs, url)
+                
+                # Limit the number of links to process
+                internal_links = internal_links[:max_pages - 1]
+                
+                # Recursively scrape each link
+                for link in internal_links:
+                    link_leads = self.scrape_website(link, max_pages, depth + 1)
+                    if isinstance(link_leads, list):
+                        leads.extend(link_leads)
+            
+            return leads
+            
+        except Exception as e:
+            return {"error": f"An error occurred: {str(e)}"}
+    
+    def crawl(self, seed_urls, max_pages=100, max_depth=3, frontier=None):
+        """
+        Crawl breadth-first from seed URLs through a memory-bounded frontier.
+        
+        Unlike `scrape_website`, pending links are not held in Python lists:
+        they go through a `CrawlFrontier`, which keeps a fixed number in
+        memory and spills the rest to disk. Pages are yielded as they are
+        scraped, so memory use doesn't grow with the size of the crawl.
+        Only pages the frontier marks as likely to hold leads are fully
+        parsed; the rest are scanned for links without building a DOM.
+        
+        Args:
+            seed_urls (list): URLs to start from
+            max_pages (int): Maximum number of pages fetched per host
+            max_depth (int): Maximum link depth followed from a seed URL
+            frontier (CrawlFrontier): Frontier to use (defaults to a temporary one)
+            
+        Yields:
+            tuple: (url, list of lead dictionaries) for every page scraped
+        """
+        owns_frontier = frontier is None
+        if owns_frontier:
+            frontier = CrawlFrontier(max_per_host=max_pages)
+        
+        try:
+            for url in seed_urls:
+                frontier.push(url, 0)
+            
+            while True:
+                item = frontier.pop()
+                if item is None:
+                    break
+                url, depth = item
+                
+                # Pages unlikely to hold leads are only scanned for links
+                page = self._scrape_page(url, depth, extract=frontier.is_lead_page(url, depth))
+                if isinstance(page, dict):
+                    host = urlparse(url).netloc
+                    self.metrics.increment('crawl_errors', host=host)
+                    # Don't keep queueing work for a host that is known to be failing
+                    # (a read-only check; `allow` would claim a half-open trial slot)
+                    if self.circuit_breakers.state(host) == OPEN:
+                        frontier.drop_host(host)
+                    continue
+                
+                page_leads, hrefs = page
+                if depth < max_depth:
+                    for link in self._filter_internal_links(hrefs, url):
+                        frontier.push(link, depth + 1)
+                yield url, page_leads
+        finally:
+            if owns_frontier:
+                frontier.close()
+    
+    def _scrape_page(self, url, depth=0, extract=True):
+        """
+        Fetch a single page and extract its leads and links.
+        
+        Args:
+            url (str): The URL to scrape
+            depth (int): Current crawling depth
+            extract (bool): Parse the page for leads; if False, links are found
+                with a lightweight scan and no leads are extracted
+            
+        Returns:
+            tuple: (list of lead dictionaries, list of raw href values), or an
+                error dictionary
+        """
         if not self.validate_url(url):
             return {"error": "Invalid URL format"}
         
+        # Linked pages that haven't changed recently are left until their next visit is due
+        if depth > 0 and self.recrawl_scheduler is not None and not self.recrawl_scheduler.is_due(url):
+            self.pages_not_due += 1
+            self.not_due_urls.append(url)
+            self.metrics.increment('pages_not_due', host=urlparse(url).netloc)
+            return [], []
+        
+        # Drop hosts that don't resolve before spending any requests on them
+        if self.resolver is not None and not self.resolver.is_resolvable(urlparse(url).hostname):
+            return {"error": f"Could not resolve host for {url}"}
+        
+        host = urlparse(url).netloc
+        
         # Check if scraping is allowed by robots.txt
-        if not self._check_robots_txt(url):
+        with self.metrics.timer('robots', host):
+            allowed = self._check_robots_txt(url)
+        if not allowed:
             return {"error": "Scraping not allowed by robots.txt"}
         
-        leads = []
+        # Short-circuit hosts that have failed repeatedly
+        if not self.circuit_breakers.allow(host):
+            return {"error": f"Skipped {url}: {host} is failing, retrying after cooldown"}
         
         try:
-            # Apply rate limiting
-            time.sleep(self.rate_limit)
+            # Apply rate limiting (a shared scheduler enforces politeness instead)
+            if self.scheduler is None:
+                with self.metrics.timer('sleep', host):
+                    time.sleep(self.rate_limit)
             
             # Make request with error handling and retries
             response = None
             max_retries = 3
             for attempt in range(max_retries):
+                self.retry_budget.record_request()
+                self.metrics.increment('requests', host=host)
                 try:
-                    response = requests.get(url, headers=self.headers, timeout=10)
-                    response.raise_for_status()  # Raise exception for 4XX/5XX responses
+                    if self.scheduler is not None:
+                        with self.metrics.timer('queue', host):
+                            lease = self.scheduler.acquire(self.job_id, host)
+                    try:
+                        # Streams the body, enforcing size and content-type limits
+                        with self.metrics.timer('fetch', host):
+                            response = self.fetch_policy.fetch(url, self._headers_for(host), timeout=10,
+                                                               session=self._http_session())
+                    finally:
+                        if self.scheduler is not None:
+                            self.scheduler.release(lease)
+                    self.circuit_breakers.record_success(host)
+                    if self.archive is not None:
+                        self.archive.write_response(url, response.status_code, response.headers, response.content)
                     break
                 except requests.exceptions.RequestException as e:
-                    if attempt < max_retries - 1:
+                    self.metrics.increment('fetch_errors', host=host)
+                    status = e.response.status_code if e.response is not None else None
+                    if status is not None and 400 <= status < 500 and status not in (408, 429):
+                        # The host is up; client errors won't change on retry
+                        self.circuit_breakers.record_success(host)
+                        return {"error": f"Failed to access website: {str(e)}"}
+                    
+                    self.circuit_breakers.record_failure(host)
+                    if (attempt < max_retries - 1 and self.circuit_breakers.allow(host)
+                            and self.retry_budget.try_acquire()):
                         # Exponential backoff
                         wait_time = 2 ** attempt
-                        time.sleep(wait_time)
+                        self.metrics.increment('retries', host=host)
+                        with self.metrics.timer('sleep', host):
+                            time.sleep(wait_time)
                     else:
-                        return {"error": f"Failed to access website after {max_retries} attempts: {str(e)}"}
+                        return {"error": f"Failed to access website after {attempt + 1} attempts: {str(e)}"}
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # Extract leads and links (reused from the page cache for identical content)
+            key = content_hash(response.text, namespace=host)
+            if self.recrawl_scheduler is not None:
+                self.recrawl_scheduler.record_fetch(url, key)
+            if extract:
+                page_leads, hrefs = self._process_page(response.text, url, key)
+            else:
+                with self.metrics.timer('scan_links', host):
+                    page_leads, hrefs = [], scan_hrefs(response.text)
+            self.metrics.increment('pages_fetched', host=host)
+            self.metrics.increment('leads_extracted', len(page_leads), host=host)
+            if self.page_callback is not None:
+                self.page_callback(url, page_leads)
             
-            # Extract company information
-            company_leads = self._extract_company_info(soup, url)
-            leads.extend(company_leads)
+            return page_leads, hrefs
             
-            # Extract contact information for all leads
-            for lead in leads:
-                self._extract_contact_info(soup, lead)
+        except ResponseRejected as e:
+            # The host answered, so this doesn't count against its breaker
+            self.circuit_breakers.record_success(host)
+            return {"error": f"Skipped {url}: {str(e)}"}
+        except Exception as e:
+            return {"error": f"An error occurred: {str(e)}"}
+    
+    def profile(self, mode='cprofile', output_dir='profiles', name='scrape'):
+        """
+        Profile the scraper work done inside a `with` block.
+        
+        Example:
+            with scraper.profile(mode='sampling') as session:
+                scraper.scrape_website(url, max_pages=5)
+            print(session.summary())
+        
+        Args:
+            mode (str): "cprofile" for deterministic profiling or "sampling" for
+                low-overhead stack sampling
+            output_dir (str): Directory reports are written to when the block exits
+            name (str): Prefix for report file names
             
-            # Crawl additional pages if needed
-            if max_pages > 1 and depth < max_pages - 1:
-                # Find internal links
-                internal_links = self._find_internal_links(soup, url)
-                
-                # Limit the number of links to process
-                internal_links = internal_links[:max_pages - 1]
-                
-                # Recursively scrape each link
-                for link in internal_links:
-                    link_leads = self.scrape_website(link, max_pages, depth + 1)
-                    if isinstance(link_leads, list):
-                        leads.extend(link_leads)
+        Returns:
+            ProfileSession: Context manager collecting the profile
+        """
+        return ProfileSession(mode=mode, output_dir=output_dir, name=name)
+    
+    def scrape_batch(self, urls, max_pages=1, prefetch_window=32, profile_dir=None, profile_mode='cprofile'):
+        """
+        Scrape a batch of websites.
+        
+        Host names are resolved concurrently ahead of the crawl, so dead
+        domains are dropped without waiting on a lookup or using any retries.
+        With a recrawl scheduler, only sites with a page that is due are
+        crawled, and within them only the due pages are refetched. Sites
+        that aren't due are answered from the lead store, as are the pages
+        skipped within a crawled site. The store receives the cleaned leads
+        of every site that is scraped.
+        
+        Args:
+            urls (list): URLs to scrape
+            max_pages (int): Maximum number of pages to scrape per website
+            prefetch_window (int): Number of upcoming hosts resolved in advance
+            profile_dir (str): If set, profile the batch and write reports here
+            profile_mode (str): Profiling mode used with `profile_dir`
             
-            return leads
+        Returns:
+            dict: Mapping of URL to its list of leads or error dictionary
+        """
+        if profile_dir:
+            with self.profile(mode=profile_mode, output_dir=profile_dir, name='batch'):
+                return self.scrape_batch(urls, max_pages, prefetch_window)
+        
+        if self.resolver is None:
+            self.resolver = DNSCache()
+        
+        hosts = [urlparse(url).hostname for url in urls]
+        self.resolver.prefetch(hosts[:prefetch_window])
+        
+        due = set(self.recrawl_scheduler.plan_batch(urls)) if self.recrawl_scheduler is not None else None
+        
+        results = {}
+        for i, url in enumerate(urls):
+            # Keep the prefetch window ahead of the crawl
+            if i + prefetch_window < len(hosts):
+                self.resolver.prefetch([hosts[i + prefetch_window]])
             
-        except Exception as e:
-            return {"error": f"An error occurred: {str(e)}"}
+            if due is not None and url not in due:
+                stored = self.lead_store.find_by_domain(urlparse(url).netloc) if self.lead_store is not None else []
+                results[url] = stored
+                continue
+            
+            self.not_due_urls = []
+            results[url] = self.scrape_website(url, max_pages=max_pages)
+            if self.lead_store is not None and isinstance(results[url], list):
+                if self.not_due_urls:
+                    # Pages that weren't refetched keep the leads stored from earlier runs
+                    results[url] = results[url] + self._stored_leads_for_pages(urlparse(url).netloc, self.not_due_urls)
+                self.lead_store.upsert_leads(self.validate_and_clean_data(results[url]))
+        
+        return results
+    
+    def _stored_leads_for_pages(self, domain, page_urls):
+        """
+        Return the stored leads of a domain that were extracted from the given pages.
+
+        Args:
+            domain (str): Domain (netloc) of the site
+            page_urls (list): URLs of pages that weren't refetched
+
+        Returns:
+            list: Stored lead dictionaries whose Website is one of `page_urls`
+        """
+        page_urls = set(page_urls)
+        return [lead for lead in self.lead_store.find_by_domain(domain) if lead['Website'] in page_urls]
+    
+    def _process_page(self, html, url, key=None):
+        """
+        Parse a page and extract its leads and raw link targets.
+        
+        Results are memoized by a hash of the normalized page content, so a
+        page served under several URLs (or unchanged on refresh) is only
+        parsed once.
+        
+        Args:
+            html (str): Page body
+            url (str): URL the page was fetched from
+            key (str): Content hash of the page, if already computed
+            
+        Returns:
+            tuple: (list of lead dictionaries, list of raw href values)
+        """
+        if key is None:
+            key = content_hash(html, namespace=urlparse(url).netloc)
+        cached = self.page_cache.get(key)
+        if cached is not None:
+            # Copy cached leads so callers can't mutate the cache, and re-stamp the URL
+            leads = [dict(lead, Website=url) for lead in cached['leads']]
+            self.metrics.increment('page_cache_hits')
+            return leads, list(cached['hrefs'])
+        
+        with self.metrics.timer('parse', urlparse(url).netloc):
+            soup = _parse_html(html)
+        
+        # Exact values from JSON-LD, microdata and mailto:/tel: links come first
+        structured = self._extract_structured_data(soup)
+        
+        # Extract company information
+        leads = self._extract_company_info(soup, url, structured)
+        
+        # Extract contact information for all leads
+        for lead in leads:
+            self._extract_contact_info(soup, lead, structured)
+        
+        hrefs = [a_tag['href'] for a_tag in soup.find_all('a', href=True)]
+        
+        self.page_cache.put(key, {'leads': [dict(lead) for lead in leads], 'hrefs': hrefs})
+        return leads, hrefs
     
     def _find_internal_links(self, soup, base_url):
         """
@@ -151,6 +524,21 @@ class LeadScraper:
             soup (BeautifulSoup): Parsed HTML
             base_url (str): Base URL for resolving relative links
             
+        Returns:
+            list: List of internal URLs
+        """
+        hrefs = [a_tag['href'] for a_tag in soup.find_all('a', href=True)]
+        return self._filter_internal_links(hrefs, base_url)
+    
+    @timed('links')
+    def _filter_internal_links(self, hrefs, base_url):
+        """
+        Resolve raw href values and keep the internal ones.
+        
+        Args:
+            hrefs (list): Raw href attribute values
+            base_url (str): Base URL for resolving relative links
+            
         Returns:
             list: List of internal URLs
         """
@@ -158,58 +546,86 @@ class LeadScraper:
         base_domain = parsed_base.netloc
         
         internal_links = []
-        for a_tag in soup.find_all('a', href=True):
-            href = a_tag['href']
+        seen = set()
+        for href in hrefs:
             full_url = urljoin(base_url, href)
             
+            # Skip links to files that can't contain lead data (PDFs, images, archives)
+            if not self.fetch_policy.is_crawlable_url(full_url):
+                continue
+            
             # Check if it's an internal link
             parsed_url = urlparse(full_url)
             if parsed_url.netloc == base_domain and parsed_url.scheme in ('http', 'https'):
                 # Avoid duplicates and the current page
-                if full_url != base_url and full_url not in internal_links:
+                if full_url != base_url and full_url not in seen:
+                    seen.add(full_url)
                     internal_links.append(full_url)
         
         return internal_links
     
-    def _extract_company_info(self, soup, base_url):
+    @timed('extract_structured')
+    def _extract_structured_data(self, soup):
+        """
+        Extract lead fields from JSON-LD, microdata and mailto:/tel: links.
+        
+        Args:
+            soup (BeautifulSoup): Parsed HTML
+            
+        Returns:
+            dict: Lead fields that were found
+        """
+        structured = extract_structured_data(soup)
+        if structured:
+            self.metrics.increment('structured_data_fields', len(structured))
+        return structured
+    
+    @timed('extract_company')
+    def _extract_company_info(self, soup, base_url, structured=None):
         """
         Extract company information from the webpage.
         
         This method attempts to find company names, descriptions, and other
         company-specific information from various common HTML patterns.
+        Fields already present in `structured` are used as-is and their
+        heuristic passes are skipped.
         
         Args:
             soup (BeautifulSoup): Parsed HTML
             base_url (str): URL being scraped
+            structured (dict): Lead fields from structured data, if any
             
         Returns:
             list: List of lead dictionaries
         """
+        structured = structured or {}
         domain = urlparse(base_url).netloc
         leads = []
         
         # Company information might be in various elements
         # Try to find company name
-        potential_names = []
-        for tag in ['h1', 'h2', '.company-name', '.org-name', '[itemprop="name"]', '.logo alt']:
-            elements = soup.select(tag)
-            for element in elements:
-                if element.text.strip():
-                    potential_names.append(element.text.strip())
+        potential_names = [structured['Company Name']] if structured.get('Company Name') else []
+        if not potential_names:
+            for tag in ['h1', 'h2', '.company-name', '.org-name', '[itemprop="name"]', '.logo alt']:
+                elements = soup.select(tag)
+                for element in elements:
+                    if element.text.strip():
+                        potential_names.append(element.text.strip())
         
         # Try to find company description
-        descriptions = []
-        for tag in ['meta[name="description"]', 'meta[property="og:description"]', 
-                   '.company-description', '.about-us', '[itemprop="description"]']:
-            elements = soup.select(tag)
-            for element in elements:
-                if tag.startswith('meta'):
-                    content = element.get('content', '')
-                    if content:
-                        descriptions.append(content)
-                else:
-                    if element.text.strip():
-                        descriptions.append(element.text.strip())
+        descriptions = [structured['Description']] if structured.get('Description') else []
+        if not descriptions:
+            for tag in ['meta[name="description"]', 'meta[property="og:description"]', 
+                       '.company-description', '.about-us', '[itemprop="description"]']:
+                elements = soup.select(tag)
+                for element in elements:
+                    if tag.startswith('meta'):
+                        content = element.get('content', '')
+                        if content:
+                            descriptions.append(content)
+                    else:
+                        if element.text.strip():
+                            descriptions.append(element.text.strip())
         
         # Try to find industry/keywords
         keywords = []
@@ -237,43 +653,58 @@ class LeadScraper:
         leads.append(lead)
         return leads
     
-    def _extract_contact_info(self, soup, lead):
+    @timed('extract_contact')
+    def _extract_contact_info(self, soup, lead, structured=None):
         """
         Extract contact information from the webpage and update the lead.
         
+        Fields already present in `structured` are used as-is, and the
+        selector and whole-page regex passes for them are skipped.
+        
         Args:
             soup (BeautifulSoup): Parsed HTML
             lead (dict): Lead dictionary to update
+            structured (dict): Lead fields from structured data, if any
         """
+        structured = structured or {}
+        for field in ('Contact Name', 'Job Title', 'Email', 'Phone', 'Location'):
+            if structured.get(field):
+                lead[field] = structured[field]
+        
         # Try to find contact names (often in team/about sections)
         names = []
-        for tag in ['.team-member', '.employee', '[itemprop="employee"]', '.staff', '.contact-person']:
-            elements = soup.select(tag)
-            for element in elements:
-                name_element = element.select_one('.name') or element.select_one('h3') or element
-                if name_element and name_element.text.strip():
-                    names.append(name_element.text.strip())
+        if not lead['Contact Name']:
+            for tag in ['.team-member', '.employee', '[itemprop="employee"]', '.staff', '.contact-person']:
+                elements = soup.select(tag)
+                for element in elements:
+                    name_element = element.select_one('.name') or element.select_one('h3') or element
+                    if name_element and name_element.text.strip():
+                        names.append(name_element.text.strip())
         
         # Try to find emails using regex pattern
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        emails = re.findall(email_pattern, soup.text)
+        emails = []
+        if not lead['Email']:
+            email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+            emails = re.findall(email_pattern, soup.text)
         
         # Try to find phone numbers with various formats
-        phone_patterns = [
-            r'(\+\d{1,2}\s?)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}',  # US/Canada: (123) 456-7890
-            r'(\+\d{1,3}\s?)?(\d{1,4}[\s.-]?){2,4}',  # International: +44 20 1234 5678
-        ]
         phones = []
-        for pattern in phone_patterns:
-            phones.extend(re.findall(pattern, soup.text))
+        if not lead['Phone']:
+            phone_patterns = [
+                r'(\+\d{1,2}\s?)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}',  # US/Canada: (123) 456-7890
+                r'(\+\d{1,3}\s?)?(\d{1,4}[\s.-]?){2,4}',  # International: +44 20 1234 5678
+            ]
+            for pattern in phone_patterns:
+                phones.extend(re.findall(pattern, soup.text))
         
         # Try to find location
         locations = []
-        for tag in ['[itemprop="address"]', '.address', '.location', '.contact-info']:
-            elements = soup.select(tag)
-            for element in elements:
-                if element.text.strip():
-                    locations.append(element.text.strip())
+        if not lead['Location']:
+            for tag in ['[itemprop="address"]', '.address', '.location', '.contact-info']:
+                elements = soup.select(tag)
+                for element in elements:
+                    if element.text.strip():
+                        locations.append(element.text.strip())
         
         # Update the lead with contact information
         if names:
@@ -294,7 +725,7 @@ class LeadScraper:
             lead['Location'] = locations[0]
         
         # Try to find job titles near contact names
-        if lead['Contact Name']:
+        if lead['Contact Name'] and not lead['Job Title']:
             job_titles = []
             for tag in ['.job-title', '.title', '.position']:
                 elements = soup.select(tag)
@@ -304,6 +735,7 @@ class LeadScraper:
             if job_titles:
                 lead['Job Title'] = job_titles[0]
     
+    @timed('filter')
     def filter_leads(self, leads, keywords=None, exclude_keywords=None, min_data_points=3, advanced_filters=None):
         """
         Filter leads based on keywords and data quality.
@@ -367,6 +799,7 @@ class LeadScraper:
         
         return filtered_leads
     
+    @timed('clean')
     def validate_and_clean_data(self, leads):
         """
         Validate and clean lead data.
@@ -421,32 +854,79 @@ class LeadScraper:
         
         return cleaned_leads
     
-    def export_to_csv(self, leads, filename="leads.csv"):
+    @timed('validate_email')
+    def validate_email_domains(self, leads, drop=False):
+        """
+        Check that lead email domains can receive mail.
+        
+        Emails are grouped by domain and each domain's MX (or address)
+        records are looked up once, concurrently, through a shared cache.
+        
+        Args:
+            leads (list): List of lead dictionaries
+            drop (bool): Remove leads whose email domain can't receive mail
+                instead of marking them with an "Email Status" field (leads whose
+                domain couldn't be checked are kept)
+            
+        Returns:
+            list: Validated leads
+        """
+        if not leads:
+            return []
+        if self.email_validator is None:
+            self.email_validator = EmailDomainValidator()
+        return self.email_validator.validate(leads, drop=drop)
+    
+    @timed('export')
+    def export_to_csv(self, leads, filename="leads.csv", delta_index=None, tombstones=False):
         """
         Export leads to a CSV file.
         
+        In delta mode only leads that are new or changed since the previous
+        export through `delta_index` are written, with a leading "Change"
+        column ("insert", "update" or, for tombstones, "delete").
+        
         Args:
             leads (list): List of lead dictionaries
             filename (str): Output filename
+            delta_index (ExportIndex): Index of previously exported leads; enables delta mode
+            tombstones (bool): In delta mode, add "delete" rows for previously
+                exported leads that are no longer present
             
         Returns:
-            str: Path to the exported file or error message
+            str: Path to the exported file or error message (None if there is
+                nothing to export)
         """
         if not leads:
             return None
         
+        delta = None
+        if delta_index is not None:
+            delta = delta_index.diff(leads, tombstones=tombstones)
+            leads = [dict({'Change': change}, **lead) for change, lead in delta.changes]
+            leads += [dict({'Change': DELETE}, **tombstone) for tombstone in delta.tombstones]
+            if not leads:
+                return None
+        
         try:
             # Ensure directory exists
             directory = os.path.dirname(filename)
             if directory and not os.path.exists(directory):
                 os.makedirs(directory, exist_ok=True)
             
+            import pandas as pd
+            
             df = pd.DataFrame(leads)
             df.to_csv(filename, index=False)
+            
+            # Only remember the delta once it has actually been written
+            if delta is not None:
+                delta_index.record(delta)
             return filename
         except (PermissionError, OSError) as e:
             return f"Error writing to file: {str(e)}"
 
+    @timed('analyze')
     def analyze_leads(self, leads):
         """
         Perform basic analysis on the lead data.
@@ -0,0 +1,178 @@
+import json
+import re
+from urllib.parse import unquote
+
+# schema.org types treated as the company behind a page
+ORGANIZATION_TYPES = {
+    'Organization', 'Corporation', 'LocalBusiness', 'ProfessionalService', 'NGO',
+    'EducationalOrganization', 'MedicalOrganization', 'GovernmentOrganization',
+    'Store', 'OnlineBusiness', 'OnlineStore', 'Brand',
+}
+
+# Order in which PostalAddress parts are joined into a location string
+_ADDRESS_PARTS = ('streetAddress', 'addressLocality', 'addressRegion', 'postalCode', 'addressCountry')
+
+_NOREPLY_PREFIXES = ('noreply', 'no-reply', 'donotreply')
+
+
+def _types(node):
+    """Return the schema.org type names of a node, without URL prefixes."""
+    types = node.get('@type', [])
+    if isinstance(types, str):
+        types = [types]
+    return {str(t).rstrip('/').rsplit('/', 1)[-1] for t in types}
+
+
+def _first(value):
+    """Return the first item of a list value, or the value itself."""
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
+def _text(value):
+    """Return a property value as a stripped string ('' if it isn't text)."""
+    value = _first(value)
+    if isinstance(value, dict):
+        value = value.get('name') or value.get('@value')
+    return str(value).strip() if isinstance(value, (str, int, float)) else ''
+
+
+def _clean_email(value):
+    """Strip a mailto: prefix and query string from an email value."""
+    email = unquote(_text(value))
+    if email.lower().startswith('mailto:'):
+        email = email[7:]
+    email = email.split('?', 1)[0].strip()
+    if '@' not in email or email.lower().startswith(_NOREPLY_PREFIXES):
+        return ''
+    return email
+
+
+def _clean_phone(value):
+    """Strip a tel: prefix from a phone value."""
+    phone = unquote(_text(value))
+    if phone.lower().startswith('tel:'):
+        phone = phone[4:]
+    return phone.strip()
+
+
+def _format_address(value):
+    """Format a PostalAddress (or plain string) as a single line."""
+    value = _first(value)
+    if isinstance(value, dict):
+        parts = [_text(value.get(part)) for part in _ADDRESS_PARTS]
+        return ", ".join(part for part in parts if part)
+    return _text(value)
+
+
+def _walk(node):
+    """Yield every dict node in a JSON-LD document, including @graph members."""
+    if isinstance(node, list):
+        for item in node:
+            yield from _walk(item)
+    elif isinstance(node, dict):
+        yield node
+        for value in node.values():
+            if isinstance(value, (list, dict)):
+                yield from _walk(value)
+
+
+def _json_ld_nodes(soup):
+    """Parse every JSON-LD block on the page; malformed blocks are skipped."""
+    nodes = []
+    for script in soup.find_all('script', type='application/ld+json'):
+        try:
+            document = json.loads(script.string or '')
+        except ValueError:
+            continue
+        nodes.extend(_walk(document))
+    return nodes
+
+
+def _microdata_value(element):
+    """Return the value of an itemprop element, following the microdata rules."""
+    if element.has_attr('itemscope'):
+        return _microdata_item(element)
+    if element.name == 'meta':
+        return element.get('content', '')
+    if element.name in ('a', 'link', 'area'):
+        return element.get('href', '')
+    if element.has_attr('content'):
+        return element['content']
+    return element.get_text(" ", strip=True)
+
+
+def _microdata_item(scope):
+    """Collect the properties of an itemscope element into a JSON-LD style dict."""
+    item = {'@type': scope.get('itemtype', '').split()}
+    for element in scope.find_all(itemprop=True):
+        # Only direct properties: skip those belonging to a nested item
+        owner = element.find_parent(itemscope=True)
+        if owner is not scope:
+            continue
+        value = _microdata_value(element)
+        for name in element['itemprop'].split():
+            item.setdefault(name, []).append(value)
+    return item
+
+
+def _microdata_nodes(soup):
+    """Return every microdata item on the page, nested items included."""
+    return [_microdata_item(scope) for scope in soup.find_all(itemscope=True) if scope.get('itemtype')]
+
+
+def _apply_contact(fields, node):
+    """Fill email and phone from a node's own properties or its contact points."""
+    for candidate in [node] + [point for point in _walk(node.get('contactPoint', [])) if point is not node]:
+        if not fields.get('Email'):
+            fields['Email'] = _clean_email(candidate.get('email'))
+        if not fields.get('Phone'):
+            fields['Phone'] = _clean_phone(candidate.get('telephone'))
+
+
+def extract_structured_data(soup):
+    """
+    Extract lead fields from structured data embedded in a page.
+
+    JSON-LD blocks and microdata items are read for schema.org
+    Organization (and subtypes), Person and PostalAddress values, and
+    ``mailto:``/``tel:`` links are harvested for email and phone. Values
+    found here are exact, so the scraper skips its heuristic passes for any
+    field filled in.
+
+    Args:
+        soup (BeautifulSoup): Parsed HTML
+
+    Returns:
+        dict: Lead fields that were found (empty fields are omitted)
+    """
+    fields = {}
+    nodes = _json_ld_nodes(soup) + _microdata_nodes(soup)
+
+    for node in nodes:
+        types = _types(node)
+        if types & ORGANIZATION_TYPES:
+            fields.setdefault('Company Name', _text(node.get('name')))
+            fields.setdefault('Description', _text(node.get('description')))
+            fields.setdefault('Location', _format_address(node.get('address')))
+            _apply_contact(fields, node)
+        elif 'Person' in types:
+            fields.setdefault('Contact Name', _text(node.get('name')))
+            fields.setdefault('Job Title', _text(node.get('jobTitle')))
+            _apply_contact(fields, node)
+        elif 'PostalAddress' in types:
+            fields.setdefault('Location', _format_address(node))
+        # setdefault keeps empty strings; let later nodes fill them
+        fields = {name: value for name, value in fields.items() if value}
+
+    # Visible mailto:/tel: links are exact even when no markup describes them
+    for a_tag in soup.find_all('a', href=re.compile(r'^\s*(mailto|tel):', re.IGNORECASE)):
+        href = a_tag['href'].strip()
+        if href.lower().startswith('mailto:'):
+            if not fields.get('Email'):
+                fields['Email'] = _clean_email(href)
+        elif not fields.get('Phone'):
+            fields['Phone'] = _clean_phone(href)
+
+    return {name: value for name, value in fields.items() if value}
@@ -0,0 +1,90 @@
+import sys
+import os
+import gzip
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from archive import ResponseArchive, ArchiveReader, replay
+from fetch_policy import FetchResult
+from scraper import LeadScraper
+
+def make_page(name, keyword):
+    return (
+        f'<html><head><meta name="keywords" content="{keyword}"></head>'
+        f'<body>\n<h1>{name}</h1>\n<p>hello@{name.lower()}.com</p>\n'
+        f'<p class="address">1 Main St</p>\n</body></html>'
+    ).encode('utf-8')
+
+class TestResponseArchive(unittest.TestCase):
+    """Test cases for the response archive and replay."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_round_trip(self):
+        """Test that responses are read back exactly as written."""
+        body = make_page('Acme', 'software')
+        with ResponseArchive(self.directory) as archive:
+            archive.write_response("https://acme.com/", 200,
+                                   {'Content-Type': 'text/html; charset=utf-8', 'Content-Encoding': 'gzip'}, body)
+
+        reader = ArchiveReader(self.directory)
+        response = reader.get("https://acme.com/")
+        self.assertEqual(response.content, body)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Content-Type'], 'text/html; charset=utf-8')
+        # The body is stored decoded, so transfer encodings are dropped
+        self.assertNotIn('Content-Encoding', response.headers)
+        self.assertIsNone(reader.get("https://missing.com/"))
+        reader.close()
+
+        with open(os.path.join(self.directory, 'segment-00000.warc.gz'), 'rb') as f:
+            self.assertTrue(gzip.decompress(f.read()).startswith(b'WARC/1.0\r\n'))
+
+    def test_segments_roll_over(self):
+        """Test that new segments are started once the size limit is reached."""
+        with ResponseArchive(self.directory, segment_size=1) as archive:
+            for i in range(3):
+                archive.write_response(f"https://site{i}.com/", 200, {}, make_page(f'Site{i}', 'x'))
+        # Reopening continues after the newest segment
+        with ResponseArchive(self.directory, segment_size=1) as archive:
+            archive.write_response("https://site3.com/", 200, {}, make_page('Site3', 'x'))
+
+        segments = sorted(f for f in os.listdir(self.directory) if f.endswith('.warc.gz'))
+        self.assertEqual(len(segments), 4)
+        reader = ArchiveReader(self.directory)
+        self.assertEqual([r.url for r in reader], [f"https://site{i}.com/" for i in range(4)])
+        reader.close()
+
+    def test_scraper_records_and_replay(self):
+        """Test that scraping writes to the archive and replay re-extracts leads."""
+        archive = ResponseArchive(self.directory)
+        scraper = LeadScraper(respect_robots_txt=False, archive=archive, fast_start=True)
+        scraper.rate_limit = 0
+        for name, keyword in [('Acme', 'software'), ('Globex', 'retail')]:
+            body = make_page(name, keyword)
+            page = FetchResult(f"https://{name.lower()}.com/", 200, {'Content-Type': 'text/html'}, body, body.decode())
+            with patch.object(scraper.fetch_policy, 'fetch', return_value=page):
+                scraper.scrape_website(f"https://{name.lower()}.com/")
+        archive.close()
+
+        self.assertEqual(len(ArchiveReader(self.directory)), 2)
+
+        leads = replay(self.directory, workers=1, keywords=['software'])
+        self.assertEqual([lead['Company Name'] for lead in leads], ['Acme'])
+        self.assertEqual(leads[0]['Email'], 'hello@acme.com')
+
+        # Parallel replay gives the same result
+        parallel = replay(self.directory, workers=2, chunk_size=1, min_data_points=1)
+        self.assertEqual(sorted(lead['Company Name'] for lead in parallel), ['Acme', 'Globex'])
+
+if __name__ == '__main__':
+    unittest.main()
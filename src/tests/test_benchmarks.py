@@ -0,0 +1,40 @@
+import sys
+import os
+import unittest
+
+# Add the src and benchmarks directories to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../benchmarks'))
+
+import bench_crawl
+import bench_micro
+from scraper import LeadScraper
+
+class TestBenchmarks(unittest.TestCase):
+    """Smoke tests that run the benchmarks on tiny inputs."""
+
+    def test_crawl_benchmark(self):
+        """Test that the crawl benchmark scrapes real leads from the fixture corpus."""
+        args = bench_crawl.parse_args(['--sites', '2', '--pages', '3', '--page-size', '2000',
+                                       '--pipeline-leads', '50', '--no-memory'])
+        results = bench_crawl.run(args)
+        # Errors inside the scraper are swallowed per page, so a broken hook
+        # shows up as seed pages fetched with no leads extracted
+        self.assertGreater(results['crawl']['pages'], 2)
+        self.assertGreater(results['crawl']['leads'], 0)
+        self.assertEqual((results['crawl']['errors'], results['crawl']['skipped']), (0, 0))
+        self.assertGreater(results['pipeline']['input_leads'], 0)
+
+    def test_micro_benchmarks_reuse_clean_inputs(self):
+        """Test that repeated calls of a micro-benchmark don't change its inputs."""
+        scraper = LeadScraper(fast_start=True)
+        cases = {name: (setup, func) for name, setup, func in bench_micro.benchmarks([], scraper)}
+        setup, func = cases['_extract_contact_info[small]']
+        args = setup()
+        before = dict(args[1])
+        func(*args)
+        func(*args)
+        self.assertEqual(args[1], before)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import sys
+import os
+import unittest
+from unittest.mock import patch
+
+import requests
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from circuit_breaker import CircuitBreaker, HostCircuitBreakers, RetryBudget, CLOSED, OPEN, HALF_OPEN
+from scraper import LeadScraper
+
+class FakeClock:
+    """A manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Test cases for circuit breakers and the retry budget."""
+
+    def test_state_transitions(self):
+        """Test closed -> open -> half-open -> closed."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, cooldown=30, clock=clock)
+
+        self.assertEqual(breaker.state, CLOSED)
+        breaker.record_failure()
+        self.assertTrue(breaker.allow_request())
+        breaker.record_failure()
+        self.assertEqual(breaker.state, OPEN)
+        self.assertFalse(breaker.allow_request())
+
+        clock.now = 30
+        self.assertEqual(breaker.state, HALF_OPEN)
+        self.assertTrue(breaker.allow_request())
+        # Only one trial request at a time
+        self.assertFalse(breaker.allow_request())
+
+        breaker.record_success()
+        self.assertEqual(breaker.state, CLOSED)
+
+    def test_failed_trial_reopens(self):
+        """Test that a failed half-open trial re-opens the breaker."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=5, cooldown=10, clock=clock)
+        for _ in range(5):
+            breaker.record_failure()
+
+        clock.now = 10
+        self.assertTrue(breaker.allow_request())
+        breaker.record_failure()
+        self.assertEqual(breaker.state, OPEN)
+
+    def test_hosts_are_independent(self):
+        """Test that breakers are tracked per host."""
+        breakers = HostCircuitBreakers(failure_threshold=1)
+        breakers.record_failure("dead.com")
+        self.assertFalse(breakers.allow("dead.com"))
+        self.assertTrue(breakers.allow("alive.com"))
+
+    def test_retry_budget(self):
+        """Test that retries are capped as a fraction of requests."""
+        budget = RetryBudget(ratio=0.5, min_retries=1)
+        self.assertTrue(budget.try_acquire())
+        self.assertFalse(budget.try_acquire())
+
+        for _ in range(4):
+            budget.record_request()
+        self.assertTrue(budget.try_acquire())
+        self.assertTrue(budget.try_acquire())
+        self.assertFalse(budget.try_acquire())
+
+    @patch('scraper.time.sleep')
+    def test_scraper_short_circuits_dead_host(self, mock_sleep):
+        """Test that a dead host stops being contacted once its breaker opens."""
+        scraper = LeadScraper(
+            respect_robots_txt=False,
+            circuit_breakers=HostCircuitBreakers(failure_threshold=3, cooldown=60)
+        )
+        error = requests.exceptions.ConnectionError("unreachable")
+        with patch('fetch_policy.requests.get', side_effect=error) as mock_get:
+            first = scraper.scrape_website("https://dead.example.com/")
+            second = scraper.scrape_website("https://dead.example.com/about")
+
+        self.assertIn('after 3 attempts', first['error'])
+        self.assertIn('Skipped', second['error'])
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch('scraper.time.sleep')
+    def test_scraper_does_not_retry_client_errors(self, mock_sleep):
+        """Test that 404 responses are not retried."""
+        scraper = LeadScraper(respect_robots_txt=False)
+        response = requests.Response()
+        response.status_code = 404
+        error = requests.exceptions.HTTPError("404 Not Found", response=response)
+        with patch('fetch_policy.requests.get', side_effect=error) as mock_get:
+            result = scraper.scrape_website("https://example.com/missing")
+
+        self.assertIn('error', result)
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertTrue(scraper.circuit_breakers.allow("example.com"))
+
+    def test_crawl_does_not_claim_half_open_trial(self):
+        """Test that a crawl error doesn't leave a half-open host blocked for good."""
+        clock = FakeClock()
+        breakers = HostCircuitBreakers(failure_threshold=1, cooldown=60, clock=clock)
+        breakers.record_failure("acme.com")
+        clock.now = 61
+        self.assertEqual(breakers.state("acme.com"), HALF_OPEN)
+
+        scraper = LeadScraper(fast_start=True, circuit_breakers=breakers)
+        with patch.object(scraper, '_check_robots_txt', return_value=False):
+            self.assertEqual(list(scraper.crawl(["https://acme.com/"])), [])
+
+        # The trial request is still available
+        self.assertTrue(breakers.allow("acme.com"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import sys
+import os
+import threading
+import unittest
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from email_validation import EmailDomainValidator, email_domain, make_mail_resolver, DELIVERABLE, UNDELIVERABLE, UNKNOWN
+from resolver import TransientLookupError
+from scraper import LeadScraper
+
+class StubResolver:
+    """Answers MX lookups from a fixed table and counts queries per domain."""
+
+    def __init__(self, records, flaky=()):
+        self.records = records
+        self.flaky = set(flaky)
+        self.queries = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, domain):
+        with self._lock:
+            self.queries[domain] = self.queries.get(domain, 0) + 1
+        if domain in self.flaky:
+            raise TransientLookupError(f"{domain}: resolution lifetime expired")
+        if not self.records.get(domain):
+            raise OSError(f"{domain} has no mail hosts")
+        return self.records[domain]
+
+class TestEmailDomainValidator(unittest.TestCase):
+    """Test cases for bulk email domain validation."""
+
+    def setUp(self):
+        self.stub = StubResolver({'acme.com': ['mx1.acme.com'], 'globex.com': ['mx.globex.com']},
+                                 flaky={'flaky.com'})
+        self.validator = EmailDomainValidator(resolve_func=self.stub)
+
+    def tearDown(self):
+        self.validator.close()
+
+    def test_email_domain(self):
+        """Test domain extraction from email addresses."""
+        self.assertEqual(email_domain('Sales@ACME.com.'), 'acme.com')
+        self.assertEqual(email_domain(''), '')
+        self.assertEqual(email_domain(None), '')
+        self.assertEqual(email_domain('N/A'), '')
+        self.assertEqual(email_domain('not-an-email'), '')
+
+    def test_validate_marks_and_drops(self):
+        """Test that each domain is resolved once and undeliverable leads are marked or dropped."""
+        leads = [
+            {'Company Name': 'Acme', 'Email': 'a@acme.com'},
+            {'Company Name': 'Acme', 'Email': 'b@ACME.com'},
+            {'Company Name': 'Dead', 'Email': 'x@dead-domain.test'},
+            {'Company Name': 'Globex', 'Email': 'g@globex.com'},
+            {'Company Name': 'NoEmail', 'Email': ''},
+            {'Company Name': 'Flaky', 'Email': 'f@flaky.com'},
+        ]
+        marked = self.validator.validate(leads)
+        self.assertEqual([lead.get('Email Status') for lead in marked],
+                         [DELIVERABLE, DELIVERABLE, UNDELIVERABLE, DELIVERABLE, None, UNKNOWN])
+        self.assertNotIn('Email Status', leads[0])
+
+        # Leads whose domain couldn't be checked are never dropped
+        kept = self.validator.validate(leads, drop=True)
+        self.assertEqual([lead['Company Name'] for lead in kept], ['Acme', 'Acme', 'Globex', 'NoEmail', 'Flaky'])
+
+        # The second batch was answered from the shared cache
+        self.assertEqual(self.stub.queries, {'acme.com': 1, 'dead-domain.test': 1, 'globex.com': 1, 'flaky.com': 1})
+
+    def test_inconclusive_lookups_expire_quickly(self):
+        """Test that an inconclusive lookup is retried once its short TTL passes."""
+        validator = EmailDomainValidator(resolve_func=self.stub, transient_ttl=0)
+        self.addCleanup(validator.close)
+        self.assertEqual(validator.check_domains(['flaky.com']), {'flaky.com': UNKNOWN})
+        self.stub.flaky.clear()
+        self.stub.records['flaky.com'] = ['mx.flaky.com']
+        self.assertEqual(validator.check_domains(['flaky.com']), {'flaky.com': DELIVERABLE})
+
+    def test_address_fallback_is_inconclusive(self):
+        """Test that the address-record check never reports a domain as undeliverable."""
+        resolve = make_mail_resolver()
+        if resolve.__name__ != '_address_records':
+            self.skipTest("dnspython is installed")
+        with self.assertRaises(TransientLookupError):
+            resolve('does-not-exist.invalid')
+
+    def test_scraper_stage(self):
+        """Test the scraper's validation stage with an injected validator."""
+        scraper = LeadScraper(fast_start=True, email_validator=self.validator)
+        leads = scraper.validate_email_domains([{'Email': 'x@dead-domain.test'}, {'Email': 'a@acme.com'}], drop=True)
+        self.assertEqual(leads, [{'Email': 'a@acme.com'}])
+        self.assertEqual(scraper.validate_email_domains([]), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import sys
+import os
+import csv
+import shutil
+import tempfile
+import unittest
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from export_index import ExportIndex, INSERT, UPDATE
+from scraper import LeadScraper
+
+def make_lead(domain, email, phone=""):
+    return {'Company Name': domain.split('.')[0].title(), 'Domain': domain, 'Email': email, 'Phone': phone}
+
+class TestExportIndex(unittest.TestCase):
+    """Test cases for delta exports."""
+
+    def setUp(self):
+        self.index = ExportIndex(":memory:", target="csv")
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.index.close()
+        shutil.rmtree(self.directory)
+
+    def test_diff_and_record(self):
+        """Test that only new and changed leads are reported, and tombstones on request."""
+        leads = [make_lead('acme.com', 'a@acme.com'), make_lead('globex.com', 'g@globex.com')]
+        delta = self.index.diff(leads)
+        self.assertEqual([change for change, _ in delta.changes], [INSERT, INSERT])
+        self.index.record(delta)
+        self.assertEqual(len(self.index), 2)
+
+        self.assertEqual(self.index.diff(leads).changes, [])
+
+        # Keys are case-insensitive; field changes are updates
+        updated = [make_lead('ACME.com', 'a@acme.com', phone='555-0100')]
+        delta = self.index.diff(updated, tombstones=True)
+        self.assertEqual(delta.changes, [(UPDATE, updated[0])])
+        self.assertEqual(delta.tombstones,
+                         [{'Company Name': 'Globex', 'Website': '', 'Domain': 'globex.com', 'Email': 'g@globex.com'}])
+        self.index.record(delta)
+        self.assertEqual(len(self.index), 1)
+
+        # Targets keep separate histories
+        other = ExportIndex(":memory:", target="crm")
+        self.assertEqual(len(other.diff(leads).changes), 2)
+        other.close()
+
+    def test_leads_without_email_keep_their_own_identity(self):
+        """Test that email-less leads of one domain are exported and tracked separately."""
+        leads = [dict(make_lead('acme.com', ''), Website='https://acme.com', **{'Company Name': name})
+                 for name in ('Acme', 'Acme Labs', 'Acme Cloud')]
+        delta = self.index.diff(leads)
+        self.assertEqual([change for change, _ in delta.changes], [INSERT, INSERT, INSERT])
+        self.index.record(delta)
+        self.assertEqual(len(self.index), 3)
+
+        delta = self.index.diff(leads[:2], tombstones=True)
+        self.assertEqual(delta.changes, [])
+        self.assertEqual([tombstone['Company Name'] for tombstone in delta.tombstones], ['Acme Cloud'])
+        self.index.record(delta)
+        self.assertEqual(len(self.index), 2)
+
+    def test_delta_csv_export(self):
+        """Test that delta exports write a Change column and skip unchanged leads."""
+        scraper = LeadScraper(fast_start=True)
+        leads = [make_lead('acme.com', 'a@acme.com'), make_lead('globex.com', 'g@globex.com')]
+        first = os.path.join(self.directory, 'first.csv')
+        self.assertEqual(scraper.export_to_csv(leads, first, delta_index=self.index), first)
+        with open(first) as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual([row['Change'] for row in rows], ['insert', 'insert'])
+
+        self.assertIsNone(scraper.export_to_csv(leads, os.path.join(self.directory, 'second.csv'),
+                                                delta_index=self.index))
+
+        third = os.path.join(self.directory, 'third.csv')
+        scraper.export_to_csv(leads[:1] + [make_lead('initech.com', 'i@initech.com')], third,
+                              delta_index=self.index, tombstones=True)
+        with open(third) as f:
+            rows = [(row['Change'], row['Domain']) for row in csv.DictReader(f)]
+        self.assertEqual(rows, [('insert', 'initech.com'), ('delete', 'globex.com')])
+
+if __name__ == '__main__':
+    unittest.main()
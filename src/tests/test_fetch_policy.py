@@ -0,0 +1,91 @@
+import sys
+import os
+import unittest
+from unittest.mock import patch, MagicMock
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from fetch_policy import FetchPolicy, ResponseRejected
+from scraper import LeadScraper
+
+def make_response(body, content_type='text/html; charset=utf-8', content_length=None):
+    """Build a mock streamed response."""
+    response = MagicMock()
+    response.url = "https://example.com/"
+    response.status_code = 200
+    response.encoding = 'utf-8'
+    response.headers = {'Content-Type': content_type}
+    if content_length is not None:
+        response.headers['Content-Length'] = str(content_length)
+    response.iter_content.side_effect = lambda chunk_size: (
+        body[i:i + chunk_size] for i in range(0, len(body), chunk_size)
+    )
+    return response
+
+class TestFetchPolicy(unittest.TestCase):
+    """Test cases for the FetchPolicy class."""
+
+    def test_binary_extensions(self):
+        """Test that binary file links are not crawlable."""
+        policy = FetchPolicy()
+        self.assertTrue(policy.is_crawlable_url("https://example.com/about"))
+        self.assertTrue(policy.is_crawlable_url("https://example.com/index.html"))
+        self.assertFalse(policy.is_crawlable_url("https://example.com/brochure.PDF"))
+        self.assertFalse(policy.is_crawlable_url("https://example.com/img/logo.png?v=2"))
+
+    def test_fetch_html(self):
+        """Test that HTML bodies are streamed and decoded."""
+        policy = FetchPolicy(chunk_size=4)
+        with patch('fetch_policy.requests.get', return_value=make_response(b'<h1>Caf\xc3\xa9</h1>')) as mock_get:
+            result = policy.fetch("https://example.com/", {})
+        self.assertEqual(result.text, '<h1>Café</h1>')
+        self.assertTrue(mock_get.call_args.kwargs['stream'])
+
+    def test_rejects_content_type(self):
+        """Test that non-HTML responses are skipped."""
+        policy = FetchPolicy()
+        response = make_response(b'%PDF-1.4', content_type='application/pdf')
+        with patch('fetch_policy.requests.get', return_value=response):
+            with self.assertRaises(ResponseRejected):
+                policy.fetch("https://example.com/file", {})
+        response.iter_content.assert_not_called()
+        response.close.assert_called_once()
+
+    def test_rejects_oversized_body(self):
+        """Test that bodies are aborted above the byte limit."""
+        policy = FetchPolicy(max_bytes=10, chunk_size=4)
+
+        # Declared length over the limit is rejected before reading
+        with patch('fetch_policy.requests.get', return_value=make_response(b'x' * 20, content_length=20)):
+            with self.assertRaises(ResponseRejected):
+                policy.fetch("https://example.com/", {})
+
+        # Undeclared length is caught while streaming
+        with patch('fetch_policy.requests.get', return_value=make_response(b'x' * 20)):
+            with self.assertRaises(ResponseRejected):
+                policy.fetch("https://example.com/", {})
+
+    def test_head_probe(self):
+        """Test that the HEAD probe rejects before the GET."""
+        policy = FetchPolicy(probe_with_head=True)
+        head = MagicMock(ok=True, headers={'Content-Type': 'image/png'})
+        with patch('fetch_policy.requests.head', return_value=head), \
+             patch('fetch_policy.requests.get') as mock_get:
+            with self.assertRaises(ResponseRejected):
+                policy.fetch("https://example.com/", {})
+        mock_get.assert_not_called()
+
+    def test_scraper_skips_rejected_without_retry(self):
+        """Test that the scraper reports rejected responses without retrying."""
+        scraper = LeadScraper(respect_robots_txt=False)
+        scraper.rate_limit = 0
+        response = make_response(b'binary', content_type='application/zip')
+        with patch('fetch_policy.requests.get', return_value=response) as mock_get:
+            result = scraper.scrape_website("https://example.com/download")
+        self.assertIn('error', result)
+        self.assertTrue(result['error'].startswith('Skipped'))
+        self.assertEqual(mock_get.call_count, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import sys
+import os
+import unittest
+from unittest.mock import patch
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from frontier import CrawlFrontier
+from fetch_policy import FetchResult
+from scraper import LeadScraper
+
+class TestCrawlFrontier(unittest.TestCase):
+    """Test cases for the CrawlFrontier class."""
+
+    def test_spills_and_refills_within_budget(self):
+        """Test that overflow goes to disk and every URL comes back exactly once."""
+        urls = [f"https://site{i % 3}.com/page{i}" for i in range(100)]
+        with CrawlFrontier(memory_budget=10, spill_batch=4) as frontier:
+            for url in urls:
+                self.assertTrue(frontier.push(url))
+            self.assertFalse(frontier.push(urls[0]))
+            self.assertEqual(len(frontier), 100)
+            # The queue plus a partly filled spill buffer
+            self.assertLessEqual(frontier.memory_size, 10 + 4)
+
+            popped = []
+            while True:
+                item = frontier.pop()
+                if item is None:
+                    break
+                self.assertLessEqual(frontier.memory_size, 10 + 4)
+                popped.append(item[0])
+            path = frontier.path
+
+        self.assertEqual(sorted(popped), sorted(urls))
+        # Hosts are served round-robin
+        self.assertEqual([url.split('/')[2] for url in popped[:3]], ['site0.com', 'site1.com', 'site2.com'])
+        self.assertFalse(os.path.exists(path))
+
+    def test_host_limits(self):
+        """Test the per-host admission cap and dropping a host's pending URLs."""
+        with CrawlFrontier(memory_budget=2, max_per_host=3) as frontier:
+            results = [frontier.push(f"https://a.com/{i}") for i in range(5)]
+            frontier.push("https://b.com/")
+            self.assertEqual(results, [True, True, True, False, False])
+            self.assertEqual(frontier.drop_host('a.com'), 3)
+            self.assertEqual(frontier.pop(), ("https://b.com/", 0))
+            self.assertIsNone(frontier.pop())
+
+    def test_scraper_crawl(self):
+        """Test that crawl follows links breadth-first within the page and depth limits."""
+        def fetch(url, *args, **kwargs):
+            n = int(url.rsplit('/', 1)[-1] or 0)
+            links = "".join(f"<a href='/{2 * n + i}'>x</a>" for i in (1, 2))
+            page = f"<html><body><h1>Page {n}</h1>{links}</body></html>"
+            return FetchResult(url, 200, {}, page.encode(), page)
+
+        scraper = LeadScraper(respect_robots_txt=False, fast_start=True)
+        scraper.rate_limit = 0
+        with patch.object(scraper.fetch_policy, 'fetch', side_effect=fetch):
+            pages = list(scraper.crawl(["https://acme.com/"], max_pages=5, max_depth=2))
+
+        self.assertEqual([url for url, _ in pages],
+                         ["https://acme.com/", "https://acme.com/1", "https://acme.com/2",
+                          "https://acme.com/3", "https://acme.com/4"])
+        self.assertEqual(pages[0][1][0]['Company Name'], 'Page 0')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import sys
+import os
+import threading
+import unittest
+from unittest.mock import patch
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from jobs import JobRunner, DONE, FAILED, RUNNING
+from lead_store import LeadStore
+from fetch_policy import FetchResult
+from scraper import LeadScraper
+
+PAGE = "<html><body>\n<h1>Acme</h1>\n<p>sales@acme.com</p>\n<p class='address'>1 Main St</p>\n<a href='/about'>About</a>\n</body></html>"
+
+class TestJobRunner(unittest.TestCase):
+    """Test cases for background scrape jobs."""
+
+    def setUp(self):
+        self.store = LeadStore(":memory:")
+        self.release = threading.Event()
+        self.fetched = threading.Event()
+
+        def fetch(url, *args, **kwargs):
+            self.fetched.set()
+            self.release.wait(5)
+            return FetchResult(url, 200, {}, PAGE.encode(), PAGE)
+
+        def make_scraper(respect_robots_txt):
+            scraper = LeadScraper(respect_robots_txt=respect_robots_txt, fast_start=True)
+            scraper.rate_limit = 0
+            patcher = patch.object(scraper.fetch_policy, 'fetch', side_effect=fetch)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+            return scraper
+
+        self.runner = JobRunner(max_workers=2, lead_store=self.store, scraper_factory=make_scraper)
+
+    def tearDown(self):
+        self.release.set()
+        self.runner._executor.shutdown(wait=True)
+        self.store.close()
+
+    def test_job_streams_progress_and_finishes(self):
+        """Test that a job reports progress while running and stores its leads when done."""
+        job_id = self.runner.submit("https://acme.com/", max_pages=2, respect_robots_txt=False,
+                                    filter_options={'min_data_points': 1}, session_id='s1')
+        self.assertTrue(self.fetched.wait(5))
+        snapshot = self.runner.get(job_id).snapshot()
+        self.assertEqual(snapshot['status'], RUNNING)
+        self.assertEqual(snapshot['pages_fetched'], 0)
+
+        self.release.set()
+        self.runner._executor.shutdown(wait=True)
+
+        snapshot = self.runner.get(job_id).snapshot()
+        self.assertEqual(snapshot['status'], DONE)
+        self.assertEqual(snapshot['pages_fetched'], 2)
+        self.assertEqual(snapshot['leads_found'], 2)
+        self.assertEqual(snapshot['filtered_leads'][0]['Email'], 'sales@acme.com')
+        self.assertEqual(snapshot['analysis']['total'], len(snapshot['filtered_leads']))
+        self.assertEqual(self.store.find_by_domain('acme.com')[0]['Email'], 'sales@acme.com')
+
+    def test_jobs_are_scoped_to_sessions(self):
+        """Test that sessions only see their own jobs and failures are reported."""
+        self.release.set()
+        first = self.runner.submit("https://acme.com/", respect_robots_txt=False, session_id='s1')
+        bad = self.runner.submit("not a url", session_id='s2')
+        self.runner._executor.shutdown(wait=True)
+
+        self.assertEqual([job.id for job in self.runner.jobs_for('s1')], [first])
+        failed = self.runner.get(bad).snapshot()
+        self.assertEqual(failed['status'], FAILED)
+        self.assertTrue(failed['error'])
+
+        self.runner.discard(first)
+        self.assertIsNone(self.runner.get(first))
+
+    def test_finished_jobs_are_evicted(self):
+        """Test that finished jobs are capped per session and expire after their TTL."""
+        self.now = 1000.0
+        runner = JobRunner(max_workers=1, finished_ttl=60, max_finished_per_session=2, clock=lambda: self.now)
+        job_ids = [runner.submit("not a url", session_id='s1') for _ in range(3)]
+        other = runner.submit("not a url", session_id='s2')
+        runner._executor.shutdown(wait=True)
+        job = runner.get(other)
+        self.assertEqual((job.created_at, job.started_at, job.finished_at), (1000.0, 1000.0, 1000.0))
+
+        self.assertEqual([job.id for job in runner.jobs_for('s1')], job_ids[1:])
+        self.assertEqual([job.id for job in runner.jobs_for('s2')], [other])
+
+        self.now += 61
+        self.assertEqual(runner.jobs_for('s1'), [])
+        self.assertIsNone(runner.get(other))
+
+if __name__ == '__main__':
+    unittest.main()
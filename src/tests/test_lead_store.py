@@ -0,0 +1,145 @@
+import sys
+import os
+import threading
+import unittest
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from lead_store import LeadStore
+from scraper import LeadScraper
+
+class TestLeadStore(unittest.TestCase):
+    """Test cases for the LeadStore class."""
+
+    def setUp(self):
+        """Set up an in-memory store with sample leads."""
+        self.store = LeadStore(":memory:")
+        self.test_leads = [
+            {
+                'Company Name': 'Tech Solutions',
+                'Website': 'https://tech.com',
+                'Domain': 'tech.com',
+                'Industry/Keywords': 'software, technology',
+                'Description': 'A software company',
+                'Email': 'contact@tech.com',
+                'Phone': '123-456-7890'
+            },
+            {
+                'Company Name': 'Marketing Agency',
+                'Website': 'https://marketing.com',
+                'Domain': 'marketing.com',
+                'Industry/Keywords': 'marketing, advertising',
+                'Description': 'A marketing firm',
+                'Email': '',
+                'Phone': ''
+            }
+        ]
+        self.store.upsert_leads(self.test_leads)
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_upsert_merges_fields(self):
+        """Test that re-inserting a lead merges instead of duplicating."""
+        update = dict(self.test_leads[0], Phone='', Location='Berlin')
+        self.store.upsert_leads([update])
+
+        self.assertEqual(len(self.store), 2)
+        lead = self.store.find_by_domain('tech.com')[0]
+        # Empty values never erase stored data
+        self.assertEqual(lead['Phone'], '123-456-7890')
+        # New values are merged in
+        self.assertEqual(lead['Location'], 'Berlin')
+
+    def test_email_found_in_later_run(self):
+        """Test that a lead stored without an email merges with its rescrape once one is found."""
+        rescraped = dict(self.test_leads[1], Email='hello@marketing.com', Phone='555-0100')
+        self.store.upsert_leads([rescraped])
+        self.assertEqual(len(self.store), 2)
+        lead = self.store.find_by_domain('marketing.com')[0]
+        self.assertEqual((lead['Email'], lead['Phone']), ('hello@marketing.com', '555-0100'))
+
+        # A later page without the email merges into the same lead, and a
+        # second address for the company is kept as its own lead
+        self.store.upsert_leads([dict(self.test_leads[1], Location='Paris'),
+                                 dict(self.test_leads[1], Email='press@marketing.com')])
+        leads = self.store.find_by_domain('marketing.com')
+        self.assertEqual([lead['Email'] for lead in leads], ['hello@marketing.com', 'press@marketing.com'])
+        self.assertEqual(leads[0]['Location'], 'Paris')
+
+    def test_lookups(self):
+        """Test indexed lookups by domain, email and company."""
+        self.assertTrue(self.store.contains_domain('marketing.com'))
+        self.assertFalse(self.store.contains_domain('unknown.com'))
+        self.assertEqual(self.store.find_by_email('contact@tech.com')[0]['Company Name'], 'Tech Solutions')
+        self.assertEqual(len(self.store.find_by_email('')), 0)
+        self.assertEqual(len(self.store.find_by_company('marketing agency')), 1)
+
+    def test_batched_insert_skips_errors(self):
+        """Test batched inserts and error entries."""
+        leads = [{'Company Name': f'Company {i}', 'Domain': f'c{i}.com'} for i in range(25)]
+        leads.append({'error': 'Invalid URL format'})
+        written = self.store.upsert_leads(leads, batch_size=10)
+        self.assertEqual(written, 25)
+        self.assertEqual(len(self.store), 27)
+
+    def test_concurrent_upserts(self):
+        """Test that threads sharing one store don't interleave transactions."""
+        errors = []
+
+        def write(worker):
+            try:
+                for i in range(300):
+                    self.store.upsert_leads([{'Company Name': f'W{worker}', 'Domain': f'w{worker}-{i}.com'}] * 3,
+                                            batch_size=1)
+                    self.store.find_by_domain(f'w{worker}-{i}.com')
+            except Exception as e:
+                errors.append(e)
+
+        # Switch threads as often as possible so unguarded transactions would overlap
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=write, args=(worker,)) for worker in range(6)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(self.store), 2 + 6 * 300)
+
+    def test_filter_matches_scraper(self):
+        """Test that SQL filtering matches LeadScraper.filter_leads."""
+        scraper = LeadScraper()
+        stored = self.store.all_leads()
+        cases = [
+            {'keywords': ['software']},
+            {'exclude_keywords': ['marketing']},
+            {'min_data_points': 7},
+            {'advanced_filters': {'Company Name': {'contains': ['Agency'], 'not_contains': ['Tech']}}},
+            {'advanced_filters': {'Email': {'regex': r'@tech\.com$'}}},
+        ]
+        for kwargs in cases:
+            expected = [lead['Company Name'] for lead in scraper.filter_leads(stored, **kwargs)]
+            actual = [lead['Company Name'] for lead in self.store.filter_leads(**kwargs)]
+            self.assertEqual(actual, expected, kwargs)
+
+    def test_filter_escapes_wildcards(self):
+        """Test that LIKE wildcards in keywords are matched literally."""
+        self.assertEqual(self.store.filter_leads(keywords=['%'], min_data_points=0), [])
+
+    def test_analyze_matches_scraper(self):
+        """Test that SQL analysis matches LeadScraper.analyze_leads."""
+        scraper = LeadScraper()
+        expected = scraper.analyze_leads(self.store.all_leads())
+        actual = self.store.analyze_leads()
+        self.assertEqual(actual, expected)
+
+        self.assertEqual(LeadStore(":memory:").analyze_leads(), {"total": 0})
+
+if __name__ == '__main__':
+    unittest.main()
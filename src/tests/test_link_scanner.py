@@ -0,0 +1,63 @@
+import sys
+import os
+import unittest
+from unittest.mock import patch
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from bs4 import BeautifulSoup
+from link_scanner import scan_hrefs
+from fetch_policy import FetchResult
+from scraper import LeadScraper, _parse_html
+
+HUB_PAGE = """<html><head>
+<script>document.write('<a href="/from-script">x</a>');</script>
+<style>a[href="/from-style"] { color: red }</style>
+</head><body>
+<!-- <a href="/commented-out">old</a> -->
+<a class="nav" href="/products?page=1&amp;sort=asc">Products</a>
+<A data-href="/not-a-link" HREF='/about-us'>About</A>
+<a href=/contact>Contact</a>
+<a name="anchor">No link</a>
+<a title="a > b" href="https://other.com/">Elsewhere</a>
+</body></html>"""
+
+class TestLinkScanner(unittest.TestCase):
+    """Test cases for the lightweight link scanner."""
+
+    def test_scan_hrefs(self):
+        """Test that hrefs are found without a DOM, matching BeautifulSoup."""
+        expected = ['/products?page=1&sort=asc', '/about-us', '/contact', 'https://other.com/']
+        self.assertEqual(scan_hrefs(HUB_PAGE), expected)
+        self.assertEqual(scan_hrefs(HUB_PAGE.encode('utf-8')), expected)
+        soup = BeautifulSoup(HUB_PAGE, 'html.parser')
+        self.assertEqual([a['href'] for a in soup.find_all('a', href=True)], expected)
+
+    def test_crawl_parses_only_lead_pages(self):
+        """Test that crawl fully parses seed and contact-like pages, and only scans the rest."""
+        pages = {
+            "https://acme.com/": HUB_PAGE,
+            "https://acme.com/products?page=1&sort=asc": "<h1>Products</h1><a href='/team'>Team</a>",
+            "https://acme.com/about-us": "<h1>About Acme</h1>\n<p>hello@acme.com</p>",
+            "https://acme.com/contact": "<h1>Contact</h1>",
+            "https://acme.com/team": "<h1>Team</h1>",
+        }
+
+        def fetch(url, *args, **kwargs):
+            return FetchResult(url, 200, {}, pages[url].encode(), pages[url])
+
+        scraper = LeadScraper(respect_robots_txt=False, fast_start=True)
+        scraper.rate_limit = 0
+        with patch.object(scraper.fetch_policy, 'fetch', side_effect=fetch), \
+                patch('scraper._parse_html', side_effect=_parse_html) as mock_parse:
+            crawled = dict(scraper.crawl(["https://acme.com/"], max_depth=2))
+
+        self.assertEqual(set(crawled), set(pages))
+        self.assertEqual(mock_parse.call_count, 4)
+        self.assertEqual(crawled["https://acme.com/products?page=1&sort=asc"], [])
+        self.assertEqual(crawled["https://acme.com/about-us"][0]['Email'], 'hello@acme.com')
+        self.assertEqual(crawled["https://acme.com/team"][0]['Company Name'], 'Team')
+
+if __name__ == '__main__':
+    unittest.main()
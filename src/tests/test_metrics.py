@@ -0,0 +1,89 @@
+import sys
+import os
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from metrics import Metrics, NULL_METRICS
+from fetch_policy import FetchResult
+from scraper import LeadScraper
+
+PAGE = "<html><body><h1>Acme</h1><p>sales@acme.com</p></body></html>"
+
+class TestMetrics(unittest.TestCase):
+    """Test cases for the Metrics class and scraper instrumentation."""
+
+    def test_histogram_and_counters(self):
+        """Test that observations land in the right buckets."""
+        metrics = Metrics(buckets=(0.1, 1))
+        metrics.observe('fetch', 0.05, host='a.com')
+        metrics.observe('fetch', 0.5, host='a.com')
+        metrics.observe('fetch', 5, host='a.com')
+        metrics.increment('requests', host='a.com')
+        metrics.increment('requests', 2, host='a.com')
+
+        data = metrics.to_dict()
+        stage = data['stages'][0]
+        self.assertEqual((stage['stage'], stage['host'], stage['count']), ('fetch', 'a.com', 3))
+        self.assertEqual(stage['buckets'], {'0.1': 1, '1': 2, 'inf': 3})
+        self.assertEqual(data['counters'], [{'name': 'requests', 'host': 'a.com', 'value': 3}])
+
+    def test_prometheus_format(self):
+        """Test the Prometheus text export."""
+        metrics = Metrics(buckets=(1,))
+        with metrics.timer('parse'):
+            pass
+        metrics.increment('pages_fetched', host='a.com')
+
+        text = metrics.to_prometheus()
+        self.assertIn('leadscraper_stage_duration_seconds_bucket{stage="parse",le="1.0"} 1', text)
+        self.assertIn('leadscraper_stage_duration_seconds_bucket{stage="parse",le="+Inf"} 1', text)
+        self.assertIn('leadscraper_stage_duration_seconds_count{stage="parse"} 1', text)
+        self.assertIn('leadscraper_pages_fetched_total{host="a.com"} 1', text)
+
+    def test_write_by_extension(self):
+        """Test that write() picks the format from the file extension."""
+        metrics = Metrics()
+        metrics.increment('requests')
+        directory = tempfile.mkdtemp()
+        try:
+            with open(metrics.write(os.path.join(directory, 'metrics.json'))) as f:
+                self.assertEqual(json.load(f)['counters'][0]['value'], 1)
+            with open(metrics.write(os.path.join(directory, 'metrics.prom'))) as f:
+                self.assertIn('leadscraper_requests_total 1', f.read())
+        finally:
+            for name in os.listdir(directory):
+                os.remove(os.path.join(directory, name))
+            os.rmdir(directory)
+
+    def test_disabled_by_default(self):
+        """Test that scrapers record nothing unless metrics are enabled."""
+        scraper = LeadScraper()
+        self.assertIs(scraper.metrics, NULL_METRICS)
+        scraper.filter_leads([{'Company Name': 'Acme'}], min_data_points=1)
+
+    def test_scraper_stages(self):
+        """Test that a scrape records every pipeline stage."""
+        metrics = Metrics()
+        scraper = LeadScraper(respect_robots_txt=False, metrics=metrics)
+        scraper.rate_limit = 0
+        page = FetchResult("https://acme.com/", 200, {}, PAGE.encode(), PAGE)
+        with patch.object(scraper.fetch_policy, 'fetch', return_value=page):
+            leads = scraper.scrape_website("https://acme.com/")
+        cleaned = scraper.validate_and_clean_data(leads)
+        scraper.analyze_leads(scraper.filter_leads(cleaned, min_data_points=1))
+
+        stages = {(s['stage'], s['host']) for s in metrics.to_dict()['stages']}
+        for stage in ('robots', 'sleep', 'fetch', 'parse'):
+            self.assertIn((stage, 'acme.com'), stages)
+        for stage in ('extract_company', 'extract_contact', 'clean', 'filter', 'analyze'):
+            self.assertIn((stage, ''), stages)
+        self.assertEqual(metrics.counters[('pages_fetched', 'acme.com')], 1)
+        self.assertEqual(metrics.counters[('leads_extracted', 'acme.com')], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from page_cache import PageCache, content_hash
+import scraper as scraper_module
+from scraper import LeadScraper
+
+SAMPLE_HTML = """
+<html>
+<head><meta name="description" content="We build software"></head>
+<body>
+    <h1>Acme Corp</h1>
+    <a href="/about">About</a>
+    <p>Contact: sales@acme.com</p>
+</body>
+</html>
+"""
+
+class TestPageCache(unittest.TestCase):
+    """Test cases for the PageCache class."""
+
+    def test_content_hash_normalizes_whitespace(self):
+        """Test that whitespace-only differences hash identically."""
+        self.assertEqual(content_hash("<p>a  b</p>\n"), content_hash(b"<p>a b</p>"))
+        self.assertNotEqual(content_hash("<p>a</p>"), content_hash("<p>b</p>"))
+        self.assertNotEqual(content_hash("<p>a</p>", "one.com"), content_hash("<p>a</p>", "two.com"))
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = PageCache(max_entries=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(len(cache), 2)
+
+    def test_disk_layer(self):
+        """Test that entries survive in the on-disk layer."""
+        cache_dir = tempfile.mkdtemp()
+        try:
+            PageCache(cache_dir=cache_dir).put('abcdef', {'leads': []})
+
+            fresh = PageCache(cache_dir=cache_dir)
+            self.assertIn('abcdef', fresh)
+            self.assertEqual(fresh.get('abcdef'), {'leads': []})
+        finally:
+            shutil.rmtree(cache_dir)
+
+    def test_identical_pages_parsed_once(self):
+        """Test that the scraper skips parsing for repeated content."""
+        scraper = LeadScraper()
+
+        with patch('scraper._parse_html', wraps=scraper_module._parse_html) as mock_parse:
+            first_leads, first_hrefs = scraper._process_page(SAMPLE_HTML, "https://acme.com/")
+            second_leads, second_hrefs = scraper._process_page(SAMPLE_HTML + "\n  ", "https://acme.com/home")
+            self.assertEqual(mock_parse.call_count, 1)
+
+        self.assertEqual(first_leads[0]['Company Name'], 'Acme Corp')
+        self.assertEqual(first_leads[0]['Email'], 'sales@acme.com')
+        self.assertEqual(second_leads[0]['Website'], "https://acme.com/home")
+        self.assertEqual(second_leads[0]['Email'], 'sales@acme.com')
+        self.assertEqual(first_hrefs, second_hrefs)
+
+        # Mutating returned leads must not corrupt the cache
+        second_leads[0]['Email'] = ''
+        third_leads, _ = scraper._process_page(SAMPLE_HTML, "https://acme.com/")
+        self.assertEqual(third_leads[0]['Email'], 'sales@acme.com')
+
+if __name__ == '__main__':
+    unittest.main()
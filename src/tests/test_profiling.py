@@ -0,0 +1,74 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from profiling import ProfileSession
+from scraper import LeadScraper, _parse_html
+
+PAGE = """
+<html><body>
+    <h1>Acme</h1>
+    <div class="team-member"><span class="name">Jane Doe</span></div>
+    <p class="address">1 Main St</p>
+    <p>Email sales@acme.com or call (555) 123-4567</p>
+</body></html>
+""" * 20
+
+class TestProfileSession(unittest.TestCase):
+    """Test cases for the ProfileSession class."""
+
+    def setUp(self):
+        self.scraper = LeadScraper(fast_start=True)
+        self.soup = _parse_html(PAGE)
+        self.output_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir)
+
+    def extract(self, iterations):
+        for _ in range(iterations):
+            leads = self.scraper._extract_company_info(self.soup, "https://acme.com/")
+            self.scraper._extract_contact_info(self.soup, leads[0])
+
+    def test_cprofile_reports(self):
+        """Test that cProfile mode reports stages and hot calls and writes files."""
+        with self.scraper.profile(output_dir=self.output_dir) as session:
+            self.extract(3)
+
+        stages = session.stage_times()
+        self.assertIn('extract_company', stages)
+        self.assertIn('extract_contact', stages)
+
+        calls = [label.split(' ')[0] for label, count, seconds in session.top_calls()]
+        self.assertIn('select', calls)
+        self.assertIn('findall', calls)
+
+        self.assertTrue(session.paths['pstats'].endswith('.prof'))
+        for path in session.paths.values():
+            self.assertTrue(os.path.exists(path))
+
+    def test_sampling_writes_folded_stacks(self):
+        """Test that sampling mode writes collapsed stacks."""
+        session = ProfileSession(mode='sampling', interval=0.001, output_dir=self.output_dir)
+        with session:
+            self.extract(30)
+
+        self.assertIn('extract_contact', session.stage_times())
+        with open(session.paths['folded']) as f:
+            line = f.readline().rstrip('\n')
+        stack, count = line.rsplit(' ', 1)
+        self.assertGreater(int(count), 0)
+        self.assertIn(';', stack)
+
+    def test_invalid_mode(self):
+        """Test that unknown modes are rejected."""
+        with self.assertRaises(ValueError):
+            ProfileSession(mode='perf')
+
+if __name__ == '__main__':
+    unittest.main()
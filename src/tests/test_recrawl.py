@@ -0,0 +1,119 @@
+import sys
+import os
+import unittest
+from unittest.mock import patch
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from recrawl import RecrawlScheduler, HOUR, DAY
+from lead_store import LeadStore
+from resolver import DNSCache
+from fetch_policy import FetchResult
+from scraper import LeadScraper
+
+PAGE = "<html><body>\n<h1>Acme</h1>\n<p>sales@acme.com</p>\n<a href='/about'>About</a>\n</body></html>"
+ABOUT_PAGE = "<html><body>\n<h1>Acme</h1>\n<p>team@acme.com</p>\n</body></html>"
+
+class TestRecrawlScheduler(unittest.TestCase):
+    """Test cases for the RecrawlScheduler class."""
+
+    def setUp(self):
+        self.now = 1_000_000.0
+        self.scheduler = RecrawlScheduler(":memory:", initial_interval=DAY, min_interval=HOUR,
+                                          max_interval=4 * DAY, backoff=2, clock=lambda: self.now)
+
+    def tearDown(self):
+        self.scheduler.close()
+
+    def test_adaptive_intervals(self):
+        """Test that unchanged pages back off and changed pages are revisited sooner."""
+        url = "https://acme.com/about"
+        self.assertTrue(self.scheduler.is_due(url))
+        self.assertTrue(self.scheduler.record_fetch(url, 'v1'))
+        self.assertFalse(self.scheduler.is_due(url))
+
+        self.now += DAY
+        self.assertTrue(self.scheduler.is_due(url))
+        self.assertFalse(self.scheduler.record_fetch(url, 'v1'))
+        self.assertEqual(self.scheduler.page_state(url)['interval'], 2 * DAY)
+
+        # Growth is capped at max_interval
+        self.scheduler.record_fetch(url, 'v1')
+        self.scheduler.record_fetch(url, 'v1')
+        self.assertEqual(self.scheduler.page_state(url)['interval'], 4 * DAY)
+
+        self.assertTrue(self.scheduler.record_fetch(url, 'v2'))
+        state = self.scheduler.page_state(url)
+        self.assertEqual(state['interval'], 2 * DAY)
+        self.assertEqual(state['change_count'], 1)
+        self.assertEqual(state['fetch_count'], 5)
+
+    def test_plan_batch(self):
+        """Test that batches only include due pages."""
+        self.scheduler.record_fetch("https://a.com/", 'x')
+        self.scheduler.record_fetch("https://b.com/", 'x', fetched_at=self.now - 2 * DAY)
+        urls = ["https://a.com/", "https://b.com/", "https://new.com/"]
+        self.assertEqual(self.scheduler.plan_batch(urls), ["https://b.com/", "https://new.com/"])
+        self.assertEqual(self.scheduler.due_urls(), ["https://b.com/"])
+
+    def test_batch_uses_lead_store_for_fresh_sites(self):
+        """Test that scrape_batch skips fresh sites and serves them from the lead store."""
+        store = LeadStore(":memory:")
+        scraper = LeadScraper(respect_robots_txt=False, fast_start=True, recrawl_scheduler=self.scheduler,
+                              lead_store=store, resolver=DNSCache(resolve_func=lambda host: ['127.0.0.1']))
+        scraper.rate_limit = 0
+        page = FetchResult("https://acme.com/", 200, {}, PAGE.encode(), PAGE)
+
+        with patch.object(scraper.fetch_policy, 'fetch', return_value=page) as mock_fetch:
+            first = scraper.scrape_batch(["https://acme.com/"], max_pages=2)
+            self.assertEqual(mock_fetch.call_count, 2)
+            self.assertTrue(self.scheduler.page_state("https://acme.com/about"))
+
+            second = scraper.scrape_batch(["https://acme.com/"], max_pages=2)
+            self.assertEqual(mock_fetch.call_count, 2)
+
+        self.assertEqual(first["https://acme.com/"][0]['Email'], 'sales@acme.com')
+        self.assertEqual(second["https://acme.com/"][0]['Email'], 'sales@acme.com')
+        store.close()
+
+    def test_batch_plans_per_page(self):
+        """Test that a due linked page gets its site crawled, and skipped pages keep their stored leads."""
+        store = LeadStore(":memory:")
+        scraper = LeadScraper(respect_robots_txt=False, fast_start=True, recrawl_scheduler=self.scheduler,
+                              lead_store=store, resolver=DNSCache(resolve_func=lambda host: ['127.0.0.1']))
+        scraper.rate_limit = 0
+        pages = {"https://acme.com/": PAGE, "https://acme.com/about": ABOUT_PAGE}
+        fetched = []
+
+        def fetch(url, *args, **kwargs):
+            fetched.append(url)
+            return FetchResult(url, 200, {}, pages[url].encode(), pages[url])
+
+        def emails(result):
+            return sorted(lead['Email'] for lead in result["https://acme.com/"])
+
+        with patch.object(scraper.fetch_policy, 'fetch', side_effect=fetch):
+            scraper.scrape_batch(["https://acme.com/"], max_pages=2)
+            # The home page is refetched unchanged, so it backs off to a two-day interval
+            self.scheduler.record_fetch("https://acme.com/", self.scheduler.page_state("https://acme.com/")['content_hash'])
+
+            # Only the about page is due, but that is enough to crawl the site
+            self.now += DAY
+            fetched.clear()
+            scraper.scrape_batch(["https://acme.com/"], max_pages=2)
+            self.assertEqual(fetched, ["https://acme.com/", "https://acme.com/about"])
+
+            # Now only the home page is due, and its email has changed. The about
+            # page's lead comes from the store, but the home page's old lead doesn't
+            self.scheduler.record_fetch("https://acme.com/", 'changed', fetched_at=self.now - 2 * DAY)
+            pages["https://acme.com/"] = PAGE.replace('sales@acme.com', 'new@acme.com')
+            fetched.clear()
+            result = scraper.scrape_batch(["https://acme.com/"], max_pages=2)
+            self.assertEqual(fetched, ["https://acme.com/"])
+
+        self.assertEqual(emails(result), ['new@acme.com', 'team@acme.com'])
+        store.close()
+
+if __name__ == '__main__':
+    unittest.main()
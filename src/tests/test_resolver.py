@@ -0,0 +1,145 @@
+import sys
+import os
+import socket
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import urllib3
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from resolver import DNSCache, _system_resolve, resolving_session
+from scraper import LeadScraper
+
+class StubResolver:
+    """A resolver that answers from a fixed table and counts lookups."""
+
+    def __init__(self, table):
+        self.table = table
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, host):
+        with self.lock:
+            self.calls.append(host)
+        if host not in self.table:
+            raise OSError(f"Name or service not known: {host}")
+        return self.table[host]
+
+class TestDNSCache(unittest.TestCase):
+    """Test cases for the DNSCache class."""
+
+    def setUp(self):
+        self.now = 0.0
+        self.stub = StubResolver({'alive.com': ['93.184.216.34']})
+        self.cache = DNSCache(ttl=300, negative_ttl=60, resolve_func=self.stub, clock=lambda: self.now)
+
+    def tearDown(self):
+        self.cache.close()
+
+    def test_positive_and_negative_caching(self):
+        """Test that results, including failures, are cached until they expire."""
+        self.assertTrue(self.cache.is_resolvable('alive.com'))
+        self.assertFalse(self.cache.is_resolvable('dead.com'))
+        self.assertTrue(self.cache.is_resolvable('alive.com'))
+        self.assertFalse(self.cache.is_resolvable('dead.com'))
+        self.assertEqual(len(self.stub.calls), 2)
+
+        # Negative entries expire sooner than positive ones
+        self.now = 61
+        self.cache.resolve('alive.com')
+        self.cache.resolve('dead.com')
+        self.assertEqual(self.stub.calls.count('dead.com'), 2)
+        self.assertEqual(self.stub.calls.count('alive.com'), 1)
+
+    def test_system_resolve_keeps_preference_order(self):
+        """Test that the system resolver's address order is kept, without duplicates."""
+        infos = [(socket.AF_INET6, socket.SOCK_STREAM, 6, '', (address, 0)) for address in
+                 ['2001:db8::1', '93.184.216.34', '2001:db8::1', '10.0.0.1']]
+        with patch('socket.getaddrinfo', return_value=infos):
+            self.assertEqual(_system_resolve('alive.com'), ['2001:db8::1', '93.184.216.34', '10.0.0.1'])
+
+    def test_prefetch(self):
+        """Test that prefetched hosts are resolved once in the background."""
+        self.cache.prefetch(['alive.com', 'dead.com', 'alive.com', None])
+        self.assertEqual(self.cache.resolve('alive.com'), ['93.184.216.34'])
+        self.assertEqual(self.cache.resolve('dead.com'), [])
+        self.assertEqual(sorted(self.stub.calls), ['alive.com', 'dead.com'])
+
+    def test_batch_drops_unresolvable_hosts(self):
+        """Test that scrape_batch never fetches hosts that don't resolve."""
+        scraper = LeadScraper(respect_robots_txt=False, resolver=self.cache)
+        with patch('fetch_policy.requests.get') as mock_get:
+            results = scraper.scrape_batch(["https://dead.com/", "https://also-dead.com/"])
+
+        mock_get.assert_not_called()
+        self.assertIn('Could not resolve', results["https://dead.com/"]['error'])
+        self.assertIn('Could not resolve', results["https://also-dead.com/"]['error'])
+
+class HostEchoHandler(BaseHTTPRequestHandler):
+    """Answers every request with the Host header it received."""
+
+    def do_GET(self):
+        body = self.headers['Host'].encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class TestResolvingSession(unittest.TestCase):
+    """Test cases for sessions that connect through a DNSCache."""
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), HostEchoHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.port = self.server.server_address[1]
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_connects_to_cached_address(self):
+        """Test that requests use the cached addresses, trying each in turn."""
+        # Nothing listens on 127.0.0.2, and the system resolver doesn't know the host
+        stub = StubResolver({'fixture.test': ['127.0.0.2', '127.0.0.1']})
+        cache = DNSCache(resolve_func=stub)
+        session = resolving_session(cache)
+        try:
+            url = f'http://fixture.test:{self.port}/'
+            self.assertEqual(session.get(url, timeout=5).text, f'fixture.test:{self.port}')
+            self.assertEqual(session.get(url, timeout=5).status_code, 200)
+        finally:
+            session.close()
+            cache.close()
+        self.assertEqual(stub.calls, ['fixture.test'])
+
+    def test_tries_next_address_after_connect_timeout(self):
+        """Test that an address whose connection times out is skipped for the next one."""
+        create_connection = urllib3.util.connection.create_connection
+        attempts = []
+
+        def connect(address, *args, **kwargs):
+            attempts.append(address[0])
+            if address[0] == '127.0.0.2':
+                raise socket.timeout("timed out")
+            return create_connection(address, *args, **kwargs)
+
+        cache = DNSCache(resolve_func=StubResolver({'fixture.test': ['127.0.0.2', '127.0.0.1']}))
+        session = resolving_session(cache)
+        try:
+            with patch('urllib3.connection.connection.create_connection', side_effect=connect):
+                response = session.get(f'http://fixture.test:{self.port}/', timeout=5)
+        finally:
+            session.close()
+            cache.close()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(attempts, ['127.0.0.2', '127.0.0.1'])
+
+if __name__ == '__main__':
+    unittest.main()
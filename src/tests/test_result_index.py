@@ -0,0 +1,45 @@
+import sys
+import os
+import unittest
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from result_index import ResultIndex, tokenize
+
+LEADS = [
+    {'Company Name': 'Acme Corp', 'Email': 'sales@acme.com', 'Location': 'Austin'},
+    {'Company Name': 'Globex', 'Email': '', 'Location': 'Boston'},
+    {'Company Name': 'acme labs', 'Email': 'info@acmelabs.io', 'Location': ''},
+]
+
+class TestResultIndex(unittest.TestCase):
+    """Test cases for the ResultIndex class."""
+
+    def setUp(self):
+        self.index = ResultIndex(LEADS)
+
+    def test_tokenize(self):
+        """Test that text is split into lowercase alphanumeric tokens."""
+        self.assertEqual(tokenize("Sales@Acme.com"), ['sales', 'acme', 'com'])
+        self.assertEqual(tokenize(42), ['42'])
+
+    def test_search(self):
+        """Test prefix matching, multi-term queries and the punctuation fallback."""
+        self.assertEqual(self.index.search(""), [0, 1, 2])
+        self.assertEqual(self.index.search("ACME"), [0, 2])
+        self.assertEqual(self.index.search("acme sal"), [0])
+        self.assertEqual(self.index.search("bos"), [1])
+        self.assertEqual(self.index.search("acme boston"), [])
+        self.assertEqual(self.index.search("zzz"), [])
+        self.assertEqual(self.index.search("@"), [0, 2])
+
+    def test_sort(self):
+        """Test that sorting is case-insensitive and keeps empty values last."""
+        self.assertEqual(self.index.query(sort_by='Company Name'), [0, 2, 1])
+        self.assertEqual(self.index.query(sort_by='Company Name', descending=True), [1, 2, 0])
+        self.assertEqual(self.index.query(sort_by='Email', descending=True), [0, 2, 1])
+        self.assertEqual(self.index.query("acme", sort_by='Location'), [0, 2])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import sys
+import os
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from scheduler import CrawlScheduler
+from fetch_policy import FetchResult
+from scraper import LeadScraper
+
+class TestCrawlScheduler(unittest.TestCase):
+    """Test cases for the CrawlScheduler class."""
+
+    def _contend(self, scheduler, requests):
+        """Queue requests behind a held slot, then record the order they are granted in."""
+        blocker = scheduler.acquire('blocker', 'blocker.com')
+        order = []
+
+        def fetch(job_id, host):
+            lease = scheduler.acquire(job_id, host)
+            order.append(job_id)
+            scheduler.release(lease)
+
+        threads = []
+        for job_id, host in requests:
+            thread = threading.Thread(target=fetch, args=(job_id, host))
+            thread.start()
+            threads.append(thread)
+            # Make sure requests are queued in the listed order
+            while scheduler.stats()['waiting'] < len(threads):
+                time.sleep(0.001)
+        scheduler.release(blocker)
+        for thread in threads:
+            thread.join(5)
+        return order
+
+    def test_interactive_jobs_go_first(self):
+        """Test that interactive requests are granted ahead of queued batch requests."""
+        scheduler = CrawlScheduler(max_concurrent=1, politeness=0)
+        scheduler.register('ui', interactive=True)
+        order = self._contend(scheduler, [('batch', 'a.com'), ('batch', 'b.com'), ('ui', 'c.com')])
+        self.assertEqual(order, ['ui', 'batch', 'batch'])
+
+    def test_weighted_fair_queuing(self):
+        """Test that a job queued first can't starve another, and weights set the share."""
+        scheduler = CrawlScheduler(max_concurrent=1, politeness=0)
+        scheduler.register('big', weight=1)
+        scheduler.register('heavy', weight=4)
+        order = self._contend(scheduler, [('big', f'{i}.big.com') for i in range(4)]
+                              + [('heavy', f'{i}.heavy.com') for i in range(4)])
+        # 'heavy' was queued last but gets four turns per turn of 'big'
+        self.assertEqual(order, ['heavy', 'heavy', 'heavy', 'big', 'heavy', 'big', 'big', 'big'])
+        self.assertEqual(scheduler.stats()['granted']['heavy'], 4)
+
+    def test_politeness_across_jobs(self):
+        """Test that two jobs fetching the same host are spaced apart."""
+        scheduler = CrawlScheduler(max_concurrent=4, politeness=0.1)
+        scheduler.release(scheduler.acquire('a', 'shared.com'))
+        start = time.monotonic()
+        scheduler.release(scheduler.acquire('b', 'shared.com'))
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+        # Other hosts aren't held up
+        start = time.monotonic()
+        scheduler.release(scheduler.acquire('b', 'other.com'))
+        self.assertLess(time.monotonic() - start, 0.05)
+
+    def test_scraper_uses_scheduler(self):
+        """Test that scrapers with a scheduler skip their own sleep and go through it."""
+        scheduler = CrawlScheduler(politeness=0)
+        scraper = LeadScraper(respect_robots_txt=False, fast_start=True, scheduler=scheduler, job_id='job')
+        page = FetchResult("https://acme.com/", 200, {}, b"<h1>Acme</h1>", "<h1>Acme</h1>")
+        with patch.object(scraper.fetch_policy, 'fetch', return_value=page), patch('scraper.time.sleep') as mock_sleep:
+            scraper.scrape_website("https://acme.com/")
+        mock_sleep.assert_not_called()
+        self.assertEqual(scheduler.stats(), {'in_flight': 0, 'waiting': 0, 'granted': {'job': 1}})
+
+if __name__ == '__main__':
+    unittest.main()
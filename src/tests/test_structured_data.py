@@ -0,0 +1,79 @@
+import sys
+import os
+import unittest
+from unittest.mock import patch
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from bs4 import BeautifulSoup
+from structured_data import extract_structured_data
+from scraper import LeadScraper
+
+JSON_LD_PAGE = """<html><head>
+<script type="application/ld+json">
+{"@context": "https://schema.org", "@graph": [
+  {"@type": "Organization", "name": "Acme Corp", "description": "Widgets for everyone",
+   "address": {"@type": "PostalAddress", "streetAddress": "1 Main St", "addressLocality": "Austin",
+               "addressCountry": {"@type": "Country", "name": "US"}},
+   "contactPoint": {"@type": "ContactPoint", "email": "mailto:sales@acme.com", "telephone": "+1-512-555-0100"},
+   "employee": [{"@type": "Person", "name": "Jane Doe", "jobTitle": "CEO"}]}
+]}
+</script>
+<script type="application/ld+json">{not json</script>
+</head><body><h1>Welcome</h1><p>noreply@acme.com 999-999-9999</p></body></html>"""
+
+MICRODATA_PAGE = """<html><body>
+<div itemscope itemtype="https://schema.org/LocalBusiness">
+  <span itemprop="name">Globex Bakery</span>
+  <div itemprop="address" itemscope itemtype="https://schema.org/PostalAddress">
+    <span itemprop="streetAddress">5 Oak Ave</span>, <span itemprop="addressLocality">Boston</span>
+  </div>
+  <div itemprop="employee" itemscope itemtype="https://schema.org/Person">
+    <span itemprop="name">John Roe</span> <span itemprop="jobTitle">Owner</span>
+  </div>
+</div>
+<a href="mailto:noreply@globex.com">x</a>
+<a href="mailto:Hello%40globex.com?subject=Hi">Email us</a>
+<a href="tel:+1%20617%20555%200199">Call</a>
+</body></html>"""
+
+class TestStructuredData(unittest.TestCase):
+    """Test cases for structured data extraction."""
+
+    def test_json_ld(self):
+        """Test that JSON-LD organizations, people, addresses and contact points are read."""
+        fields = extract_structured_data(BeautifulSoup(JSON_LD_PAGE, 'html.parser'))
+        self.assertEqual(fields, {
+            'Company Name': 'Acme Corp',
+            'Description': 'Widgets for everyone',
+            'Location': '1 Main St, Austin, US',
+            'Email': 'sales@acme.com',
+            'Phone': '+1-512-555-0100',
+            'Contact Name': 'Jane Doe',
+            'Job Title': 'CEO',
+        })
+
+    def test_microdata_and_links(self):
+        """Test that microdata items and mailto:/tel: links are read."""
+        fields = extract_structured_data(BeautifulSoup(MICRODATA_PAGE, 'html.parser'))
+        self.assertEqual(fields['Company Name'], 'Globex Bakery')
+        self.assertEqual(fields['Location'], '5 Oak Ave, Boston')
+        self.assertEqual(fields['Contact Name'], 'John Roe')
+        self.assertEqual(fields['Job Title'], 'Owner')
+        self.assertEqual(fields['Email'], 'Hello@globex.com')
+        self.assertEqual(fields['Phone'], '+1 617 555 0199')
+
+    def test_scraper_skips_heuristics(self):
+        """Test that structured values win and the regex passes are skipped."""
+        scraper = LeadScraper(fast_start=True)
+        with patch('scraper.re.findall') as mock_findall:
+            leads, _ = scraper._process_page(JSON_LD_PAGE, "https://acme.com/")
+        mock_findall.assert_not_called()
+        self.assertEqual(leads[0]['Company Name'], 'Acme Corp')
+        self.assertEqual(leads[0]['Email'], 'sales@acme.com')
+        self.assertEqual(leads[0]['Job Title'], 'CEO')
+        self.assertEqual(leads[0]['Website'], "https://acme.com/")
+
+if __name__ == '__main__':
+    unittest.main()
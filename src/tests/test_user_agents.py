@@ -0,0 +1,67 @@
+import sys
+import os
+import subprocess
+import unittest
+from unittest.mock import patch
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from user_agents import UserAgentPool, USER_AGENTS
+from scraper import LeadScraper
+from fetch_policy import ResponseRejected
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+class TestUserAgentPool(unittest.TestCase):
+    """Test cases for the bundled user agent pool and fast-start mode."""
+
+    def test_random_and_rotate(self):
+        """Test that the pool hands out bundled user agents."""
+        pool = UserAgentPool(seed=1)
+        self.assertIn(pool.random, USER_AGENTS)
+
+        rotated = [pool.rotate() for _ in range(len(USER_AGENTS))]
+        self.assertEqual(sorted(rotated), sorted(USER_AGENTS))
+
+        with self.assertRaises(ValueError):
+            UserAgentPool(user_agents=())
+
+    def test_fast_start_scraper(self):
+        """Test that fast-start mode uses the bundled pool."""
+        scraper = LeadScraper(fast_start=True)
+        self.assertIsInstance(scraper.user_agent, UserAgentPool)
+        self.assertIn(scraper.headers['User-Agent'], USER_AGENTS)
+
+    def test_scraper_rotates_across_hosts(self):
+        """Test that each host gets the next user agent and keeps it."""
+        scraper = LeadScraper(fast_start=True)
+        seen = []
+
+        def fetch(url, headers, *args, **kwargs):
+            seen.append(headers['User-Agent'])
+            raise ResponseRejected("not needed")
+
+        scraper.rate_limit = 0
+        scraper.respect_robots_txt = False
+        with patch.object(scraper.fetch_policy, 'fetch', side_effect=fetch):
+            for url in ('https://a.com/', 'https://b.com/', 'https://a.com/contact', 'https://c.com/'):
+                scraper.scrape_website(url)
+
+        self.assertEqual(seen[0], seen[2])
+        self.assertEqual(len({seen[0], seen[1], seen[3]}), 3)
+        self.assertTrue(set(seen) <= set(USER_AGENTS))
+
+    def test_heavy_modules_not_imported(self):
+        """Test that importing the scraper doesn't load pandas, bs4 or fake_useragent."""
+        code = (
+            "import sys, scraper; scraper.LeadScraper(fast_start=True); "
+            "print(','.join(m for m in ('pandas', 'bs4', 'fake_useragent') if m in sys.modules))"
+        )
+        output = subprocess.run(
+            [sys.executable, '-c', code], cwd=SRC_DIR, check=True, capture_output=True, text=True
+        ).stdout
+        self.assertEqual(output.strip(), '')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import random
+import threading
+
+# Desktop browser user agents bundled with the tool so that no network access
+# or data files are needed at startup. Refresh occasionally as browsers update.
+USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/123.0.0.0 Safari/537.36 Edg/123.0.2420.81",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:125.0) Gecko/20100101 Firefox/125.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) "
+    "Version/17.4.1 Safari/605.1.15",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 14.4; rv:125.0) Gecko/20100101 Firefox/125.0",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:125.0) Gecko/20100101 Firefox/125.0",
+)
+
+
+class UserAgentPool:
+    """A local, rotating pool of user agent strings.
+
+    Offers the same `random` attribute as `fake_useragent.UserAgent`, so it
+    can be used as a drop-in replacement when startup time matters.
+    """
+
+    def __init__(self, user_agents=USER_AGENTS, seed=None):
+        """
+        Initialize the pool.
+
+        Args:
+            user_agents (tuple): User agent strings to rotate through
+            seed (int): Optional seed for reproducible selection
+        """
+        if not user_agents:
+            raise ValueError("user_agents must not be empty")
+        self.user_agents = tuple(user_agents)
+        self._random = random.Random(seed)
+        self._index = self._random.randrange(len(self.user_agents))
+        self._lock = threading.Lock()
+
+    @property
+    def random(self):
+        """A randomly chosen user agent."""
+        with self._lock:
+            return self._random.choice(self.user_agents)
+
+    def rotate(self):
+        """
+        Return the next user agent in round-robin order.
+
+        Returns:
+            str: User agent string
+        """
+        with self._lock:
+            self._index = (self._index + 1) % len(self.user_agents)
+            return self.user_agents[self._index]